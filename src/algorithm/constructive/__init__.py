@@ -3,4 +3,9 @@
 from .constructive import Constructive
 from .postmodel import PostModel
 from .premodel import PreModel
-from .linmodel import LinModel
\ No newline at end of file
+from .linmodel import LinModel
+from .backend import Backend, CBC, HiGHS
+from .portfolio import Portfolio
+from .convergence import Convergence
+from .replan import Delta, Replanner
+from .bound import LowerBound
\ No newline at end of file
@@ -0,0 +1,322 @@
+from mip import Model, LinExpr, OptimizationStatus, MAXIMIZE, INF
+from contextlib import contextmanager
+from typing import List, Tuple, Optional, Iterator
+import numpy as np
+import sys
+import os
+
+# type alias for the sparse arrays of a linear model: objective coefficients
+# and constant, inequality rows (<=), equality rows and variable bounds
+Program = Tuple[
+    np.ndarray, float, Tuple[np.ndarray, np.ndarray, np.ndarray], np.ndarray,
+    Tuple[np.ndarray, np.ndarray, np.ndarray], np.ndarray,
+    List[Tuple[Optional[float], Optional[float]]]
+]
+
+
+class Backend:
+    """This class represents the solver backend of a Linear Model, i.e. the
+    procedure that optimizes the model built with the Python-MIP package and
+    returns the values of its variables.
+    """
+
+    def __init__(self: 'Backend', name: str):
+        """Instantiates a new Backend.
+
+        Args:
+            name (str): The name of the backend.
+        """
+
+        self._name: str = name
+
+        # solver controls, whose zero values keep the defaults of the solver
+        self._threads: int = 0
+        self._time_limit: float = 0.0
+        self._gap: float = 1e-4
+        self._emphasis: int = 0
+        self._verbose: bool = False
+
+        # status of the last optimization
+        self._status: str = ''
+
+    def solve(self: 'Backend', model: Model) -> Tuple[Optional[float], List[float]]:
+        """This method optimizes the model.
+
+        Args:
+            model (Model): The model to be optimized.
+
+        Returns:
+            Tuple[Optional[float], List[float]]: The objective value and the
+                value of each variable, by its index in the model, or None
+                and an empty list if no solution was found.
+        """
+
+        raise NotImplementedError
+
+    def export(self: 'Backend', model: Model) -> Program:
+        """This method exports the model as sparse arrays, in the form
+        min c x + c_0, subject to A_ub x <= b_ub, A_eq x == b_eq and the
+        variable bounds. The rows are given in coordinate format, i.e. as the
+        row indexes, the column indexes and the coefficients.
+
+        Args:
+            model (Model): The model to be exported.
+
+        Returns:
+            Program: The objective coefficients, the objective constant, the
+                inequality rows and their right-hand side, the equality rows
+                and their right-hand side and the bounds of each variable.
+        """
+
+        sign: float = -1.0 if model.sense == MAXIMIZE else 1.0
+
+        objective: LinExpr = model.objective
+        c: np.ndarray = np.zeros(model.num_cols)
+        for var, coef in objective.expr.items(): c[var.idx] += sign * coef
+
+        # each row is stored as expr + const (sense) 0, i.e. expr (sense) -const
+        rows: List[List[List[float]]] = [[[], [], []], [[], [], []]]
+        rhs: List[List[float]] = [[], []]
+
+        for constr in model.constrs:
+            expr: LinExpr = constr.expr
+            kind: int = 1 if expr.sense == '=' else 0
+            factor: float = -1.0 if expr.sense == '>' else 1.0
+
+            for var, coef in expr.expr.items():
+                rows[kind][0].append(len(rhs[kind]))
+                rows[kind][1].append(var.idx)
+                rows[kind][2].append(factor * coef)
+
+            rhs[kind].append(-factor * expr.const)
+
+        bounds: List[Tuple[Optional[float], Optional[float]]] = [
+            (var.lb if var.lb > -INF else None, var.ub if var.ub < INF else None)
+            for var in model.vars
+        ]
+
+        return (
+            c, sign * objective.const,
+            tuple(np.array(values) for values in rows[0]), np.array(rhs[0]),
+            tuple(np.array(values) for values in rows[1]), np.array(rhs[1]),
+            bounds
+        )
+
+    # region simple getters and setters
+    @property
+    def name(self: 'Backend') -> str:
+        """str: The name of the backend."""
+        return self._name
+
+    @name.setter
+    def name(self: 'Backend', value: str) -> None:
+        self._name = value
+
+    @property
+    def threads(self: 'Backend') -> int:
+        """int: The number of solver threads, 0 for the solver default or 
+        -1 for all the cores."""
+        return self._threads
+
+    @threads.setter
+    def threads(self: 'Backend', value: int) -> None:
+        self._threads = value
+
+    @property
+    def time_limit(self: 'Backend') -> float:
+        """float: The maximum time, in seconds, of each optimization or 0 
+        if there is no time limit."""
+        return self._time_limit
+
+    @time_limit.setter
+    def time_limit(self: 'Backend', value: float) -> None:
+        self._time_limit = value
+
+    @property
+    def gap(self: 'Backend') -> float:
+        """float: The relative gap in which the optimization stops."""
+        return self._gap
+
+    @gap.setter
+    def gap(self: 'Backend', value: float) -> None:
+        self._gap = value
+
+    @property
+    def emphasis(self: 'Backend') -> int:
+        """int: The search emphasis, 0 for the default, 1 for feasibility or 
+        2 for optimality."""
+        return self._emphasis
+
+    @emphasis.setter
+    def emphasis(self: 'Backend', value: int) -> None:
+        self._emphasis = value
+
+    @property
+    def verbose(self: 'Backend') -> bool:
+        """bool: True if the solver log is printed, False otherwise."""
+        return self._verbose
+
+    @verbose.setter
+    def verbose(self: 'Backend', value: bool) -> None:
+        self._verbose = value
+
+    @property
+    def status(self: 'Backend') -> str:
+        """str: The status of the last optimization, e.g. 'optimal' or 
+        'infeasible', or '' if there was none."""
+        return self._status
+
+    @status.setter
+    def status(self: 'Backend', value: str) -> None:
+        self._status = value
+
+
+class CBC(Backend):
+    """This class is the default backend, which optimizes the model with the
+    solver of the Python-MIP package (CBC, unless another one is installed).
+    """
+
+    def __init__(self: 'CBC'):
+        """Instantiates a new CBC backend."""
+
+        super().__init__('CBC')
+
+    def solve(self: 'CBC', model: Model) -> Tuple[Optional[float], List[float]]:
+        """This method optimizes the model.
+
+        Args:
+            model (Model): The model to be optimized.
+
+        Returns:
+            Tuple[Optional[float], List[float]]: The objective value and the
+                value of each variable, by its index in the model, or None
+                and an empty list if no solution was found.
+        """
+
+        model.threads = self._threads
+        model.max_mip_gap = self._gap
+        model.emphasis = self._emphasis
+        model.verbose = int(self._verbose)
+
+        with silenced(not self._verbose):
+            status: OptimizationStatus = model.optimize(
+                max_seconds=self._time_limit if self._time_limit > 0 else INF
+            )
+
+        self._status = status.name.lower()
+        if model.num_solutions == 0: return None, []
+
+        return model.objective_value, [var.x for var in model.vars]
+
+
+# the status of each linprog exit code
+HIGHS_STATUS: List[str] = [
+    'optimal', 'limit_reached', 'infeasible', 'unbounded', 'numerical_error'
+]
+
+class HiGHS(Backend):
+    """This class is a backend that exports the model as sparse arrays and
+    solves it with the HiGHS solvers of SciPy, either with the dual simplex
+    or with the interior point method. It only solves continuous models,
+    which is the case of the Ore Mixing Problem.
+
+    The relative gap and the emphasis only apply to integer models and the
+    number of threads is not exposed by SciPy, so they are ignored.
+
+    To instantiate this class, you must install the SciPy package (1.6 or
+    newer), which bundles the HiGHS solvers:
+
+        $ pip install scipy
+    """
+
+    def __init__(self: 'HiGHS', method: str = 'highs'):
+        """Instantiates a new HiGHS backend.
+
+        Args:
+            method (str): The SciPy method, 'highs-ds' for the dual simplex,
+                'highs-ipm' for the interior point or 'highs' to let HiGHS
+                choose. Defaults to 'highs'.
+        """
+
+        super().__init__('HiGHS')
+
+        self.__method: str = method
+
+    def solve(self: 'HiGHS', model: Model) -> Tuple[Optional[float], List[float]]:
+        """This method optimizes the model.
+
+        Args:
+            model (Model): The model to be optimized.
+
+        Returns:
+            Tuple[Optional[float], List[float]]: The objective value and the
+                value of each variable, by its index in the model, or None
+                and an empty list if no solution was found.
+        """
+
+        # SciPy is only required by this backend
+        from scipy.optimize import linprog
+        from scipy.sparse import csr_matrix
+
+        c, c_0, a_ub, b_ub, a_eq, b_eq, bounds = self.export(model)
+
+        result = linprog(
+            c,
+            A_ub=csr_matrix((a_ub[2], (a_ub[0], a_ub[1])),
+                            shape=(len(b_ub), len(c))) if len(b_ub) else None,
+            b_ub=b_ub if len(b_ub) else None,
+            A_eq=csr_matrix((a_eq[2], (a_eq[0], a_eq[1])),
+                            shape=(len(b_eq), len(c))) if len(b_eq) else None,
+            b_eq=b_eq if len(b_eq) else None,
+            bounds=bounds,
+            method=self.__method,
+            options={
+                'disp': self._verbose,
+                **({'time_limit': self._time_limit} 
+                   if self._time_limit > 0 else {})
+            }
+        )
+
+        self._status = HIGHS_STATUS[result.status]
+        if result.status != 0: return None, []
+
+        sign: float = -1.0 if model.sense == MAXIMIZE else 1.0
+        return sign * (result.fun + c_0), result.x.tolist()
+
+    # region simple getters and setters
+    @property
+    def method(self: 'HiGHS') -> str:
+        """str: The SciPy method."""
+        return self.__method
+
+    @method.setter
+    def method(self: 'HiGHS', value: str) -> None:
+        self.__method = value
+
+
+@contextmanager
+def silenced(active: bool = True) -> Iterator[None]:
+    """This function silences the standard output of the process while the
+    context is active, including the output written by the solver libraries,
+    which bypass sys.stdout.
+
+    Args:
+        active (bool): False to keep the output. Defaults to True.
+    """
+    if not active:
+        yield
+        return
+
+    sys.stdout.flush()
+    stdout: int = os.dup(1)
+    devnull: int = os.open(os.devnull, os.O_WRONLY)
+
+    try:
+        os.dup2(devnull, 1)
+        yield
+
+    finally:
+        sys.stdout.flush()
+        os.dup2(stdout, 1)
+        os.close(devnull)
+        os.close(stdout)
@@ -0,0 +1,215 @@
+from config import Travels
+from model.classes import Engine, Stockpile
+from model.problem import Problem
+from .constructive import Constructive
+from typing import List, Dict, Set, FrozenSet, Tuple, Optional
+
+
+class LowerBound:
+    """This class represents a Lower Bound of the makespan of the schedule
+    built by the constructive for its output_id, i.e. of the cost of any
+    routes of the engines, given the weights of the linear model resolution.
+    It is the largest of the following bounds:
+
+        - workload bounds, in which the ore reclaimed from a group of
+          stockpiles is divided among the engines that can reach them as if
+          it could be split freely, each engine starting after its shortest
+          travel to one of them. The groups are all the stockpiles, the
+          stockpiles of each yard, of each pair of yards and of each rail;
+        - travel workload bounds, in which each stockpile of a group is
+          reclaimed by the engine that would finish it first and the total
+          time, travels included, is divided among the engines of the group;
+        - travel bounds, in which each stockpile is reclaimed by the engine
+          that would finish it first, travelling from its position.
+
+    As in the constructive, an engine only reaches the stockpiles on its
+    rail, every job of a route is reached from the position of the engine at
+    the beginning of the output and the stacking jobs are left out, since
+    they may be scheduled after the reclaims.
+    """
+
+    def __init__(self: 'LowerBound', problem: Problem, constructive: Constructive):
+        """Instantiates a new LowerBound.
+
+        Args:
+            problem (Problem): The problem reference.
+            constructive (Constructive): The constructive whose weights,
+                positions and travel times define the schedule.
+        """
+
+        self._problem: Problem = problem
+        self._constructive: Constructive = constructive
+
+        # the rails of each group of stockpiles, which can only be reclaimed
+        # by the engines on them
+        yards: Set[FrozenSet[int]] = {
+            frozenset(stp.rails) for stp in problem.stockpiles
+        }
+
+        groups: Set[FrozenSet[int]] = {
+            frozenset([eng.rail]) for eng in problem.engines
+        }
+        groups |= yards
+        groups |= {first | second for first in yards for second in yards}
+        groups.add(frozenset(rail for group in yards for rail in group))
+
+        self._groups: List[FrozenSet[int]] = sorted(groups, key=sorted)
+
+    def compute(self: 'LowerBound') -> float:
+        """This method computes the lower bound of the makespan for the
+        output_id of the constructive and its current weights.
+
+        Returns:
+            float: The lower bound, in the time representation of the
+                solution, or 0 if there is nothing to reclaim.
+        """
+
+        k: int = self._constructive.output_id
+        weights: List[float] = self._constructive.weights[k]
+
+        positions: List[int] = self._constructive.positions[k] \
+            if k < len(self._constructive.positions) \
+            else [eng.pos_ini for eng in self._problem.engines]
+
+        # the durations in the time representation of the solution
+        scale: int = self._constructive.solution.time_scale
+        travel: Travels = self._constructive.time_travel
+
+        jobs: List[int] = [i for i, weight in enumerate(weights) if weight > 0]
+        if not jobs: return 0.0
+
+        # the earliest time each stockpile can be reclaimed by a single job, 
+        # whose duration is rounded as in the constructive
+        finish: Dict[int, float] = {}
+        for i in jobs:
+            stp: Stockpile = self._problem.stockpiles[i]
+
+            times: List[float] = [
+                travel[pos][i] 
+                + self._constructive.to_time(weights[i] / eng.speed_reclaim)
+                for eng, pos in zip(self._problem.engines, positions)
+                if eng.speed_reclaim > 0 and eng.rail in stp.rails
+            ]
+
+            finish[i] = min(times) if times else 0.0
+
+        bound: float = 0.0
+
+        for group in self._groups:
+            stockpiles: List[int] = [
+                i for i in jobs
+                if set(self._problem.stockpiles[i].rails) <= group
+            ]
+
+            if not stockpiles: continue
+
+            # the earliest time each engine of the group can start reclaiming
+            engines: List[Tuple[float, float]] = []
+            for eng, pos in zip(self._problem.engines, positions):
+                start: Optional[float] = self.__start(
+                    eng, pos, stockpiles, travel
+                ) if eng.rail in group else None
+
+                if start is not None:
+                    engines.append((start, eng.speed_reclaim / scale))
+
+            # each duration of the constructive may be rounded down by half 
+            # of its last digit
+            work: float = sum(weights[i] for i in stockpiles)
+            bound = max(
+                bound, fill(engines, work) - 0.005 * scale * len(stockpiles)
+            )
+
+            if engines: bound = max(
+                bound, sum(finish[i] for i in stockpiles) / len(engines)
+            )
+
+        return max([bound] + [finish[i] for i in jobs])
+
+    def __start(
+        self: 'LowerBound',
+        eng: Engine,
+        pos: int,
+        stockpiles: List[int],
+        travel: Travels
+    ) -> Optional[float]:
+        """This method finds the earliest time an engine can start reclaiming
+        one of the given stockpiles.
+
+        Args:
+            eng (Engine): The engine reference.
+            pos (int): The position of the engine.
+            stockpiles (List[int]): The indexes of the stockpiles.
+            travel (List[List[float]]): The travel times.
+
+        Returns:
+            Optional[float]: The shortest travel time to a stockpile on the
+                rail of the engine or None if it reclaims none of them.
+        """
+
+        if eng.speed_reclaim <= 0: return None
+
+        times: List[float] = [
+            travel[pos][i] for i in stockpiles
+            if eng.rail in self._problem.stockpiles[i].rails
+        ]
+
+        return min(times) if times else None
+
+    # region simple getters and setters
+    @property
+    def problem(self: 'LowerBound') -> Problem:
+        """Problem: The problem reference."""
+        return self._problem
+
+    @problem.setter
+    def problem(self: 'LowerBound', value: Problem) -> None:
+        self._problem = value
+
+    @property
+    def constructive(self: 'LowerBound') -> Constructive:
+        """Constructive: The constructive whose schedule is bounded."""
+        return self._constructive
+
+    @constructive.setter
+    def constructive(self: 'LowerBound', value: Constructive) -> None:
+        self._constructive = value
+
+    @property
+    def groups(self: 'LowerBound') -> List[FrozenSet[int]]:
+        """List[FrozenSet[int]]: The rails of each group of stockpiles of the
+        workload bounds."""
+        return self._groups
+
+
+def fill(engines: List[Tuple[float, float]], work: float) -> float:
+    """This function finds the earliest time in which the engines complete
+    the work, as if it could be split freely among them, i.e. the time C in
+    which the sum of speed * (C - start) over the started engines is the
+    work.
+
+    Args:
+        engines (List[Tuple[float, float]]): The time each engine can start
+            and its speed.
+        work (float): The work to be completed.
+
+    Returns:
+        float: The completion time or 0 if there is no work or no engine to 
+            complete it.
+    """
+    if work <= 0 or not engines: return 0.0
+
+    engines = sorted(engines)
+
+    time: float = engines[0][0]
+    speed: float = 0.0
+    done: float = 0.0
+
+    for start, rate in engines:
+        if speed > 0 and done + speed * (start - time) >= work: break
+
+        done += speed * (start - time)
+        time = start
+        speed += rate
+
+    return time + (work - done) / speed
@@ -1,8 +1,8 @@
-from config import Route
+from config import Route, Travels, Jobs
 from model.classes import Engine
 from model.problem import Problem
 from model.solution import Solution
-from typing import List, Optional
+from typing import List, Tuple, Optional, Union
 
 
 class Constructive:
@@ -33,6 +33,22 @@ class Constructive:
             sum(inp) for inp in list(solution.inputs.values())
         ]
 
+        # travel times in the time representation of the solution
+        self._fixed_point: bool = solution.fixed_point
+        self._time_travel: Travels = [
+            [round(time * 100) for time in line] 
+            for line in problem.time_travel
+        ] if self._fixed_point else problem.time_travel
+
+        # the position of each engine when each output request begins, so 
+        # that a route is always evaluated from the same positions
+        self._pos_ini: List[int] = [eng.pos_ini for eng in problem.engines]
+        self._positions: List[List[int]] = []
+
+        # the number of jobs of each engine that precede its release and the 
+        # time from which the next ones start, if the routes are replanned
+        self._release: List[Tuple[int, Union[int, float]]] = []
+
     def run(self: 'Constructive', has_routes: bool = False) -> None:
         """Executes the Constructive for all output requests.
         
@@ -48,11 +64,29 @@ class Constructive:
 
         # the output_id must have already been specified for the defined route
         if has_routes:
+            if self._output_id < len(self._positions):
+                self.__set_positions(self._positions[self._output_id])
+
             self.build()
 
         else:
+            self.__set_positions(self._pos_ini)
+            self._positions = []
+            self._release = []
+
+            # the weights of the solution change with each linear model 
+            # resolution, e.g. in the feedback approach
+            self._weights = list(self._solution.weights.values())
+            self.reset_inputs()
+
+            # the routes are built again from scratch
+            for route in self._solution.routes: route.clear()
+
             for out in self._problem.outputs:
                 self._output_id = out.id - 1
+                self._positions.append(
+                    [eng.pos_ini for eng in self._problem.engines]
+                )
                 self.set_routes()
                 self.build()
 
@@ -82,57 +116,74 @@ class Constructive:
         # reset the solution to save new results
         self._solution.reset()
  
+        fixed_point: bool = self._fixed_point
+        start_time: List[Union[int, float]] = self._solution.start_time
+        stacks: Jobs = self._solution.stacks
+        reclaims: Jobs = self._solution.reclaims
+        weights: List[float] = self._weights[self._output_id]
+
         for eng, route, in zip(self._problem.engines, self._solution.routes):
-            for stp, atv in route:
-                
+
+            # the attributes of the engine are read once for its whole route
+            e: int = eng.id - 1
+            speed_reclaim: float = eng.speed_reclaim
+            speed_stack: float = eng.speed_stack
+            travels: List[Union[int, float]] = self._time_travel[eng.pos_ini]
+            count, release = self._release[e] if self._release else (0, 0)
+
+            for p, (stp, atv) in enumerate(route):
+
+                # the jobs after the release can not start before it
+                if p == count: start_time[e] = max(start_time[e], release)
+
                 # setup time, if there is more than one job in the same stockpile
-                setup_time: float = 0.0
+                setup_time: Union[int, float] = 0
 
                 # reclaimery time
-                duration: float = round(
-                    self._weights[self._output_id][stp] / eng.speed_reclaim, 2
-                ) if eng.speed_reclaim > 0 else 0
+                duration: Union[int, float] = self.to_time(
+                    weights[stp] / speed_reclaim
+                ) if speed_reclaim > 0 else 0
 
                 # travel time and setup to stockpile
-                time_travel: float = self._problem.time_travel[eng.pos_ini][stp]
+                time_travel: Union[int, float] = travels[stp]
 
                 # performs the stacking activity before performing the reclaiming
                 if atv == 's' or atv == 'b':
-                    self._solution.stacks.append({
+                    stacks.append({
                         'weight': round(self._inputs[stp], 1),
                         'stockpile': stp + 1,
-                        'engine': eng.id,
-                        'start_time': round(
-                            self._solution.start_time[eng.id - 1] + time_travel, 
-                            2
-                        ),
-                        'duration': round(
-                            self._inputs[stp] / eng.speed_stack, 2
+                        'engine': e + 1,
+                        'start_time': 
+                            start_time[e] + time_travel if fixed_point
+                            else round(start_time[e] + time_travel, 2),
+                        'duration': self.to_time(
+                            self._inputs[stp] / speed_stack
                         ),
                     })
 
                     # adds stacking time if there is any input
-                    self._solution.start_time[eng.id - 1] += \
-                        self._solution.stacks[-1]['duration']
-                    setup_time += self._problem.time_travel[stp][stp]
+                    start_time[e] += stacks[-1]['duration']
+                    setup_time += self._time_travel[stp][stp]
                     self._inputs[stp] = 0.0
 
                 # ore reclaim activity from the stockpile
                 if atv == 'r' or atv == 'b':
-                    self._solution.reclaims.append({
-                        'weight': round(self._weights[self._output_id][stp], 1),
+                    begin: Union[int, float] = \
+                        start_time[e] + time_travel + setup_time
+
+                    reclaims.append({
+                        'weight': round(weights[stp], 1),
                         'stockpile': stp + 1,
-                        'engine': eng.id,
-                        'start_time': round(
-                            self._solution.start_time[eng.id - 1] 
-                                + time_travel + setup_time, 
-                            2
-                        ),
+                        'engine': e + 1,
+                        'start_time': 
+                            begin if fixed_point else round(begin, 2),
                         'duration': duration,
                         'output': self._output_id + 1
                     })
 
-                self._solution.start_time[eng.id - 1] += duration + time_travel
+                start_time[e] += duration + time_travel
+
+            if count >= len(route): start_time[e] = max(start_time[e], release)
 
             # changes the starting position of the machine
             try:
@@ -145,6 +196,26 @@ class Constructive:
         # updates the cost
         self._solution.update_cost(self._output_id + 1)
 
+    def to_time(
+        self: 'Constructive', 
+        value: float, 
+        digits: int = 2
+    ) -> Union[int, float]:
+        """This method converts a duration to the time representation of the 
+        solution, i.e. integer hundredths in the fixed point mode or a float 
+        rounded to the given number of digits otherwise.
+
+        Args:
+            value (float): The duration to be converted.
+            digits (int): The number of decimal digits kept in the float 
+                representation. Defaults to 2.
+
+        Returns:
+            Union[int, float]: The converted duration.
+        """
+
+        return round(value * 100) if self._fixed_point else round(value, digits)
+
     def set_routes(self: 'Constructive') -> None:
         """This method defines the order of operation of all machines and save 
         the result in the routes attribute of the Solution class.
@@ -189,6 +260,18 @@ class Constructive:
 
         raise NotImplementedError
 
+    def __set_positions(self: 'Constructive', positions: List[int]) -> None:
+        """This method moves the engines back to the given positions, since 
+        build() leaves them at the end of their routes. It is called within 
+        run() and there is no need to use it afterwards.
+
+        Args:
+            positions (List[int]): The position of each engine.
+        """
+
+        for eng, pos in zip(self._problem.engines, positions):
+            eng.pos_ini = pos
+
     def reset_inputs(self: 'Constructive') -> None:
         """This method is called whenever the input list should be reset 
         (mainly to avoid the need of creating another object).
@@ -217,6 +300,46 @@ class Constructive:
     def solution(self: 'Constructive', value: Solution) -> None:
         self._solution = value
 
+    @property
+    def time_travel(self: 'Constructive') -> Travels:
+        """List[List[Union[int, float]]]: Matrix with the time needed to travel 
+        from one stockpile to another, in the time representation of the 
+        solution.
+        """
+        return self._time_travel
+
+    @time_travel.setter
+    def time_travel(self: 'Constructive', value: Travels) -> None:
+        self._time_travel = value
+
+    @property
+    def positions(self: 'Constructive') -> List[List[int]]:
+        """List[List[int]]: The position of each engine when each output 
+        request begins, in which the lines are the requests and the columns, 
+        the engines.
+        """
+        return self._positions
+
+    @positions.setter
+    def positions(self: 'Constructive', value: List[List[int]]) -> None:
+        self._positions = value
+
+    @property
+    def release(self: 'Constructive') -> List[Tuple[int, Union[int, float]]]:
+        """List[Tuple[int, Union[int, float]]]: The number of jobs of each 
+        engine that precede its release and the time, in the time 
+        representation of the solution, from which the next ones start, or an 
+        empty list if the engines are never released.
+        """
+        return self._release
+
+    @release.setter
+    def release(
+        self: 'Constructive', 
+        value: List[Tuple[int, Union[int, float]]]
+    ) -> None:
+        self._release = value
+
     @property
     def output_id(self: 'Constructive') -> Optional[int]:
         """Optional[int]: The output request identifier."""
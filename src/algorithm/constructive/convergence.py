@@ -0,0 +1,165 @@
+from config import Objective, Weights
+from model.solution import Solution
+from typing import FrozenSet, Set, Tuple
+
+# type alias for the key of a linear model result: its weights and inputs
+Key = Tuple[Tuple[float, ...], ...]
+
+
+class Convergence:
+    """This class represents the convergence criteria of the feedback approach,
+    which stops the interactions as soon as they are not expected to change
+    the solution anymore:
+
+        - 'support', when a resolution reclaims from and stacks on the same
+          stockpiles as the previous one;
+        - 'repeated', when a resolution returns weights already returned by a
+          previous one, which are kept in a memo of the past weights;
+        - 'patience', when the cost of the solution has not improved for the
+          given number of interactions.
+    """
+
+    def __init__(self: 'Convergence', patience: int, digits: int = 6):
+        """Instantiates a new Convergence.
+
+        Args:
+            patience (int): The number of interactions without improvement of
+                the solution cost before stopping.
+            digits (int): The decimal digits considered when comparing the
+                weights. Defaults to 6.
+        """
+
+        self._patience: int = patience
+        self._digits: int = digits
+
+        # the rounded weights and inputs of each past resolution
+        self._memo: Set[Key] = set()
+        self._support: FrozenSet[Tuple[str, str, int]] = frozenset()
+
+        self._best: float = float('inf')
+        self._stalled: int = 0
+
+        # the criterion that stopped the interactions or '' if none did
+        self._reason: str = ''
+
+    def start(self: 'Convergence', solution: Solution) -> None:
+        """This method records the resolution and the cost of the solution
+        from which the interactions start.
+
+        Args:
+            solution (Solution): The solution reference.
+        """
+
+        objective: Objective = (
+            solution.objective, solution.weights, solution.inputs
+        )
+
+        self._memo.add(self.__key(objective))
+        self._support = self.__support(objective)
+
+        self._best = solution.cost
+        self._stalled = 0
+        self._reason = ''
+
+    def is_repeated(self: 'Convergence', objective: Objective) -> bool:
+        """This method checks if a new resolution repeats the support or the
+        weights of a previous one, in which case it is not worth another
+        interaction, and records it otherwise.
+
+        Args:
+            objective (Objective): The result of the resolution, as returned
+                by LinModel.resolve().
+
+        Returns:
+            bool: True if the interactions have converged, False otherwise.
+        """
+
+        key: Key = self.__key(objective)
+        support: FrozenSet[Tuple[str, str, int]] = self.__support(objective)
+
+        if key in self._memo: self._reason = 'repeated'
+        elif support == self._support: self._reason = 'support'
+
+        self._memo.add(key)
+        self._support = support
+
+        return self._reason != ''
+
+    def update(self: 'Convergence', solution: Solution) -> bool:
+        """This method records the cost of the solution after an interaction.
+
+        Args:
+            solution (Solution): The solution reference.
+
+        Returns:
+            bool: True if the cost has not improved for the last interactions,
+                False otherwise.
+        """
+
+        if solution.cost < self._best:
+            self._best = solution.cost
+            self._stalled = 0
+
+        else: self._stalled += 1
+
+        if self._stalled >= self._patience: self._reason = 'patience'
+        return self._reason != ''
+
+    def __key(self: 'Convergence', objective: Objective) -> Key:
+        """This method builds the memo key of a resolution.
+
+        Args:
+            objective (Objective): The result of the resolution.
+
+        Returns:
+            Tuple[Tuple[float, ...], ...]: The rounded weights and inputs.
+        """
+
+        weights: Weights = objective[1]
+        inputs: Weights = objective[2]
+
+        return tuple(
+            tuple(round(value, self._digits) for value in values)
+            for values in list(weights.values()) + list(inputs.values())
+        )
+
+    def __support(
+        self: 'Convergence',
+        objective: Objective
+    ) -> FrozenSet[Tuple[str, str, int]]:
+        """This method builds the support of a resolution, i.e. the positions
+        of its nonzero weights and inputs.
+
+        Args:
+            objective (Objective): The result of the resolution.
+
+        Returns:
+            FrozenSet[Tuple[str, str, int]]: The kind ('x' for weights and 'y'
+                for inputs), key and index of each nonzero value.
+        """
+
+        tolerance: float = 10 ** -self._digits
+
+        return frozenset(
+            (kind, key, i)
+            for kind, values in (('x', objective[1]), ('y', objective[2]))
+            for key, line in values.items()
+            for i, value in enumerate(line) if value > tolerance
+        )
+
+    # region simple getters and setters
+    @property
+    def patience(self: 'Convergence') -> int:
+        """int: The number of interactions without improvement of the solution
+        cost before stopping."""
+        return self._patience
+
+    @patience.setter
+    def patience(self: 'Convergence', value: int) -> None:
+        self._patience = value
+
+    @property
+    def reason(self: 'Convergence') -> str:
+        """str: The criterion that stopped the interactions, 'support',
+        'repeated' or 'patience', or '' if none did."""
+        return self._reason
@@ -0,0 +1,159 @@
+from model.classes import Engine
+from model.problem import Problem
+from .constructive import Constructive
+from typing import List, Tuple, Union
+
+# the times of a job: the time by which it delays the next ones, the setup
+# between its stack and its reclaim and True if it reclaims
+Job = Tuple[Union[int, float], Union[int, float], bool]
+
+# the times of a route, by position: the start of the job in that position,
+# and the latest end of a reclaim before it and from it on
+Times = Tuple[List[float], List[float], List[float]]
+
+
+def job_times(
+    constructive: Constructive,
+    eng: Engine,
+    stp: int,
+    atv: str,
+    pos: int
+) -> Job:
+    """This function calculates the times of a job as in the build() of the
+    constructive, in which the job is reached from the position of the engine
+    at the beginning of the output request.
+
+    Args:
+        constructive (Constructive): The constructive whose weights, inputs
+            and output request are evaluated.
+        eng (Engine): The engine reference.
+        stp (int): The stockpile index.
+        atv (str): The activity, 'r' to reclaim, 's' to stack or 'b' to both.
+        pos (int): The position of the engine at the beginning of the output
+            request.
+
+    Returns:
+        Tuple[Union[int, float], Union[int, float], bool]: The time by which
+            the job delays the next ones, the setup between its stack and its
+            reclaim and True if it reclaims, in the time representation of the
+            solution.
+    """
+
+    time: Union[int, float] = constructive.time_travel[pos][stp]
+    setup: Union[int, float] = 0
+
+    if eng.speed_reclaim > 0:
+        time += constructive.to_time(
+            constructive.weights[constructive.output_id][stp] /
+            eng.speed_reclaim
+        )
+
+    if atv != 'r':
+        time += constructive.to_time(constructive.inputs[stp] / eng.speed_stack)
+        setup = constructive.time_travel[stp][stp]
+
+    return time, setup, atv != 's'
+
+
+def route_times(
+    constructive: Constructive,
+    eng: Engine,
+    route: List[Tuple[int, str]],
+    pos: int
+) -> Times:
+    """This function calculates the times of a route as in the build() of the
+    constructive, including the release of its engine, from which the finish
+    time of the engine with a new job in any position is found by
+    best_insertion().
+
+    Args:
+        constructive (Constructive): The constructive whose weights, inputs
+            and output request are evaluated.
+        eng (Engine): The engine reference.
+        route (List[Tuple[int, str]]): The route of the engine.
+        pos (int): The position of the engine at the beginning of the output
+            request.
+
+    Returns:
+        Tuple[List[float], List[float], List[float]]: The start of the job in
+            each position, the latest end of a reclaim before it and the
+            latest end of a reclaim from it on, including the position after
+            the last job.
+    """
+
+    count, release = constructive.release[eng.id - 1] \
+        if constructive.release else (0, 0)
+
+    starts: List[float] = [0]
+    ends: List[float] = []
+
+    for p, (stp, atv) in enumerate(route):
+        if p == count: starts[-1] = max(starts[-1], release)
+        time, setup, reclaims = job_times(constructive, eng, stp, atv, pos)
+
+        ends.append(starts[-1] + time + setup if reclaims else -float('inf'))
+        starts.append(starts[-1] + time)
+
+    if count >= len(route): starts[-1] = max(starts[-1], release)
+
+    before: List[float] = [-float('inf')]
+    for end in ends: before.append(max(before[-1], end))
+
+    after: List[float] = [-float('inf')]
+    for end in reversed(ends): after.append(max(after[-1], end))
+
+    return starts, before, after[::-1]
+
+
+def best_insertion(
+    times: Times,
+    job: Job,
+    first: int = 0
+) -> Tuple[float, int]:
+    """This function finds the best position of a job in a route, i.e. the
+    one in which its engine finishes its reclaims first, since the job delays
+    every reclaim after it. Among the best positions, the last one is chosen.
+
+    Args:
+        times (Tuple[List[float], List[float], List[float]]): The times of the
+            route, as calculated by route_times().
+        job (Tuple[Union[int, float], Union[int, float], bool]): The times of
+            the job, as calculated by job_times().
+        first (int): The first position in which the job can be inserted.
+            Defaults to 0.
+
+    Returns:
+        Tuple[float, int]: The finish time of the reclaims of the engine and
+            the position of the job.
+    """
+
+    starts, before, after = times
+    time, setup, reclaims = job
+
+    best: Tuple[float, int] = (float('inf'), first)
+    for position in range(first, len(starts)):
+        finish: float = max(0, before[position], after[position] + time)
+        if reclaims: finish = max(finish, starts[position] + time + setup)
+
+        if finish <= best[0]: best = (finish, position)
+
+    return best
+
+
+def can_perform(problem: Problem, eng: Engine, stp: int, atv: str) -> bool:
+    """This function checks if an engine can perform a job, i.e. if it runs on
+    a rail of the stockpile and has the required speeds.
+
+    Args:
+        problem (Problem): The problem reference.
+        eng (Engine): The engine reference.
+        stp (int): The stockpile index.
+        atv (str): The activity, 'r' to reclaim, 's' to stack or 'b' to both.
+
+    Returns:
+        bool: True if the engine can perform the job, False otherwise.
+    """
+
+    return eng.rail in problem.stockpiles[stp].rails \
+        and (atv == 's' or eng.speed_reclaim > 0) \
+        and (atv == 'r' or eng.speed_stack > 0)
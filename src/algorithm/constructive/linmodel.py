@@ -1,10 +1,19 @@
-from config import Stockpiles, Outputs, Inputs, Objective
+from config import Stockpiles, Engines, Outputs, Inputs, Objective
+from model.classes import Stockpile
+from .backend import Backend, CBC
 from model.problem import Problem
-from mip import Model, Var, LinExpr, xsum
-from typing import Optional, Tuple, Dict
+from mip import Model, Var, Constr, Column, LinExpr, xsum, INF
+from typing import Optional, Tuple, Dict, List, Any
 import random
+import time
 import os
 
+# the folder of the model details, in the out folder of the repository 
+# whatever the working directory
+LOGS: str = os.path.normpath(os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), '..', '..', '..', 'out', 'logs'
+))
+
 
 class LinModel:
     """This class represents a Linear Model that is built using the Python-MIP 
@@ -23,18 +32,36 @@ class LinModel:
     and solution pools. For more information, access https://www.python-mip.com.
     """
 
-    def __init__(self: 'LinModel', problem: Problem):
+    def __init__(
+        self: 'LinModel', 
+        problem: Problem, 
+        backend: Optional[Backend] = None,
+        reduce: bool = True
+    ):
         """Instanciates a new Linear Model.
 
         Args:
             problem (Problem): Problem considered.
+            backend (Optional[Backend]): The solver backend or None to use 
+                CBC. Defaults to None.
+            reduce (bool): True if the variables that cannot be nonzero, and 
+                the constraints left redundant by them, must be left out of 
+                the model, False otherwise. Defaults to True.
         """
 
         self._omp: Model = Model('Ore Mixing Problem')
+        self._backend: Backend = backend if backend is not None else CBC()
+
+        # wall time, in seconds, spent by the backend in the resolutions
+        self._time: float = 0.0
+
+        # whether each resolution writes the model details in a .lp file
+        self._log: bool = True
 
         # Problem data used to solve the model
         self._info: str = problem.info[0]
         self._stockpiles: Stockpiles = problem.stockpiles
+        self._engines: Engines = problem.engines
         self._outputs: Outputs = problem.outputs
         self._inputs: Inputs = problem.inputs
 
@@ -48,10 +75,20 @@ class LinModel:
         self._x: Optional[Var] = None
         self._y: Optional[Var] = None
 
+        # stockpiles that can be reclaimed and stacked and inputs that have 
+        # ore, by the presolve
+        self._reduce: bool = reduce
+        self._reclaimable: List[bool] = [True] * self._p
+        self._stackable: List[bool] = [True] * self._p
+        self._available: List[bool] = [True] * self._e
+
         # weights of the restrictions in the objective function
         self._w_1: int = problem.info[1]
         self._w_2: int = problem.info[2]
 
+        # random stream of the feedback weights
+        self._rng: random.Random = random.Random(0)
+
         # variable weights for the Ore Mixing Problem
         self._w_x: Dict[Tuple[int, int], int] = {
             (i, k): 1 for i in range(self._p) for k in range(self._r)
@@ -61,18 +98,35 @@ class LinModel:
             (h, i): 1 for h in range(self._e) for i in range(self._p)
         }
 
+        # number of changes applied in place, which tells apart the names of 
+        # the variables and rows they add from the ones already there
+        self._changes: int = 0
+
+        # rows updated in place when the problem changes: the capacity row of 
+        # each input and stockpile, the weight rows of each stockpile (by 
+        # input or None for the single row) and the rows of each request
+        self._input_rows: Dict[int, Constr] = {}
+        self._capacity_rows: Dict[int, Constr] = {}
+        self._weight_rows: Dict[int, Dict[Optional[int], Constr]] = {}
+        self._request_rows: Dict[int, List[Constr]] = {}
+
         # deviation variables for the Ore Mixing Problem
         self._a_max: Optional[Var] = None
         self._a_min: Optional[Var] = None
         self._b_max: Optional[Var] = None
         self._b_min: Optional[Var] = None
 
+        # weighted quality deviation, i.e. the part of the objective function 
+        # that does not depend on the variable weights
+        self._deviation: Optional[LinExpr] = None
+
         # control flags
         self.__has_vars: bool = False
         self.__has_constrs: bool = False
         self.__has_objective: bool = False
 
         # assigns variable values, creates constraints and objective function
+        if reduce: self.__presolve()
         self.__add_vars()
         self.__add_constrs()
         self.__add_objective()
@@ -95,27 +149,37 @@ class LinModel:
             'calling the resolve() before mandatory call to __add_objective().'
 
         # solving the model
-        os.makedirs(os.path.dirname(f'./out/logs/'), exist_ok=True)
-        self._omp.write(f'./out/logs/{self._info}.lp')
-        self._omp.optimize()
+        if self._log:
+            os.makedirs(LOGS, exist_ok=True)
+            self._omp.write(os.path.join(LOGS, f'{self._info}.lp'))
+
+        objective: Optional[float]
+        values: List[float]
+
+        start: float = time.time()
+        objective, values = self._backend.solve(self._omp)
+        self._time += time.time() - start
 
-        if self._omp.num_solutions > 0:
+        if objective is not None:
 
             # output weights taken from each stockpile i for each request k
+            # (the variables left out by the presolve are zero)
             reclaims = {
                 f'id: {self._outputs[k].id}': [
-                    self._x[i, k].x for i in range(self._p)
+                    values[self._x[i, k].idx] if (i, k) in self._x else 0.0 
+                    for i in range(self._p)
                 ] for k in range(self._r)
             }
 
             # input weights taken from each input j for each stockpile k
             inputs = {
                 f'id: {self._stockpiles[i].id}': [
-                    self._y[h, i].x for h in range(self._e)
+                    values[self._y[h, i].idx] if (h, i) in self._y else 0.0 
+                    for h in range(self._e)
                 ] for i in range(self._p)
             }
 
-            return self._omp.objective_value, reclaims, inputs
+            return objective, reclaims, inputs
 
         else:
             return None, {}, {}
@@ -126,7 +190,8 @@ class LinModel:
         weights: Dict[Tuple[int, int], int]
     ) -> None:
         """This method assigns weights to the variables. It must be called 
-        whenever it is necessary to send to send feedback to this model.
+        whenever it is necessary to send to send feedback to this model. The 
+        objective function is updated with the new weights.
         
         Args:
             variable (str): Indicator of which variable weights are defined. 
@@ -152,7 +217,8 @@ class LinModel:
             # sets a new list of weights with random values
             for k, lin in enumerate(weights):
                 for i, col in enumerate(lin):
-                    self._w_x[i, k] = random.randint(1, 1e3) if col > 0 else 1
+                    self._w_x[i, k] = self._rng.randint(1, int(1e3)) \
+                        if col > 0 else 1
 
         elif variable == 'y':
             # resets the previous list of weights, if any
@@ -163,7 +229,372 @@ class LinModel:
             # sets a new list of weights with random values
             for i, lin in enumerate(weights):
                 for h, col in enumerate(lin):
-                    self._w_y[h, i] = random.randint(1, 1e3) if col > 0 else 1
+                    self._w_y[h, i] = self._rng.randint(1, int(1e3)) \
+                        if col > 0 else 1
+
+        self.__set_objective()
+
+    def add_output(self: 'LinModel') -> None:
+        """This method adds to the model the last output of the problem, which 
+        must already be appended to its list of outputs, with its variables 
+        and constraints. The rest of the model is kept as it is, so that the 
+        backend can start the next resolution from the previous one.
+        """
+
+        k: int = self._r
+        self._r += 1
+
+        self._changes += 1
+        suffix: str = f'_{self._changes}'
+
+        for i in range(self._p):
+            self._w_x[i, k] = 1
+            if not self._reclaimable[i]: continue
+
+            # the new variable also enters the weight rows of its stockpile
+            rows: List[Constr] = list(self._weight_rows[i].values())
+            self._x[i, k] = self._omp.add_var(
+                name=f'x_{i}{k}{suffix}', 
+                column=Column(rows, [1.0] * len(rows)) if rows else None
+            )
+
+        for j in range(self._t):
+            self._a_max[j, k] = self._omp.add_var(name=f'a_max_{j}{k}{suffix}')
+            self._a_min[j, k] = self._omp.add_var(name=f'a_min_{j}{k}{suffix}')
+            self._b_max[j, k] = self._omp.add_var(name=f'b_max_{j}{k}{suffix}')
+            self._b_min[j, k] = self._omp.add_var(name=f'b_min_{j}{k}{suffix}')
+
+        self.__add_request_rows(k, suffix)
+        self.__bound()
+
+        self.__set_deviation()
+        self.__set_objective()
+
+    def remove_output(self: 'LinModel', k: int) -> None:
+        """This method removes an output from the model, with its variables 
+        and constraints. The output must already be removed from the list of 
+        outputs of the problem and the following ones take its place.
+
+        Args:
+            k (int): The index of the output in the problem before its removal.
+        """
+
+        removed: List[Any] = self._request_rows.pop(k)
+        for i in range(self._p):
+            if (i, k) in self._x: removed.append(self._x.pop((i, k)))
+
+        for deviation in (self._a_max, self._a_min, self._b_max, self._b_min):
+            removed.extend(deviation.pop((j, k)) for j in range(self._t))
+
+        self._omp.remove(removed)
+
+        self._x = shift(self._x, 1, k)
+        self._a_max = shift(self._a_max, 1, k)
+        self._a_min = shift(self._a_min, 1, k)
+        self._b_max = shift(self._b_max, 1, k)
+        self._b_min = shift(self._b_min, 1, k)
+        self._w_x = shift(
+            {key: w for key, w in self._w_x.items() if key[1] != k}, 1, k
+        )
+
+        self._request_rows = {
+            r - 1 if r > k else r: rows 
+            for r, rows in self._request_rows.items()
+        }
+
+        self._r -= 1
+
+        self.__set_deviation()
+        self.__set_objective()
+
+    def add_input(self: 'LinModel') -> None:
+        """This method adds to the model the last input of the problem, which 
+        must already be appended to its list of inputs, with its variables 
+        and constraints. The model is only built again if this is the first 
+        input with ore, which makes the stockpiles stackable.
+        """
+
+        h: int = self._e
+        self._e += 1
+
+        self._changes += 1
+        suffix: str = f'_{self._changes}'
+
+        for i in range(self._p): self._w_y[h, i] = 1
+
+        self._available.append(self._inputs[h].weight > 0 or not self._reduce)
+        if self._reduce and self._available[h] and not any(self._available[:h]):
+            self.__rebuild()
+            return
+
+        y_input: List[Var] = []
+        for i in range(self._p):
+            if not self._available[h] or not self._stackable[i]: continue
+
+            # the new variable also enters the capacity row of its stockpile
+            capacity: Optional[Constr] = self._capacity_rows.get(i)
+            self._y[h, i] = self._omp.add_var(
+                name=f'y_{h}{i}{suffix}', 
+                column=Column([capacity], [1.0]) if capacity else None
+            )
+
+            y_input.append(self._y[h, i])
+            if capacity is None:
+                self._capacity_rows[i] = self._omp.add_constr(
+                    self._y[h, i] + self._stockpiles[i].weight_ini 
+                    <= self._stockpiles[i].capacity, 
+                    f'capacity_constr_{i}{suffix}'
+                )
+
+        if y_input:
+            self._input_rows[h] = self._omp.add_constr(
+                xsum(y_input) <= self._inputs[h].weight, 
+                f'input_weight_constr_{h}{suffix}'
+            )
+
+        # the stockpiles bounded by each input are also bounded by this one
+        for i in range(self._p):
+            rows: Dict[Optional[int], Constr] = self._weight_rows[i]
+            if not rows or None in rows: continue
+
+            self._weight_rows[i][h] = self._omp.add_constr(
+                xsum(self.__stockpile_vars(i)[0]) 
+                <= self._stockpiles[i].weight_ini + self._y.get((h, i), 0), 
+                f'weight_constr_{i}{h}{suffix}'
+            )
+
+        self.__set_objective()
+
+    def remove_input(self: 'LinModel', h: int) -> None:
+        """This method removes an input from the model, with its variables 
+        and constraints. The input must already be removed from the list of 
+        inputs of the problem and the following ones take its place. The model 
+        is only built again if the input has no ore, since the single weight 
+        rows of the stockpiles may be owed to it, or if it was the last one 
+        with ore.
+
+        Args:
+            h (int): The index of the input in the problem before its removal.
+        """
+
+        self._w_y = shift(
+            {key: w for key, w in self._w_y.items() if key[0] != h}, 0, h
+        )
+
+        if self._reduce \
+        and (not self._available[h] or sum(self._available) == 1):
+            self.__rebuild()
+            return
+
+        removed: List[Any] = []
+        if h in self._input_rows: removed.append(self._input_rows.pop(h))
+
+        for i in range(self._p):
+            if (h, i) in self._y: removed.append(self._y.pop((h, i)))
+            if h in self._weight_rows[i]:
+                removed.append(self._weight_rows[i].pop(h))
+
+        self._omp.remove(removed)
+
+        self._y = shift(self._y, 0, h)
+        self._input_rows = {
+            g - 1 if g > h else g: row for g, row in self._input_rows.items()
+        }
+
+        self._weight_rows = {
+            i: {
+                g - 1 if g is not None and g > h else g: row 
+                for g, row in rows.items()
+            } for i, rows in self._weight_rows.items()
+        }
+
+        self._available.pop(h)
+        self._e -= 1
+
+        self.__set_objective()
+
+    def update_stockpile(self: 'LinModel', i: int) -> None:
+        """This method updates the constraints of a stockpile whose initial 
+        weight has changed in the problem. The model is only built again if 
+        the change makes the stockpile stackable or reclaimable or stops it 
+        from being so.
+
+        Args:
+            i (int): The index of the stockpile.
+        """
+
+        if self._reduce and self.__reachable(i) \
+        != (self._stackable[i], self._reclaimable[i]):
+            self.__rebuild()
+            return
+
+        stp: Stockpile = self._stockpiles[i]
+
+        if i in self._capacity_rows:
+            self._capacity_rows[i].rhs = stp.capacity - stp.weight_ini
+
+        for row in self._weight_rows[i].values(): row.rhs = stp.weight_ini
+        self.__bound()
+
+    def fix(
+        self: 'LinModel', 
+        variable: str, 
+        key: Tuple[int, int], 
+        value: float
+    ) -> None:
+        """This method fixes the value of a variable, e.g. the weight of a job 
+        that has already started. The variables left out by the presolve are 
+        zero and cannot be fixed.
+
+        Args:
+            variable (str): Indicator of which variable is fixed. It must be 
+                'x' or 'y'.
+            key (Tuple[int, int]): The indexes of the variable, i.e. the 
+                stockpile and the request for 'x' or the input and the 
+                stockpile for 'y'.
+            value (float): The value of the variable.
+        """
+
+        assert variable == 'x' or variable == 'y', \
+            'the variable \'x\' or \'y\' to be fixed must be defined.'
+
+        var: Optional[Var] = (self._x if variable == 'x' else self._y).get(key)
+        if var is None: return
+
+        var.lb = value
+        var.ub = value
+
+    def release(self: 'LinModel') -> None:
+        """This method releases the variables fixed by fix()."""
+
+        for var in list(self._x.values()) + list(self._y.values()):
+            var.lb = 0.0
+            var.ub = INF
+
+    def __rebuild(self: 'LinModel') -> None:
+        """This method builds the model again from the problem, when a change 
+        of the problem cannot be applied in place. The variable weights are 
+        kept and the fixed variables are released. It is called within the 
+        methods that change the model and there is no need to use it 
+        afterwards.
+        """
+
+        self._omp = Model('Ore Mixing Problem')
+
+        self._p = len(self._stockpiles)
+        self._r = len(self._outputs)
+        self._e = len(self._inputs)
+
+        self._reclaimable = [True] * self._p
+        self._stackable = [True] * self._p
+        self._available = [True] * self._e
+
+        self._w_x = {
+            (i, k): self._w_x.get((i, k), 1) 
+            for i in range(self._p) for k in range(self._r)
+        }
+
+        self._w_y = {
+            (h, i): self._w_y.get((h, i), 1) 
+            for h in range(self._e) for i in range(self._p)
+        }
+
+        self._input_rows = {}
+        self._capacity_rows = {}
+        self._weight_rows = {}
+        self._request_rows = {}
+
+        self.__has_vars = False
+        self.__has_constrs = False
+        self.__has_objective = False
+
+        if self._reduce: self.__presolve()
+        self.__add_vars()
+        self.__add_constrs()
+        self.__add_objective()
+
+    def __bound(self: 'LinModel') -> None:
+        """This method adds the weight rows of the stockpiles that were left 
+        without them for holding the whole demand, if they no longer do. It is 
+        called whenever the demand or the weight of a stockpile changes and 
+        there is no need to use it afterwards.
+        """
+
+        demand: float = sum(out.weight for out in self._outputs)
+
+        self._changes += 1
+        for i in range(self._p):
+            if self._weight_rows[i]: continue
+
+            x_stockpile, y_stockpile = self.__stockpile_vars(i)
+            self.__add_weight_rows(
+                i, x_stockpile, y_stockpile, demand, f'_{self._changes}'
+            )
+
+    def __stockpile_vars(
+        self: 'LinModel', 
+        i: int
+    ) -> Tuple[List[Var], List[Var]]:
+        """This method finds the variables of a stockpile.
+
+        Args:
+            i (int): The index of the stockpile.
+
+        Returns:
+            Tuple[List[Var], List[Var]]: The reclaiming and the stacking 
+                variables of the stockpile.
+        """
+
+        return [
+            self._x[i, k] for k in range(self._r) if (i, k) in self._x
+        ], [
+            self._y[h, i] for h in range(self._e) if (h, i) in self._y
+        ]
+
+    def __presolve(self: 'LinModel') -> None:
+        """This method finds the stockpiles whose variables cannot be nonzero. 
+        A stockpile can only be stacked if an engine with stacking speed runs 
+        on one of its rails and it has room for more ore, and it can only be 
+        reclaimed if an engine with reclaiming speed runs on one of its rails 
+        and it has ore, initially or stacked. It is automatically called on 
+        the class instantiation and there is no need to use it latter.
+        """
+
+        assert not self.__has_vars, \
+            'calling the __presolve() after the call to __add_vars().'
+
+        self._available = [inp.weight > 0 for inp in self._inputs]
+
+        for i in range(self._p):
+            self._stackable[i], self._reclaimable[i] = self.__reachable(i)
+
+    def __reachable(self: 'LinModel', i: int) -> Tuple[bool, bool]:
+        """This method applies the presolve rules to a stockpile. It is called 
+        within __presolve() and update_stockpile() and there is no need to use 
+        it afterwards.
+
+        Args:
+            i (int): The index of the stockpile.
+
+        Returns:
+            Tuple[bool, bool]: True if the stockpile can be stacked and True 
+                if it can be reclaimed.
+        """
+
+        stp: Stockpile = self._stockpiles[i]
+        rails: List[int] = stp.rails
+
+        stackable: bool = stp.capacity > stp.weight_ini and any(
+            eng.speed_stack > 0 and eng.rail in rails 
+            for eng in self._engines
+        ) and any(self._available)
+
+        reclaimable: bool = (stp.weight_ini > 0 or stackable) and any(
+            eng.speed_reclaim > 0 and eng.rail in rails 
+            for eng in self._engines
+        )
+
+        return stackable, reclaimable
 
     def __add_vars(self: 'LinModel') -> None:
         """This method assigns values ​​to variables. It is automatically called 
@@ -179,11 +610,13 @@ class LinModel:
 
         # x_ik is the quantity of ore removed from stockpile i for request k
         self._x = {(i, k): self._omp.add_var(name=f'x_{i}{k}')
-            for i in range(self._p) for k in range(self._r)}
+            for i in range(self._p) for k in range(self._r) 
+            if self._reclaimable[i]}
 
         # y_hk is the quantity of ore removed from input h for stockpile i
         self._y = {(h, i): self._omp.add_var(name=f'y_{h}{i}')
-            for h in range(self._e) for i in range(self._p)}
+            for h in range(self._e) for i in range(self._p) 
+            if self._stackable[i] and self._available[h]}
 
         # var_jk is the deviation from the quality parameter j of the request k
         self._a_max = {(j, k): self._omp.add_var(name=f'a_max_{j}{k}')
@@ -210,57 +643,148 @@ class LinModel:
         
         self.__has_constrs = True
 
+        # variables of each input, stockpile and request (the ones left out 
+        # by the presolve are zero and are skipped)
+        y_input: List[List[Var]] = [[] for _ in range(self._e)]
+        y_stockpile: List[List[Var]] = [[] for _ in range(self._p)]
+        for (h, i), var in self._y.items():
+            y_input[h].append(var)
+            y_stockpile[i].append(var)
+
+        x_stockpile: List[List[Var]] = [[] for _ in range(self._p)]
+        for (i, k), var in self._x.items():
+            x_stockpile[i].append(var)
+
+        # the reclaimed weight never exceeds the total demand
+        demand: float = sum(out.weight for out in self._outputs)
+
          # capacity constraint of inputs
         for h in range(self._e):
-            self._omp += xsum(self._y[h, i] for i in range(self._p)) \
-                      <= self._inputs[h].weight, f'input_weight_constr_{h}'
+            if not y_input[h]: continue
+
+            self._input_rows[h] = self._omp.add_constr(
+                xsum(y_input[h]) <= self._inputs[h].weight, 
+                f'input_weight_constr_{h}'
+            )
 
         # stockpile capacity constraints
         for i in range(self._p):
-            self._omp += xsum(self._y[h, i] for h in range(self._e)) \
-                      + self._stockpiles[i].weight_ini \
-                      <= self._stockpiles[i].capacity, f'capacity_constr_{i}'
-
-            for h in range(self._e):
-                self._omp += xsum(self._x[i, k] for k in range(self._r)) \
-                          <= self._stockpiles[i].weight_ini + self._y[h, i], \
-                          f'weight_constr_{i}{h}'
-
-        for k in range(self._r):
-            # demand constraint
-            self._omp += xsum(self._x[i, k] for i in range(self._p)) \
-                      == self._outputs[k].weight, f'demand_constr_{k}'
-
-            # quality constraints
-            for j in range(self._t):
-
-                # minimum quality deviation constraint
-                q_1: LinExpr = xsum(
-                    self._x[i, k] * (self._stockpiles[i].quality_ini[j].value -
-                    self._outputs[k].quality[j].minimum) for i in range(self._p)
+            if y_stockpile[i]:
+                self._capacity_rows[i] = self._omp.add_constr(
+                    xsum(y_stockpile[i]) + self._stockpiles[i].weight_ini 
+                    <= self._stockpiles[i].capacity, 
+                    f'capacity_constr_{i}'
                 )
 
-                self._omp += q_1 + self._a_min[j, k] * self._outputs[k].weight \
-                          >= 0, f'min_quality_constr_{j}{k}'
+            self._weight_rows[i] = {}
+            self.__add_weight_rows(i, x_stockpile[i], y_stockpile[i], demand)
 
-                # maximum quality deviation constraint
-                q_2: LinExpr = xsum(
-                    self._x[i, k] * (self._stockpiles[i].quality_ini[j].value -
-                    self._outputs[k].quality[j].maximum) for i in range(self._p)
-                )
+        for k in range(self._r): self.__add_request_rows(k)
 
-                self._omp += q_2 - self._a_max[j, k] * self._outputs[k].weight \
-                          <= 0, f'max_quality_constr_{j}{k}'
+    def __add_weight_rows(
+        self: 'LinModel', 
+        i: int, 
+        x_stockpile: List[Var], 
+        y_stockpile: List[Var],
+        demand: float,
+        suffix: str = ''
+    ) -> None:
+        """This method creates the constraints that bound the weight reclaimed 
+        from a stockpile by its initial weight and the stacked ones. It is 
+        called within __add_constrs() and whenever the demand increases, so 
+        there is no need to use it afterwards.
 
-                # deviation constraint from the quality goal
-                q_3: LinExpr = xsum(
-                    self._x[i, k] * (self._stockpiles[i].quality_ini[j].value -
-                    self._outputs[k].quality[j].goal) for i in range(self._p)
-                )
+        Args:
+            i (int): The index of the stockpile.
+            x_stockpile (List[Var]): The reclaiming variables of the stockpile.
+            y_stockpile (List[Var]): The stacking variables of the stockpile.
+            demand (float): The total demand of the requests.
+            suffix (str): The suffix of the row names. Defaults to ''.
+        """
+
+        if not x_stockpile: return
+
+        # a stockpile that holds the whole demand is never exhausted
+        if self._reduce and self._stockpiles[i].weight_ini >= demand: return
+
+        # a single row bounds the reclaim by the initial weight if any 
+        # stacking variable is zero, since that row dominates the others
+        if self._reduce and len(y_stockpile) < self._e:
+            self._weight_rows[i][None] = self._omp.add_constr(
+                xsum(x_stockpile) <= self._stockpiles[i].weight_ini, 
+                f'weight_constr_{i}{suffix}'
+            )
+            return
+
+        for h in range(self._e):
+            self._weight_rows[i][h] = self._omp.add_constr(
+                xsum(x_stockpile) <= self._stockpiles[i].weight_ini 
+                + self._y[h, i], f'weight_constr_{i}{h}{suffix}'
+            )
+
+    def __add_request_rows(self: 'LinModel', k: int, suffix: str = '') -> None:
+        """This method creates the demand and quality constraints of a 
+        request. It is called within __add_constrs() and add_output(), so 
+        there is no need to use it afterwards.
+
+        Args:
+            k (int): The index of the request.
+            suffix (str): The suffix of the row names. Defaults to ''.
+        """
 
-                self._omp += q_3 + (self._b_min[j, k] - self._b_max[j, k]) \
-                          * self._outputs[k].weight == 0, \
-                          f'goal_quality_constr_{j}{k}'
+        x_request: List[Tuple[int, Var]] = [
+            (i, self._x[i, k]) for i in range(self._p) if (i, k) in self._x
+        ]
+
+        rows: List[Constr] = []
+
+        # demand constraint
+        rows.append(self._omp.add_constr(
+            xsum(var for _, var in x_request) == self._outputs[k].weight, 
+            f'demand_constr_{k}{suffix}'
+        ))
+
+        # quality constraints
+        for j in range(self._t):
+
+            # minimum quality deviation constraint
+            q_1: LinExpr = xsum(
+                var * (self._stockpiles[i].quality_ini[j].value -
+                self._outputs[k].quality[j].minimum) 
+                for i, var in x_request
+            )
+
+            rows.append(self._omp.add_constr(
+                q_1 + self._a_min[j, k] * self._outputs[k].weight >= 0, 
+                f'min_quality_constr_{j}{k}{suffix}'
+            ))
+
+            # maximum quality deviation constraint
+            q_2: LinExpr = xsum(
+                var * (self._stockpiles[i].quality_ini[j].value -
+                self._outputs[k].quality[j].maximum) 
+                for i, var in x_request
+            )
+
+            rows.append(self._omp.add_constr(
+                q_2 - self._a_max[j, k] * self._outputs[k].weight <= 0, 
+                f'max_quality_constr_{j}{k}{suffix}'
+            ))
+
+            # deviation constraint from the quality goal
+            q_3: LinExpr = xsum(
+                var * (self._stockpiles[i].quality_ini[j].value -
+                self._outputs[k].quality[j].goal) 
+                for i, var in x_request
+            )
+
+            rows.append(self._omp.add_constr(
+                q_3 + (self._b_min[j, k] - self._b_max[j, k]) 
+                * self._outputs[k].weight == 0, 
+                f'goal_quality_constr_{j}{k}{suffix}'
+            ))
+
+        self._request_rows[k] = rows
 
     def __add_objective(self: 'LinModel') -> None:
         """This method creates a objective function for the model. It is 
@@ -280,6 +804,15 @@ class LinModel:
         
         self.__has_objective = True
 
+        self.__set_deviation()
+        self.__set_objective()
+
+    def __set_deviation(self: 'LinModel') -> None:
+        """This method builds the weighted quality deviation of the objective 
+        function. It is called within __add_objective() and whenever the 
+        requests change, so there is no need to use it afterwards.
+        """
+
         # deviation from limits
         d_limit: LinExpr = xsum(
             self._outputs[k].quality[j].importance *
@@ -296,22 +829,27 @@ class LinModel:
             for j in range(self._t) for k in range(self._r)
         )
 
+        self._deviation = self._w_1 * d_limit + self._w_2 * d_goal
+
+    def __set_objective(self: 'LinModel') -> None:
+        """This method sets the objective function of the model with the 
+        current variable weights. It is called within __add_objective() and 
+        whenever the weights are changed, so there is no need to use it 
+        afterwards.
+        """
+
         # scheduling reclaims
         r_scheduling: LinExpr = xsum(
-            self._w_x[i, k] * self._x[i, k]
-            for i in range(self._p) for k in range(self._r)
+            self._w_x[i, k] * var for (i, k), var in self._x.items()
         )
 
         # scheduling inputs
         i_scheduling: LinExpr = xsum(
-            self._w_y[h, i] * self._y[h, i]
-            for h in range(self._e) for i in range(self._p)
+            self._w_y[h, i] * var for (h, i), var in self._y.items()
         )
 
         # objective function
-        self._omp += self._w_1 * d_limit \
-                  + self._w_2 * d_goal \
-                  + r_scheduling + i_scheduling
+        self._omp.objective = self._deviation + r_scheduling + i_scheduling
 
     def __normalize(self: 'LinModel', j: int, k: int, bound: str) -> float:
         """This method helps to calculate the units of deviation and avoids 
@@ -348,3 +886,80 @@ class LinModel:
                 - self._outputs[k].quality[j].minimum
 
         return ans if ans != 0 else 1e-6
+
+    # region simple getters and setters
+    @property
+    def omp(self: 'LinModel') -> Model:
+        """Model: The Python-MIP model of the Ore Mixing Problem."""
+        return self._omp
+
+    @property
+    def backend(self: 'LinModel') -> Backend:
+        """Backend: The solver backend."""
+        return self._backend
+
+    @backend.setter
+    def backend(self: 'LinModel', value: Backend) -> None:
+        self._backend = value
+
+    @property
+    def reduce(self: 'LinModel') -> bool:
+        """bool: True if the model was reduced by the presolve."""
+        return self._reduce
+
+    @property
+    def log(self: 'LinModel') -> bool:
+        """bool: True if each resolution writes the model details in a .lp 
+        file, False otherwise."""
+        return self._log
+
+    @log.setter
+    def log(self: 'LinModel', value: bool) -> None:
+        self._log = value
+
+    @property
+    def status(self: 'LinModel') -> str:
+        """str: The status of the last resolution."""
+        return self._backend.status
+
+    @property
+    def time(self: 'LinModel') -> float:
+        """float: Wall time, in seconds, spent by the backend in the 
+        resolutions."""
+        return self._time
+
+    @time.setter
+    def time(self: 'LinModel', value: float) -> None:
+        self._time = value
+
+    @property
+    def rng(self: 'LinModel') -> random.Random:
+        """random.Random: The random stream of the feedback weights."""
+        return self._rng
+
+    @rng.setter
+    def rng(self: 'LinModel', value: random.Random) -> None:
+        self._rng = value
+
+
+def shift(
+    values: Dict[Tuple[int, ...], Any], 
+    axis: int, 
+    removed: int
+) -> Dict[Tuple[int, ...], Any]:
+    """This function renumbers the keys of a dictionary of variables after 
+    the removal of an index, so that the following indexes take its place. 
+    The keys with the removed index must already be left out.
+
+    Args:
+        values (Dict[Tuple[int, ...], Any]): The dictionary to be renumbered.
+        axis (int): The position of the removed index in the keys.
+        removed (int): The removed index.
+
+    Returns:
+        Dict[Tuple[int, ...], Any]: The renumbered dictionary.
+    """
+    return {
+        key[:axis] + (key[axis] - 1 if key[axis] > removed else key[axis],) 
+        + key[axis + 1:]: value for key, value in values.items()
+    }
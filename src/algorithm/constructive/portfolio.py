@@ -0,0 +1,289 @@
+from config import Objective
+from model.problem import Problem
+from model.solution import Solution
+from .linmodel import LinModel
+from .backend import Backend
+from .postmodel import PostModel
+from concurrent.futures import ProcessPoolExecutor, Future
+from typing import List, Tuple, Optional
+import random
+import os
+
+# the state of a worker process: its linear model and its solution
+worker: Optional[Tuple[LinModel, Solution]] = None
+
+# the result of a variant: its cost, the objective of its linear model, the
+# wall time of the resolution and its status
+Variant = Tuple[float, Objective, float, str]
+
+# a round submitted to the workers: the feedback weights and inputs from 
+# which its variants were drawn and their futures
+Round = Tuple[List[List[float]], List[List[float]], List[Future]]
+
+class Portfolio:
+    """This class represents a Portfolio of linear model resolutions for the
+    feedback approach. At each round, several random weight vectors are drawn
+    from the same feedback, the linear models they define are solved
+    concurrently in worker processes and each outcome is evaluated by the
+    constructive, so that the round continues with the best one instead of a
+    single random draw.
+
+    Each worker process keeps its own linear model, which is built once, and
+    only the feedback weights and the seed of each variant are sent to it.
+
+    A round can also be submitted before it is needed and collected later, 
+    so that its linear models are solved in background while the heuristic 
+    runs, in which case it is discarded if the feedback has changed since.
+    """
+
+    def __init__(
+        self: 'Portfolio',
+        problem: Problem,
+        model: LinModel,
+        size: int,
+        fixed_point: bool = False,
+        workers: Optional[int] = None
+    ):
+        """Instantiates a new Portfolio.
+
+        Args:
+            problem (Problem): The problem reference.
+            model (LinModel): The linear model of the main process, whose
+                backend is used by the workers, whose random stream draws the
+                seeds of the variants and whose resolution time and status are
+                updated with the ones of the portfolio.
+            size (int): The number of variants of each round.
+            fixed_point (bool): True if the times of the schedule must be
+                represented as integer hundredths of the time unit. Defaults to
+                False.
+            workers (Optional[int]): The number of worker processes or None to
+                use one per variant, limited by the number of cores. Defaults
+                to None.
+        """
+
+        self._problem: Problem = problem
+        self._model: LinModel = model
+        self._size: int = size
+        self._fixed_point: bool = fixed_point
+        self._workers: int = workers if workers is not None \
+            else min(size, os.cpu_count() or 1)
+
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+        # number of submitted rounds discarded for being stale
+        self._discarded: int = 0
+
+    def resolve(self: 'Portfolio', solution: Solution) -> Objective:
+        """This method solves the variants of a round, from the weights of the
+        solution, and returns the objective of the best one, i.e. the one
+        whose constructive solution has the lowest cost.
+
+        Args:
+            solution (Solution): The solution whose weights are the feedback.
+
+        Returns:
+            Tuple[Optional[float], Dict[str, List[float]], Dict[str, List[float]]]:
+                The objective of the best variant, as returned by
+                LinModel.resolve().
+        """
+
+        return self.collect(self.submit(solution))
+
+    def submit(self: 'Portfolio', solution: Solution) -> Round:
+        """This method submits the variants of a round, from the weights of 
+        the solution, to the workers and returns without waiting for them.
+
+        Args:
+            solution (Solution): The solution whose weights are the feedback.
+
+        Returns:
+            Round: The submitted round, to be collected or discarded.
+        """
+
+        # the workers start once and are kept for the following rounds
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(
+                max_workers=self._workers,
+                initializer=prepare,
+                initargs=(
+                    self._problem, self._model.backend, self._model.reduce, 
+                    self._fixed_point
+                )
+            )
+
+        weights: List[List[float]] = list(solution.weights.values())
+        inputs: List[List[float]] = list(solution.inputs.values())
+
+        # a single variant needs no constructive to be ranked
+        futures: List[Future] = [
+            self._pool.submit(
+                evaluate, weights, inputs, self._model.rng.randrange(2 ** 32), 
+                self._size > 1
+            ) for _ in range(self._size)
+        ]
+
+        return weights, inputs, futures
+
+    def is_stale(self: 'Portfolio', submitted: Round, solution: Solution) -> bool:
+        """This method checks if a submitted round was drawn from a feedback 
+        other than the current weights of the solution.
+
+        Args:
+            submitted (Round): The submitted round.
+            solution (Solution): The solution whose weights are the feedback.
+
+        Returns:
+            bool: True if the round is stale, False otherwise.
+        """
+
+        return submitted[0] != list(solution.weights.values()) \
+            or submitted[1] != list(solution.inputs.values())
+
+    def discard(self: 'Portfolio', submitted: Round) -> None:
+        """This method discards a submitted round, cancelling the variants 
+        that have not started yet.
+
+        Args:
+            submitted (Round): The submitted round.
+        """
+
+        for future in submitted[2]: future.cancel()
+        self._discarded += 1
+
+    def collect(self: 'Portfolio', submitted: Round) -> Objective:
+        """This method waits for the variants of a submitted round and 
+        returns the objective of the best one.
+
+        Args:
+            submitted (Round): The submitted round.
+
+        Returns:
+            Tuple[Optional[float], Dict[str, List[float]], Dict[str, List[float]]]:
+                The objective of the best variant, as returned by
+                LinModel.resolve().
+        """
+
+        variants: List[Variant] = [future.result() for future in submitted[2]]
+        best: Variant = min(variants, key=lambda variant: variant[0])
+
+        # the variants are solved concurrently, so the slowest one is waited
+        self._model.time += max(variant[2] for variant in variants)
+        self._model.backend.status = best[3]
+
+        return best[1]
+
+    def close(self: 'Portfolio') -> None:
+        """This method stops the worker processes, if they were started."""
+
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    # region simple getters and setters
+    @property
+    def problem(self: 'Portfolio') -> Problem:
+        """Problem: The problem reference."""
+        return self._problem
+
+    @problem.setter
+    def problem(self: 'Portfolio', value: Problem) -> None:
+        self._problem = value
+
+    @property
+    def model(self: 'Portfolio') -> LinModel:
+        """LinModel: The linear model of the main process."""
+        return self._model
+
+    @model.setter
+    def model(self: 'Portfolio', value: LinModel) -> None:
+        self._model = value
+
+    @property
+    def size(self: 'Portfolio') -> int:
+        """int: The number of variants of each round."""
+        return self._size
+
+    @size.setter
+    def size(self: 'Portfolio', value: int) -> None:
+        self._size = value
+
+    @property
+    def workers(self: 'Portfolio') -> int:
+        """int: The number of worker processes."""
+        return self._workers
+
+    @workers.setter
+    def workers(self: 'Portfolio', value: int) -> None:
+        self._workers = value
+
+    @property
+    def discarded(self: 'Portfolio') -> int:
+        """int: The number of submitted rounds discarded for being stale."""
+        return self._discarded
+
+
+def prepare(
+    problem: Problem, 
+    backend: Backend, 
+    reduce: bool, 
+    fixed_point: bool
+) -> None:
+    """This function initializes a worker process with its own linear model,
+    built as the one of the main process, and its own solution.
+
+    Args:
+        problem (Problem): The problem reference.
+        backend (Backend): The solver backend of the main process.
+        reduce (bool): True if the linear model of the main process is 
+            reduced by the presolve.
+        fixed_point (bool): True if the times of the schedule must be
+            represented as integer hundredths of the time unit.
+    """
+    global worker
+
+    # the workers would overwrite each other's .lp file
+    model: LinModel = LinModel(problem, backend, reduce)
+    model.log = False
+
+    worker = (model, Solution(problem, fixed_point))
+
+
+def evaluate(
+    weights: List[List[float]], 
+    inputs: List[List[float]], 
+    seed: int,
+    rank: bool = True
+) -> Variant:
+    """This function solves a variant in a worker process and evaluates it
+    with the constructive.
+
+    Args:
+        weights (List[List[float]]): The reclaimed weights of the feedback.
+        inputs (List[List[float]]): The stacked weights of the feedback.
+        seed (int): The random seed of the weights of this variant.
+        rank (bool): False to skip the constructive, whose cost is only 
+            needed to rank the variants. Defaults to True.
+
+    Returns:
+        Tuple[float, Objective, float, str]: The cost of the constructive
+            solution (infinite if the model has no solution or zero if it is 
+            not ranked), the objective of
+            the linear model, the wall time of its resolution and its status.
+    """
+    model, solution = worker
+
+    model.rng = random.Random(seed)
+    model.add_weights('x', weights)
+    model.add_weights('y', inputs)
+
+    model.time = 0.0
+    objective: Objective = model.resolve()
+    if objective[0] is None:
+        return float('inf'), objective, model.time, model.status
+
+    if not rank: return 0.0, objective, model.time, model.status
+
+    solution.set_objective(objective)
+    PostModel(solution.problem, solution).run()
+
+    return solution.cost, objective, model.time, model.status
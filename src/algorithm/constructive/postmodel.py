@@ -4,7 +4,7 @@ from model.classes import Engine
 from model.problem import Problem
 from model.solution import Solution
 from heapq import heapify, heappop
-from typing import List
+from typing import List, Union
 
 class PostModel(Constructive):
     """This class contains simple constructive procedures for the Machine
@@ -86,29 +86,34 @@ class PostModel(Constructive):
         """
 
         # list to indicate whether the machine has already visited the stockpile
+        # (the stockpiles out of its rail are never visited)
         visited: List[bool] = [
-            False for stp in self._problem.stockpiles 
-            if engine.rail in stp.rails
+            engine.rail not in stp.rails for stp in self._problem.stockpiles
         ]
 
         # list with machine routes and variable with its starting position
         route: Route = []
         pos: int = engine.pos_ini
 
+        # the attributes read by every step of the route
+        e: int = engine.id - 1
+        speed_reclaim: float = engine.speed_reclaim
+        speed_stack: float = engine.speed_stack
+        weights: List[float] = self._weights[self._output_id]
+
         while not all(visited):
             try:
     
-                faster: float
+                faster: Union[int, float]
                 pos: int
 
                 # finds the stockpile with the shortest access time
+                # (the stockpiles out of its rail are already visited)
                 faster, pos = min(
-                    (time_travel + start_time[engine.id - 1], i)
+                    (time_travel + start_time[e], i)
                     for i, (time_travel, is_visited)
-                    in enumerate(zip(self._problem.time_travel[pos], visited))
-                    if self._weights[self._output_id][i] > 0 
-                        and is_visited is False
-                        and engine.rail in self._problem.stockpiles[i].rails
+                    in enumerate(zip(self._time_travel[pos], visited))
+                    if weights[i] > 0 and is_visited is False
                 )
 
                 # indicates which activity will be performed by the machine
@@ -116,30 +121,28 @@ class PostModel(Constructive):
                 atv: str = 'r'
 
                 # calculates the duration of the job in the stockpile
-                duration: float = round(
-                    self._weights[self._output_id][pos] / engine.speed_reclaim, 
-                    1
-                ) if engine.speed_reclaim > 0 else 0
+                duration: Union[int, float] = self.to_time(
+                    weights[pos] / speed_reclaim, 1
+                ) if speed_reclaim > 0 else 0
 
                 # if the machine needs to perform the stacking activity
                 if self._inputs[pos] > 0:
-                    setup_time: float = self._problem.time_travel[pos][pos] \
-                        if engine.speed_reclaim > 0 else 0
+                    setup_time: Union[int, float] = self._time_travel[pos][pos] \
+                        if speed_reclaim > 0 else 0
 
-                    duration += round(
-                        self._inputs[pos] / engine.speed_stack, 1
-                    ) + setup_time if engine.speed_stack > 0 else 0
+                    duration += self.to_time(
+                        self._inputs[pos] / speed_stack, 1
+                    ) + setup_time if speed_stack > 0 else 0
 
-                    atv = 's' if engine.speed_stack > 0 else atv
-                    atv = 'b' if engine.speed_reclaim > 0 \
-                        and engine.speed_stack > 0 else atv
+                    atv = 's' if speed_stack > 0 else atv
+                    atv = 'b' if speed_reclaim > 0 and speed_stack > 0 else atv
 
                 if duration > 0:
                     # updates the start time list with the operating time
-                    start_time[engine.id - 1] += duration + faster
+                    start_time[e] += duration + faster
 
                     # adds data to the referenced engine's route list
-                    route.append((faster, engine.id, pos, atv))
+                    route.append((faster, e + 1, pos, atv))
 
                 visited[pos] = True
 
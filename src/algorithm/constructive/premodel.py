@@ -5,7 +5,7 @@ from model.classes import Engine
 from model.problem import Problem
 from model.solution import Solution
 from heapq import heapify, heappop
-from typing import List
+from typing import List, Union
 
 class PreModel(Constructive):
     """This class contains simple constructive procedures for the Machine
@@ -97,14 +97,14 @@ class PreModel(Constructive):
         while not all(visited):
             try:
     
-                faster: float
+                faster: Union[int, float]
                 pos: int
 
                 # finds the stockpile with the shortest access time
                 faster, pos = min(
                     (time_travel + start_time[engine.id - 1], i)
                     for i, (time_travel, is_visited)
-                    in enumerate(zip(self._problem.time_travel[pos], visited))
+                    in enumerate(zip(self._time_travel[pos], visited))
                     if is_visited is False and engine.rail 
                     in self._problem.stockpiles[i].rails
                 )
@@ -0,0 +1,571 @@
+from config import Inputs, Outputs, Objective, Routes, Jobs
+from model.classes import Input, Output, Quality, Request
+from model.problem import Problem
+from model.solution import Solution
+from .constructive import Constructive
+from .insertion import Times, job_times, route_times, best_insertion, \
+    can_perform
+from .linmodel import LinModel
+from typing import List, Dict, Tuple, Union, Any, Optional
+import ujson
+
+
+class Delta:
+    """This class represents a Delta of a Problem, i.e. the changes known at a
+    given time of the operation: the inputs (trains) and outputs (ship
+    orders) that arrive or are cancelled and the stockpiles whose weights
+    were measured again.
+
+    A delta can be loaded from a .json file whose keys are 'time', 'inputs'
+    and 'outputs' (in the same format of the instance file), 'removedInputs'
+    and 'removedOutputs' (lists of identifiers) and 'weights' (a list of
+    objects with the 'id' of a stockpile and its new 'weight'), all of them
+    optional.
+    """
+
+    def __init__(
+        self: 'Delta',
+        time: float = 0.0,
+        inputs: Optional[Inputs] = None,
+        outputs: Optional[Outputs] = None,
+        removed_inputs: Optional[List[int]] = None,
+        removed_outputs: Optional[List[int]] = None,
+        weights: Optional[Dict[int, float]] = None
+    ):
+        """Instantiates a new Delta.
+
+        Args:
+            time (float): The time of the changes, in the time unit of the
+                solution file. The jobs started before it are kept as they
+                are and the engines are released for the others at it, after
+                their started jobs. Defaults to 0.0.
+            inputs (Optional[Inputs]): The inputs that arrive. Defaults to
+                None.
+            outputs (Optional[Outputs]): The outputs that arrive. Defaults to
+                None.
+            removed_inputs (Optional[List[int]]): The identifiers of the
+                cancelled inputs. Defaults to None.
+            removed_outputs (Optional[List[int]]): The identifiers of the
+                cancelled outputs. Defaults to None.
+            weights (Optional[Dict[int, float]]): The new weight of each
+                stockpile, by its identifier. Defaults to None.
+        """
+
+        self._time: float = time
+        self._inputs: Inputs = inputs if inputs is not None else []
+        self._outputs: Outputs = outputs if outputs is not None else []
+        self._removed_inputs: List[int] = removed_inputs \
+            if removed_inputs is not None else []
+        self._removed_outputs: List[int] = removed_outputs \
+            if removed_outputs is not None else []
+        self._weights: Dict[int, float] = weights if weights is not None else {}
+
+    @staticmethod
+    def load(delta_path: Union[str, Dict[str, Any]]) -> 'Delta':
+        """This method loads a Delta from a .json file.
+
+        Args:
+            delta_path (Union[str, Dict[str, Any]]): The delta file path or
+                the delta data already loaded, with the same structure of the
+                .json file.
+
+        Returns:
+            Delta: The loaded delta.
+        """
+
+        if isinstance(delta_path, str):
+            with open(delta_path, 'r') as file:
+                data = ujson.load(file)
+
+        else:
+            data = delta_path
+
+        return Delta(
+            data.get('time', 0.0),
+            [
+                Input(
+                    inp['id'],
+                    inp['weight'],
+                    [Quality(*q.values()) for q in inp['quality']],
+                    inp['time']
+                ) for inp in data.get('inputs', [])
+            ],
+            [
+                Output(
+                    out['id'],
+                    out['destination'],
+                    out['weight'],
+                    [Request(*q.values()) for q in out['quality']],
+                    out['time']
+                ) for out in data.get('outputs', [])
+            ],
+            data.get('removedInputs', []),
+            data.get('removedOutputs', []),
+            {stp['id']: stp['weight'] for stp in data.get('weights', [])}
+        )
+
+    # region simple getters and setters
+    @property
+    def time(self: 'Delta') -> float:
+        """float: The time of the changes."""
+        return self._time
+
+    @time.setter
+    def time(self: 'Delta', value: float) -> None:
+        self._time = value
+
+    @property
+    def inputs(self: 'Delta') -> Inputs:
+        """List[Input]: The inputs that arrive."""
+        return self._inputs
+
+    @inputs.setter
+    def inputs(self: 'Delta', value: Inputs) -> None:
+        self._inputs = value
+
+    @property
+    def outputs(self: 'Delta') -> Outputs:
+        """List[Output]: The outputs that arrive."""
+        return self._outputs
+
+    @outputs.setter
+    def outputs(self: 'Delta', value: Outputs) -> None:
+        self._outputs = value
+
+    @property
+    def removed_inputs(self: 'Delta') -> List[int]:
+        """List[int]: The identifiers of the cancelled inputs."""
+        return self._removed_inputs
+
+    @removed_inputs.setter
+    def removed_inputs(self: 'Delta', value: List[int]) -> None:
+        self._removed_inputs = value
+
+    @property
+    def removed_outputs(self: 'Delta') -> List[int]:
+        """List[int]: The identifiers of the cancelled outputs."""
+        return self._removed_outputs
+
+    @removed_outputs.setter
+    def removed_outputs(self: 'Delta', value: List[int]) -> None:
+        self._removed_outputs = value
+
+    @property
+    def weights(self: 'Delta') -> Dict[int, float]:
+        """Dict[int, float]: The new weight of each stockpile, by its
+        identifier."""
+        return self._weights
+
+    @weights.setter
+    def weights(self: 'Delta', value: Dict[int, float]) -> None:
+        self._weights = value
+
+
+class Replanner:
+    """This class replans a Solution when a Delta of its Problem arrives,
+    instead of solving the changed problem from scratch. The linear model is
+    changed in place, so that its backend starts from the previous resolution
+    whenever it can (e.g. CBC keeps the basis of the model), the jobs already
+    started are fixed in it and the routes of the engines are repaired
+    locally: the started jobs are kept, the jobs left without ore are dropped
+    and the new ones are inserted where their engine finishes its reclaims
+    first, as in the repair of the LNS. The engines are released for the jobs
+    not started only at the time of the delta.
+
+    As in the constructive, the schedule covers the request of its output_id,
+    which is the last one after a complete run. The identifiers of the inputs
+    and outputs are their positions in the problem, so they are renumbered
+    after a removal and the arriving ones receive the next identifiers.
+    """
+
+    def __init__(
+        self: 'Replanner',
+        problem: Problem,
+        model: LinModel,
+        constructive: Constructive
+    ):
+        """Instantiates a new Replanner.
+
+        Args:
+            problem (Problem): The problem reference, which is changed by each
+                delta.
+            model (LinModel): The linear model of the problem.
+            constructive (Constructive): The constructive that built the
+                solutions to be replanned.
+        """
+
+        self._problem: Problem = problem
+        self._model: LinModel = model
+        self._constructive: Constructive = constructive
+
+    def replan(self: 'Replanner', solution: Solution, delta: Delta) -> Solution:
+        """This method applies a delta to the problem and replans a solution.
+        If the changed linear model has no solution, the objective of the
+        solution is None and its schedule is left as it was.
+
+        Args:
+            solution (Solution): The solution to be replanned, which is
+                changed in place.
+            delta (Delta): The changes of the problem.
+
+        Returns:
+            Solution: The replanned solution.
+        """
+
+        k: int = self._constructive.output_id \
+            if self._constructive.output_id is not None \
+            else len(self._problem.outputs) - 1
+
+        started: List[int] = self.__started(solution, delta.time)
+
+        # the ore already moved by the started jobs, by the variable indexes
+        reclaimed: Dict[Tuple[int, int], float] = {}
+        stacked: Dict[Tuple[int, int], float] = {}
+
+        weights: List[List[float]] = list(solution.weights.values())
+        inputs: List[List[float]] = list(solution.inputs.values())
+
+        for route, count in zip(solution.routes, started):
+            for stp, atv in route[:count]:
+                if atv == 'r' or atv == 'b':
+                    reclaimed[stp, k] = weights[k][stp]
+
+                if atv == 's' or atv == 'b':
+                    for h, value in enumerate(inputs[stp]):
+                        stacked[h, stp] = value
+
+        self._model.release()
+
+        # if the output of the schedule is cancelled, the last one is scheduled
+        cancelled: bool = False
+
+        # the cancelled outputs and inputs, from the last to the first
+        for id in sorted(delta.removed_outputs, reverse=True):
+            r: int = self.__position(self._problem.outputs, id)
+
+            assert r != k or not reclaimed, \
+                'trying to cancel an output whose jobs have already started.'
+
+            del self._problem.outputs[r]
+            self._model.remove_output(r)
+
+            if r < len(self._constructive.positions):
+                del self._constructive.positions[r]
+
+            if r < k: k -= 1
+            elif r == k: cancelled = True
+
+            reclaimed = {(i, s - 1 if s > r else s): value
+                         for (i, s), value in reclaimed.items()}
+
+        for id in sorted(delta.removed_inputs, reverse=True):
+            h: int = self.__position(self._problem.inputs, id)
+
+            assert not any(
+                value > 0 for (g, _), value in stacked.items() if g == h
+            ), 'trying to cancel an input whose ore has already been stacked.'
+
+            del self._problem.inputs[h]
+            self._model.remove_input(h)
+
+            stacked = {(g - 1 if g > h else g, i): value
+                       for (g, i), value in stacked.items() if g != h}
+
+        for inp in delta.inputs:
+            self._problem.inputs.append(inp)
+            self._model.add_input()
+
+        for out in delta.outputs:
+            self._problem.outputs.append(out)
+            self._model.add_output()
+
+            positions: List[List[int]] = self._constructive.positions
+            if positions: positions.append(list(positions[-1]))
+
+        for id, weight in delta.weights.items():
+            i: int = self.__position(self._problem.stockpiles, id)
+
+            self._problem.stockpiles[i].weight_ini = weight
+            self._model.update_stockpile(i)
+
+            # a started reclaim is cut short if the stockpile no longer has it
+            available: float = weight + sum(
+                value for (_, s), value in stacked.items() if s == i
+            )
+
+            for key in reclaimed:
+                if key[0] == i: reclaimed[key] = min(reclaimed[key], available)
+
+        if cancelled: k = len(self._problem.outputs) - 1
+
+        # the identifiers are the positions of the inputs and outputs
+        for h, inp in enumerate(self._problem.inputs): inp.id = h + 1
+        for r, out in enumerate(self._problem.outputs): out.id = r + 1
+
+        self._problem.reset_matrices()
+        solution.gap = [1] * len(self._problem.outputs)
+
+        for key, value in reclaimed.items(): self._model.fix('x', key, value)
+        for key, value in stacked.items(): self._model.fix('y', key, value)
+
+        objective: Objective = self._model.resolve()
+        solution.set_objective(objective)
+
+        if objective[0] is None or not self._problem.outputs: return solution
+
+        self._constructive.output_id = k
+        self._constructive.solution = solution
+        self._constructive.weights = list(solution.weights.values())
+        self._constructive.reset_inputs()
+
+        # the engines finish their started jobs before the next ones, which 
+        # can not start before the changes are known
+        self._constructive.release = [
+            (count, self._constructive.to_time(delta.time)) 
+            for count in started
+        ]
+
+        self.__repair(solution, started)
+
+        # the schedule is built again from the repaired routes
+        self._constructive.run(True)
+
+        return solution
+
+    def __started(self: 'Replanner', solution: Solution, time: float) -> List[int]:
+        """This method finds the jobs already started at the given time. Since
+        the jobs of each engine are executed in the order of its route, the
+        started ones are the first of the route.
+
+        Args:
+            solution (Solution): The solution reference.
+            time (float): The time, in the time unit of the solution file.
+
+        Returns:
+            List[int]: The number of started jobs in the route of each engine.
+        """
+
+        started: List[int] = []
+
+        for eng, route in zip(self._problem.engines, solution.routes):
+            stacks: Jobs = [
+                job for job in solution.stacks if job['engine'] == eng.id
+            ]
+
+            reclaims: Jobs = [
+                job for job in solution.reclaims if job['engine'] == eng.id
+            ]
+
+            count: int = 0
+            for atv in (atv for _, atv in route):
+                begin: float = float('inf')
+
+                # the stacking is performed before the reclaiming
+                if (atv == 's' or atv == 'b') and stacks:
+                    begin = stacks.pop(0)['start_time']
+
+                if (atv == 'r' or atv == 'b') and reclaims:
+                    begin = min(begin, reclaims.pop(0)['start_time'])
+
+                if solution.to_time(begin) >= time: break
+                count += 1
+
+            started.append(count)
+
+        return started
+
+    def __repair(
+        self: 'Replanner',
+        solution: Solution,
+        started: List[int]
+    ) -> None:
+        """This method repairs the routes of the engines with the new weights
+        of the solution, which must have been given to the constructive. The
+        started jobs are kept, the activities left without ore are dropped
+        and each missing one is inserted in the route and position in which
+        its engine finishes its reclaims first.
+
+        Args:
+            solution (Solution): The solution reference.
+            started (List[int]): The number of started jobs in the route of
+                each engine.
+        """
+
+        constructive: Constructive = self._constructive
+        weights: List[float] = constructive.weights[constructive.output_id]
+        inputs: List[float] = constructive.inputs
+
+        routes: Routes = solution.routes
+        for e, route in enumerate(routes):
+            repaired: List[Tuple[int, str]] = route[:started[e]]
+
+            for stp, atv in route[started[e]:]:
+                atv = activity(
+                    (atv == 'r' or atv == 'b') and weights[stp] > 0,
+                    (atv == 's' or atv == 'b') and inputs[stp] > 0
+                )
+
+                if atv != '': repaired.append((stp, atv))
+
+            routes[e] = repaired
+
+        reclaimed: List[bool] = [False] * len(weights)
+        stacked: List[bool] = [False] * len(weights)
+        for route in routes:
+            for stp, atv in route:
+                reclaimed[stp] = reclaimed[stp] or atv == 'r' or atv == 'b'
+                stacked[stp] = stacked[stp] or atv == 's' or atv == 'b'
+
+        positions: List[int] = self.__positions()
+
+        # the times of each route, updated whenever it receives a job
+        times: List[Times] = [
+            route_times(constructive, eng, route, pos)
+            for eng, route, pos in zip(self._problem.engines, routes, positions)
+        ]
+
+        for stp in range(len(weights)):
+            for kind, missing in (('s', inputs[stp] > 0 and not stacked[stp]),
+                                  ('r', weights[stp] > 0 and not reclaimed[stp])):
+                if missing: 
+                    self.__insert(routes, started, times, positions, stp, kind)
+
+    def __insert(
+        self: 'Replanner',
+        routes: Routes,
+        started: List[int],
+        times: List[Times],
+        positions: List[int],
+        stp: int,
+        kind: str
+    ) -> None:
+        """This method inserts an activity in the route and position in which
+        its engine finishes its reclaims first, among the engines that can 
+        perform it, after the started jobs. If the engine already performs 
+        the other activity in the stockpile, both are merged.
+
+        Args:
+            routes (Routes): The routes of the engines.
+            started (List[int]): The number of started jobs in the route of
+                each engine.
+            times (List[Times]): The times of each route, as calculated by 
+                route_times(), updated with the insertion.
+            positions (List[int]): The position of each engine when the 
+                request of the schedule begins.
+            stp (int): The index of the stockpile.
+            kind (str): The activity, 'r' to reclaim or 's' to stack.
+        """
+
+        constructive: Constructive = self._constructive
+
+        best: Optional[Tuple[float, int, List[Tuple[int, str]]]] = None
+        for e, (eng, route) in enumerate(zip(self._problem.engines, routes)):
+            if not can_perform(self._problem, eng, stp, kind): continue
+
+            # the activity is merged if the stockpile is already in the route
+            merge: List[int] = [
+                p for p in range(started[e], len(route)) if route[p][0] == stp
+            ]
+
+            repaired: List[Tuple[int, str]] = list(route)
+            finish: float
+
+            if merge:
+                atv: str = route[merge[0]][1]
+                repaired[merge[0]] = (stp, 'b' if atv != kind else atv)
+
+                finish = max(0, route_times(
+                    constructive, eng, repaired, positions[e]
+                )[2][0])
+
+            else:
+                finish, p = best_insertion(
+                    times[e],
+                    job_times(constructive, eng, stp, kind, positions[e]),
+                    started[e]
+                )
+
+                repaired.insert(p, (stp, kind))
+
+            if best is None or finish < best[0]: best = (finish, e, repaired)
+
+        if best is None: return
+
+        _, e, repaired = best
+        routes[e][:] = repaired
+        times[e] = route_times(
+            constructive, self._problem.engines[e], repaired, positions[e]
+        )
+
+    def __positions(self: 'Replanner') -> List[int]:
+        """This method finds the position of each engine when the request of
+        the schedule begins.
+
+        Returns:
+            List[int]: The position of each engine.
+        """
+
+        k: Optional[int] = self._constructive.output_id
+        positions: List[List[int]] = self._constructive.positions
+
+        if k is not None and k < len(positions): return positions[k]
+        return [eng.pos_ini for eng in self._problem.engines]
+
+    def __position(self: 'Replanner', items: List[Any], id: int) -> int:
+        """This method finds the position of an item by its identifier.
+
+        Args:
+            items (List[Any]): The items, e.g. the inputs of the problem.
+            id (int): The identifier of the item.
+
+        Returns:
+            int: The position of the item.
+        """
+
+        for position, item in enumerate(items):
+            if item.id == id: return position
+
+        raise ValueError(f'there is no item with the identifier {id}.')
+
+    # region simple getters and setters
+    @property
+    def problem(self: 'Replanner') -> Problem:
+        """Problem: The problem reference."""
+        return self._problem
+
+    @problem.setter
+    def problem(self: 'Replanner', value: Problem) -> None:
+        self._problem = value
+
+    @property
+    def model(self: 'Replanner') -> LinModel:
+        """LinModel: The linear model of the problem."""
+        return self._model
+
+    @model.setter
+    def model(self: 'Replanner', value: LinModel) -> None:
+        self._model = value
+
+    @property
+    def constructive(self: 'Replanner') -> Constructive:
+        """Constructive: The constructive of the solutions."""
+        return self._constructive
+
+    @constructive.setter
+    def constructive(self: 'Replanner', value: Constructive) -> None:
+        self._constructive = value
+
+
+def activity(reclaim: bool, stack: bool) -> str:
+    """This function returns the activity of a job.
+
+    Args:
+        reclaim (bool): True if the job reclaims ore.
+        stack (bool): True if the job stacks ore.
+
+    Returns:
+        str: 'b' for both, 'r' to reclaim, 's' to stack or '' for none.
+    """
+    if reclaim and stack: return 'b'
+    if reclaim: return 'r'
+    return 's' if stack else ''
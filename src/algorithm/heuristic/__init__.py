@@ -1,5 +1,13 @@
 # import the classes so that the directory works as a module
 
+from .elite import ElitePool
 from .heuristic import Heuristic
 from .sa import SA
-from .lahc import LAHC
\ No newline at end of file
+from .lahc import LAHC
+from .tabu import TabuSearch
+from .vnd import VND
+from .lns import LNS
+from .tempering import ParallelTempering
+from .relinking import PathRelinking
+from .memetic import Memetic
+from .exact import Exact
\ No newline at end of file
@@ -0,0 +1,121 @@
+from config import Routes
+from .payload import encode, decode
+from typing import Dict, Tuple, Any
+import numpy as np
+import tempfile
+import os
+
+
+def write_checkpoint(file_path: str, arrays: Dict[str, np.ndarray]) -> None:
+    """This function writes a checkpoint in a compressed binary .npz file
+    and, for that, the NumPy package is required. The file is written
+    atomically, i.e. the content is written to a temporary file in the same
+    directory that then replaces the checkpoint, so that a run interrupted
+    while writing still has its previous checkpoint.
+
+    Args:
+        file_path (str): The checkpoint file path.
+        arrays (Dict[str, np.ndarray]): The arrays to be saved, by name.
+    """
+    directory: str = os.path.dirname(file_path) or '.'
+    os.makedirs(directory, exist_ok=True)
+
+    fd, temp_path = tempfile.mkstemp(dir=directory, prefix='.', suffix='.tmp')
+
+    try:
+        with os.fdopen(fd, 'wb') as file:
+            np.savez_compressed(file, **arrays)
+
+        os.replace(temp_path, file_path)
+
+    except BaseException:
+        os.remove(temp_path)
+        raise
+
+
+def read_checkpoint(file_path: str) -> Dict[str, np.ndarray]:
+    """This function reads a checkpoint written by write_checkpoint().
+
+    Args:
+        file_path (str): The checkpoint file path.
+
+    Returns:
+        Dict[str, np.ndarray]: The saved arrays, by name.
+    """
+    with np.load(file_path) as data:
+        return {name: data[name] for name in data.files}
+
+
+def pack_routes(routes: Routes) -> Tuple[np.ndarray, np.ndarray]:
+    """This function packs the routes in two integer arrays.
+
+    Args:
+        routes (List[List[Tuple[int, str]]]): The routes of a solution.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: The encoded jobs of every route, one
+            after the other, and the length of each route.
+    """
+    payload = encode(routes)
+
+    return (
+        np.fromiter((job for route in payload for job in route), np.int64),
+        np.fromiter((len(route) for route in payload), np.int64)
+    )
+
+
+def unpack_routes(jobs: np.ndarray, lengths: np.ndarray) -> Routes:
+    """This function unpacks the routes packed by pack_routes().
+
+    Args:
+        jobs (np.ndarray): The encoded jobs of every route.
+        lengths (np.ndarray): The length of each route.
+
+    Returns:
+        List[List[Tuple[int, str]]]: The routes of a solution.
+    """
+    ends: np.ndarray = np.cumsum(lengths)
+
+    return decode([
+        tuple(int(job) for job in jobs[end - length:end])
+        for end, length in zip(ends, lengths)
+    ])
+
+
+def pack_random(state: Tuple[Any, ...]) -> Dict[str, np.ndarray]:
+    """This function packs the state of a Mersenne Twister generator, as
+    returned by random.getstate(), in arrays.
+
+    Args:
+        state (Tuple[Any, ...]): The generator state.
+
+    Returns:
+        Dict[str, np.ndarray]: The version, the internal state and the next
+            gaussian value (NaN if there is none) of the generator.
+    """
+    return {
+        'random_version': np.array([state[0]], np.int64),
+        'random_state': np.array(state[1], np.uint32),
+        'random_gauss': np.array(
+            [np.nan if state[2] is None else state[2]], np.float64
+        )
+    }
+
+
+def unpack_random(arrays: Dict[str, np.ndarray]) -> Tuple[Any, ...]:
+    """This function unpacks the generator state packed by pack_random(),
+    so that it can be restored by random.setstate().
+
+    Args:
+        arrays (Dict[str, np.ndarray]): The checkpoint arrays.
+
+    Returns:
+        Tuple[Any, ...]: The generator state.
+    """
+    gauss: float = float(arrays['random_gauss'][0])
+
+    return (
+        int(arrays['random_version'][0]),
+        tuple(int(value) for value in arrays['random_state']),
+        None if np.isnan(gauss) else gauss
+    )
@@ -0,0 +1,163 @@
+from config import Routes
+from model.solution import Solution
+from typing import List, Set, FrozenSet
+import bisect
+import copy
+
+class ElitePool:
+    """This class represents a bounded pool of elite solutions, sorted by
+    cost, which keeps the best solutions found while preserving their
+    diversity.
+
+    Each solution is represented by the hashes of its attributes, i.e. of the
+    jobs along with their engine and position, so that the distance between
+    two solutions is the number of jobs placed differently, obtained from the
+    symmetric difference of their hashes. A solution too close to an elite
+    only replaces it if it is better, so that the pool does not collapse to a
+    single region of the search space.
+    """
+
+    def __init__(self: 'ElitePool', size: int = 10, diversity: float = 0.1):
+        """Instantiates a new ElitePool.
+
+        Args:
+            size (int): The maximum number of elite solutions. Defaults to 10.
+            diversity (float): The minimum distance between two elite
+                solutions, as a fraction of the number of jobs. Defaults to
+                0.1.
+        """
+
+        self._size: int = size
+        self._diversity: float = diversity
+
+        # the elite solutions, their costs and their hashed attributes
+        self._solutions: List[Solution] = []
+        self._costs: List[float] = []
+        self._attributes: List[FrozenSet[int]] = []
+        self._hashes: Set[int] = set()
+
+    def add(self: 'ElitePool', solution: Solution) -> bool:
+        """This method offers a solution to the pool, which keeps a copy of it
+        if it is good and diverse enough.
+
+        Args:
+            solution (Solution): The solution to be offered.
+
+        Returns:
+            bool: True if the solution became an elite one, False otherwise.
+        """
+
+        # most of the offered solutions are discarded before hashing them
+        if len(self._solutions) >= self._size and \
+           solution.cost >= self._costs[-1]:
+            return False
+
+        attributes: FrozenSet[int] = self.attributes(solution.routes)
+        key: int = hash(attributes)
+        if key in self._hashes: return False
+
+        threshold: float = max(1, self._diversity * len(attributes))
+        distances: List[int] = [
+            self.distance(attributes, other) for other in self._attributes
+        ]
+        close: List[int] = [
+            i for i, distance in enumerate(distances) if distance < threshold
+        ]
+
+        # a close solution only replaces the closest elite, if it is better
+        if close:
+            i: int = min(close, key=lambda i: distances[i])
+            if solution.cost >= self._costs[i]: return False
+            self.__remove(i)
+
+        elif len(self._solutions) >= self._size:
+            self.__remove(len(self._solutions) - 1)
+
+        i = bisect.bisect_right(self._costs, solution.cost)
+        self._solutions.insert(i, copy.deepcopy(solution))
+        self._costs.insert(i, solution.cost)
+        self._attributes.insert(i, attributes)
+        self._hashes.add(key)
+
+        return True
+
+    def attributes(self: 'ElitePool', routes: Routes) -> FrozenSet[int]:
+        """This method hashes the attributes of the routes, i.e. each job
+        along with its engine and its position.
+
+        Args:
+            routes (List[List[Tuple[int, str]]]): The routes of a solution.
+
+        Returns:
+            FrozenSet[int]: The set of hashed attributes.
+        """
+
+        return frozenset(
+            hash((job, e, pos))
+            for e, route in enumerate(routes)
+            for pos, job in enumerate(route)
+        )
+
+    def distance(
+        self: 'ElitePool',
+        attributes_1: FrozenSet[int],
+        attributes_2: FrozenSet[int]
+    ) -> int:
+        """This method calculates the distance between two solutions, i.e.
+        the number of jobs placed differently in them.
+
+        Args:
+            attributes_1 (FrozenSet[int]): The hashed attributes of the first
+                solution.
+            attributes_2 (FrozenSet[int]): The hashed attributes of the second
+                solution.
+
+        Returns:
+            int: The distance between the solutions.
+        """
+
+        return len(attributes_1 ^ attributes_2) // 2
+
+    def __remove(self: 'ElitePool', i: int) -> None:
+        """This method removes an elite solution from the pool. It is called
+        within add() and there is no need to use it afterwards.
+
+        Args:
+            i (int): The index of the elite solution.
+        """
+
+        self._hashes.discard(hash(self._attributes[i]))
+
+        del self._solutions[i]
+        del self._costs[i]
+        del self._attributes[i]
+
+    # region simple getters and setters
+    @property
+    def size(self: 'ElitePool') -> int:
+        """int: The maximum number of elite solutions."""
+        return self._size
+
+    @size.setter
+    def size(self: 'ElitePool', value: int) -> None:
+        self._size = value
+
+    @property
+    def diversity(self: 'ElitePool') -> float:
+        """float: The minimum distance between two elite solutions, as a
+        fraction of the number of jobs.
+        """
+        return self._diversity
+
+    @diversity.setter
+    def diversity(self: 'ElitePool', value: float) -> None:
+        self._diversity = value
+
+    @property
+    def solutions(self: 'ElitePool') -> List[Solution]:
+        """List[Solution]: The elite solutions, from the best to the worst."""
+        return self._solutions
+
+    @solutions.setter
+    def solutions(self: 'ElitePool', value: List[Solution]) -> None:
+        self._solutions = value
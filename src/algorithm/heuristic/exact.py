@@ -0,0 +1,281 @@
+from algorithm.constructive import Constructive, Backend, CBC
+from config import Travels
+from model.problem import Problem
+from model.solution import Solution
+from .heuristic import Heuristic
+from mip import Model, Var, BINARY, MINIMIZE, xsum
+from typing import List, Dict, Tuple, Optional
+import copy
+
+
+class Exact(Heuristic):
+    """This class is an exact method for the Machine Scheduling Problem of
+    small instances, which solves a Mixed Integer Program of the schedule
+    built by the constructive for its output_id with the Python-MIP package.
+
+    The jobs are the ones of the initial routes, as in the neighborhoods of
+    the heuristics, i.e. a stockpile keeps being reclaimed ('r'), stacked
+    ('s') or both ('b') by a single job. Since every job of a route is
+    reached from the position of the engine at the beginning of the output
+    and there is no precedence between engines, the makespan only depends on
+    the jobs with a reclaim assigned to each engine and on their order, as
+    long as the stacks come after them. The program assigns each of these
+    jobs to an engine on a rail of its stockpile, minimizing the time of the
+    engine that finishes last, and its solution is turned into routes with
+    the reclaims followed by the stacks, each one in the engine that is free
+    first among the ones that can perform it.
+
+    The search starts from the routes of the initial solution and, if the time
+    limit of the backend is reached, the best routes found and the lower bound
+    of the program are kept, so that the makespan is bounded even if it is not
+    certified as optimal.
+    """
+
+    def __init__(
+        self: 'Exact',
+        problem: Problem,
+        constructive: Constructive,
+        backend: Optional[Backend] = None
+    ):
+        """Instantiates a new Exact method.
+
+        Args:
+            problem (Problem): The problem reference.
+            constructive (Constructive): The constructive procedure, used to
+                evaluate the solutions.
+            backend (Optional[Backend]): The solver backend, with its time
+                limit and relative gap, which must solve integer programs, or
+                None to use CBC. Defaults to None.
+        """
+
+        super().__init__(problem, 'Exact')
+
+        self.__constructive: Constructive = constructive
+        self.__backend: Backend = backend if backend is not None else CBC()
+
+        # status and lower bound of the last resolution
+        self.__status: str = ''
+        self.__lower: float = 0.0
+
+    def run(
+        self: 'Exact',
+        initial_solution: Solution,
+        max_iters: int,
+        best_known: bool = False,
+        time_limit: Optional[float] = None
+    ) -> None:
+        """Executes the Exact method and updates the best solution.
+
+        Args:
+            initial_solution (Solution): The initial (input) solution, whose
+                routes are the starting point of the search.
+            max_iters (int): Ignored, since the search is only limited by the
+                time limit.
+            best_known (bool): True if the initial best_solution have already
+                been established, False otherwise. Note that the False option
+                will define the initial best_solution as the initial_solution.
+                Defaults to False.
+            time_limit (Optional[float]): The maximum time, in seconds, to
+                execute or None to keep the time limit of the backend. Defaults
+                to None.
+        """
+
+        if not best_known:
+            self._best_solution = initial_solution
+
+        solution: Solution = copy.deepcopy(initial_solution)
+
+        k: int = self.__constructive.output_id
+        weights: List[float] = self.__constructive.weights[k]
+        inputs: List[float] = list(self.__constructive.inputs)
+
+        positions: List[int] = self.__constructive.positions[k] \
+            if k < len(self.__constructive.positions) \
+            else [eng.pos_ini for eng in self._problem.engines]
+
+        travel: Travels = self.__constructive.time_travel
+        jobs: List[int] = [i for i, weight in enumerate(weights) if weight > 0]
+
+        # the stockpiles stacked and reclaimed by the same job and the 
+        # stacks, with the engine of each one
+        both: List[bool] = [False] * len(weights)
+        stacks: List[Tuple[int, int]] = []
+
+        for e, route in enumerate(solution.routes):
+            for stp, atv in route:
+                if atv == 'b' and weights[stp] > 0: both[stp] = True
+                elif atv == 's' or atv == 'b': stacks.append((e, stp))
+
+        # the time of each reclaim in each engine that can perform it, 
+        # preceded by the stack if the job also stacks the ore
+
+        times: Dict[Tuple[int, int], float] = {
+            (e, i): self.__time(e, positions[e], i, weights[i], inputs[i], 
+                                both[i], travel)
+            for e, eng in enumerate(self._problem.engines) for i in jobs
+            if eng.speed_reclaim > 0 and (eng.speed_stack > 0 or not both[i])
+                and eng.rail in self._problem.stockpiles[i].rails
+        }
+
+        # the setup between the stack and the reclaim of a job only delays 
+        # its own reclaim, so the jobs of a route are sorted by decreasing 
+        # setup, which minimizes the time of the engine (Jackson's rule)
+        setup: List[float] = [
+            travel[i][i] if both[i] else 0.0 for i in range(len(weights))
+        ]
+        jobs.sort(key=lambda i: (-setup[i], i))
+
+        self.__status = 'infeasible'
+        self.__lower = 0.0
+
+        if not jobs or any(
+            all((e, i) not in times for e in range(len(positions)))
+            for i in jobs
+        ):
+            return
+
+        omp: Model = Model(name='Exact', sense=MINIMIZE, solver_name='CBC')
+        x: Dict[Tuple[int, int], Var] = {
+            (e, i): omp.add_var(name=f'x_{e}_{i}', var_type=BINARY)
+            for e, i in times
+        }
+
+        # the makespan starts from the lower bound, if there is one
+        makespan: Var = omp.add_var(
+            name='makespan',
+            lb=self._bound.compute() if self._bound is not None else 0.0
+        )
+
+        for i in jobs:
+            omp += xsum(
+                var for (_, j), var in x.items() if j == i
+            ) == 1, f'assign_{i}'
+
+        for e in range(len(positions)):
+            omp += xsum(
+                times[e, i] * var for (f, i), var in x.items() if f == e
+            ) <= makespan, f'engine_{e}'
+
+            # the end of each reclaim whose stack precedes it
+            for n, i in enumerate(jobs):
+                if setup[i] <= 0 or (e, i) not in x: continue
+
+                omp += xsum(
+                    times[e, j] * x[e, j] for j in jobs[:n + 1] if (e, j) in x
+                ) + setup[i] * x[e, i] <= makespan, f'setup_{e}_{i}'
+
+        omp.objective = makespan
+
+        # the reclaims of the initial routes, if they assign every stockpile
+        start: Dict[int, int] = {
+            stp: e for e, route in enumerate(solution.routes)
+            for stp, atv in route
+            if (atv == 'r' or atv == 'b') and (e, stp) in x
+        }
+
+        if len(start) == len(jobs):
+            omp.start = [(x[e, i], 1.0) for i, e in start.items()]
+
+        limit: float = self.__backend.time_limit
+        if time_limit is not None: self.__backend.time_limit = time_limit
+
+        try: objective, values = self.__backend.solve(omp)
+        finally: self.__backend.time_limit = limit
+
+        self.__status = self.__backend.status
+        self.__lower = max(omp.objective_bound, makespan.lb)
+        if objective is None: return
+
+        for route in solution.routes: route.clear()
+
+        # the time in which each engine is free, after its reclaims
+        free: List[float] = [0.0] * len(positions)
+        for i in jobs:
+            for e in range(len(positions)):
+                if (e, i) in x and values[x[e, i].idx] > 0.5:
+                    solution.routes[e].append((i, 'b' if both[i] else 'r'))
+                    free[e] += times[e, i]
+
+        for engine, i in stacks:
+            stack: Dict[int, float] = {
+                e: travel[positions[e]][i]
+                    + self.__constructive.to_time(inputs[i] / eng.speed_stack)
+                for e, eng in enumerate(self._problem.engines)
+                if eng.speed_stack > 0
+                    and eng.rail in self._problem.stockpiles[i].rails
+            }
+
+            # a stack no engine can perform is kept where it was
+            if stack: engine = min(stack, key=lambda e: free[e])
+
+            solution.routes[engine].append((i, 's'))
+            free[engine] += stack.get(engine, 0.0)
+
+        self.__constructive.solution = solution
+        self.__constructive.run(True)
+
+        solution.mip_status = self.__status
+        solution.mip_bound = self.__lower
+
+        if solution.cost <= self._best_solution.cost:
+            self._best_solution = solution
+
+    def __time(
+        self: 'Exact',
+        e: int,
+        pos: int,
+        i: int,
+        weight: float,
+        stacked: float,
+        both: bool,
+        travel: Travels
+    ) -> float:
+        """This method calculates the time a job takes in an engine, as in 
+        the build() of the constructive, without the setup between its stack 
+        and its reclaim.
+
+        Args:
+            e (int): The index of the engine.
+            pos (int): The position of the engine.
+            i (int): The index of the stockpile.
+            weight (float): The weight reclaimed from the stockpile.
+            stacked (float): The weight stacked on the stockpile.
+            both (bool): True if the job also stacks the ore, False otherwise.
+            travel (List[List[float]]): The travel times.
+
+        Returns:
+            float: The time from the start of the job to the start of the 
+                next one.
+        """
+
+        speed_stack: float = self._problem.engines[e].speed_stack
+        speed_reclaim: float = self._problem.engines[e].speed_reclaim
+
+        time: float = travel[pos][i] \
+            + self.__constructive.to_time(weight / speed_reclaim)
+
+        if both: time += self.__constructive.to_time(stacked / speed_stack)
+
+        return time
+
+    # region simple getters and setters
+    @property
+    def backend(self: 'Exact') -> Backend:
+        """Backend: The solver backend."""
+        return self.__backend
+
+    @backend.setter
+    def backend(self: 'Exact', value: Backend) -> None:
+        self.__backend = value
+
+    @property
+    def status(self: 'Exact') -> str:
+        """str: The status of the last resolution, e.g. 'optimal' or
+        'feasible', or 'infeasible' if some reclaim has no engine."""
+        return self.__status
+
+    @property
+    def lower(self: 'Exact') -> float:
+        """float: The lower bound of the makespan of the last resolution, in
+        the time representation of the solution."""
+        return self.__lower
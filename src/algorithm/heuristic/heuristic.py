@@ -1,8 +1,17 @@
 from algorithm.neighborhood import Move
+from algorithm.constructive import LowerBound
+from config import Routes
 from model.problem import Problem
 from model.solution import Solution
-from typing import List, Optional
+from .elite import ElitePool
+from .checkpoint import write_checkpoint, read_checkpoint, pack_routes, \
+    unpack_routes, pack_random, unpack_random
+from typing import List, Dict, Optional, Any
+import numpy as np
+import threading
 import random
+import copy
+import time
 
 
 class Heuristic:
@@ -25,9 +34,31 @@ class Heuristic:
         self._name: str = name
 
         self._moves: List[Move] = []
+
+        # random stream of the heuristic, shared with its moves
+        self._rng: random.Random = random.Random(0)
         self._best_solution: Optional[Solution] = None
         self._iters: int = 0
 
+        # cooperative interruption, by cancellation or by the time budget
+        self._cancel_event: threading.Event = threading.Event()
+        self._deadline: Optional[float] = None
+
+        # elite pool fed with the improving solutions, if there is one
+        self._elite: Optional[ElitePool] = None
+
+        # periodic checkpoints of the current run and the one to be resumed
+        self._checkpoint: str = ''
+        self._every: int = int(1e3)
+        self._resume: str = ''
+        self._steps: int = 0
+
+        # lower bound of the makespan and the cost at which a run stops, 
+        # since no solution can improve on it
+        self._bound: Optional[LowerBound] = None
+        self._tolerance: float = 0.0
+        self._target: float = -float('inf')
+
     def add_move(self: 'Heuristic', move: Move) -> None:
         """This method adds a move to the heuristic.
         
@@ -35,6 +66,7 @@ class Heuristic:
             move (int): The move to be added.
         """
 
+        move.rng = self._rng
         self._moves.append(move)
     
     def accept_move(self: 'Heuristic', move: Move) -> None:
@@ -55,24 +87,182 @@ class Heuristic:
 
         move.reject()
 
-    def select_move(self: 'Heuristic', solution: Solution) -> Move:
+    def offer(self: 'Heuristic', solution: Solution) -> None:
+        """This method offers an improving solution to the elite pool, if 
+        there is one.
+
+        Args:
+            solution (Solution): The solution to be offered.
+        """
+
+        if self._elite is not None: self._elite.add(solution)
+
+    def step(self: 'Heuristic', solution: Solution, state: Dict[str, Any]) -> None:
+        """This method counts an iteration of the current run and, whenever 
+        the checkpoint interval is reached, writes a checkpoint with the 
+        current and the best routes, the state of the random generator, the 
+        move statistics and the given state of the heuristic.
+
+        Args:
+            solution (Solution): The current solution.
+            state (Dict[str, Any]): The state of the heuristic, by name, which 
+                is returned by restore() when the run is resumed.
+        """
+
+        self._steps += 1
+
+        if self._checkpoint == '' or self._every <= 0 \
+        or self._steps % self._every != 0:
+            return
+
+        current_jobs, current_lengths = pack_routes(solution.routes)
+        best_jobs, best_lengths = pack_routes(self._best_solution.routes)
+
+        arrays: Dict[str, np.ndarray] = {
+            'steps': np.array([self._steps], np.int64),
+            'current_jobs': current_jobs,
+            'current_lengths': current_lengths,
+            'best_jobs': best_jobs,
+            'best_lengths': best_lengths,
+            'moves': np.array([
+                [move.iters, move.improvements, move.sideways, move.worsens, 
+                 move.rejects] for move in self._moves
+            ], np.int64).reshape(-1, 5),
+            **pack_random(self._rng.getstate())
+        }
+
+        for name, value in state.items():
+            arrays[f'state_{name}'] = np.asarray(value)
+
+        write_checkpoint(self._checkpoint, arrays)
+
+    def restore(
+        self: 'Heuristic', 
+        solution: Solution
+    ) -> Optional[Dict[str, np.ndarray]]:
+        """This method starts the iteration count of a run and, if there is 
+        a checkpoint to be resumed, restores the run as it was when the 
+        checkpoint was written. The current and the best solutions are 
+        evaluated again from their routes, while the state of the random 
+        generator, the move statistics and the iteration count are restored. 
+        A checkpoint is only resumed once.
+
+        Args:
+            solution (Solution): The current solution, which receives the 
+                current routes of the checkpoint.
+
+        Returns:
+            Optional[Dict[str, np.ndarray]]: The state of the heuristic, by 
+                name, or None if there is no checkpoint to be resumed.
+        """
+
+        self._steps = 0
+        if self._resume == '': return None
+
+        arrays: Dict[str, np.ndarray] = read_checkpoint(self._resume)
+        self._resume = ''
+
+        # the current solution is the last one evaluated, as in the run
+        best: Solution = copy.deepcopy(solution)
+        for target, name in ((best, 'best'), (solution, 'current')):
+            routes: Routes = unpack_routes(
+                arrays[f'{name}_jobs'], arrays[f'{name}_lengths']
+            )
+            for e, route in enumerate(routes):
+                target.routes[e][:] = route
+
+            self._moves[0].constructive.solution = target
+            self._moves[0].constructive.run(True)
+
+        self._best_solution = best
+
+        for move, statistics in zip(self._moves, arrays['moves'].tolist()):
+            move.iters, move.improvements, move.sideways, move.worsens, \
+                move.rejects = statistics
+
+        self._rng.setstate(unpack_random(arrays))
+        self._steps = int(arrays['steps'][0])
+
+        return {
+            name[len('state_'):]: value for name, value in arrays.items() 
+            if name.startswith('state_')
+        }
+
+    def cancel(self: 'Heuristic') -> None:
+        """This method requests the interruption of the heuristic, which stops 
+        at the end of the current iteration keeping its best solution. It can 
+        be called from another thread.
+        """
+
+        self._cancel_event.set()
+
+    def set_time_limit(self: 'Heuristic', time_limit: Optional[float]) -> None:
+        """This method starts the time budget of an execution.
+
+        Args:
+            time_limit (Optional[float]): The maximum time, in seconds, from 
+                now on or None if there is no time limit.
+        """
+
+        self._deadline = None if time_limit is None \
+            else time.time() + time_limit
+
+    def interrupted(self: 'Heuristic') -> bool:
+        """This method checks if the heuristic must stop, i.e. if it was 
+        cancelled or if its time budget is exhausted.
+
+        Returns:
+            bool: True if the heuristic must stop, False otherwise.
+        """
+
+        return self._cancel_event.is_set() or \
+            (self._deadline is not None and time.time() >= self._deadline)
+
+    def set_target(self: 'Heuristic') -> None:
+        """This method starts the target cost of an execution, i.e. the lower 
+        bound of the makespan for the current weights of the constructive, 
+        relaxed by the tolerance, or no target if there is no lower bound.
+        """
+
+        self._target = -float('inf') if self._bound is None \
+            else self._bound.compute() * (1 + self._tolerance)
+
+    def reached(self: 'Heuristic') -> bool:
+        """This method checks if the best solution has reached the target 
+        cost, in which case the heuristic must stop.
+
+        Returns:
+            bool: True if the best solution has reached the target, False 
+                otherwise.
+        """
+
+        return self._best_solution.cost <= self._target
+
+    def select_move(self: 'Heuristic', solution: Solution) -> Optional[Move]:
         """This method selects a move.
 
         Args:
             solution (Solution): The solution.
 
         Returns:
-            Move: a randomly selected move (neighborhood).
+            Optional[Move]: a randomly selected move (neighborhood) or None if 
+                no neighborhood could be applied to the solution.
         """
 
         size: int = len(self._moves)
 
-        move: Move = self._moves[random.randrange(0, size)]
+        move: Move = self._moves[self._rng.randrange(0, size)]
         move.gen_move(solution)
 
+        attempts: int = 1
         while not move.has_move(solution):
-            move = self._moves[(random.randrange(0, size))]
+
+            # e.g. when every engine has a single job there is no neighbor
+            if attempts == int(1e3): return None
+
+            move = self._moves[(self._rng.randrange(0, size))]
             move.gen_move(solution)
+            attempts += 1
 
         return move
 
@@ -104,6 +294,16 @@ class Heuristic:
     def moves(self: 'Heuristic', value: List[Move]) -> None:
         self._moves = value
     
+    @property
+    def rng(self: 'Heuristic') -> random.Random:
+        """random.Random: The random stream of the heuristic and its moves."""
+        return self._rng
+
+    @rng.setter
+    def rng(self: 'Heuristic', value: random.Random) -> None:
+        self._rng = value
+        for move in self._moves: move.rng = value
+
     @property
     def best_solution(self: 'Heuristic') -> Optional[Solution]:
         """Optional[Solution]: Best solution found by the heuristic."""
@@ -121,3 +321,94 @@ class Heuristic:
     @iters.setter
     def iters(self: 'Heuristic', value: int) -> None:
         self._iters = value
+
+    @property
+    def elite(self: 'Heuristic') -> Optional[ElitePool]:
+        """Optional[ElitePool]: Elite pool fed with the improving solutions."""
+        return self._elite
+
+    @elite.setter
+    def elite(self: 'Heuristic', value: Optional[ElitePool]) -> None:
+        self._elite = value
+
+    @property
+    def checkpoint(self: 'Heuristic') -> str:
+        """str: Path of the checkpoint file or '' if there are no 
+        checkpoints."""
+        return self._checkpoint
+
+    @checkpoint.setter
+    def checkpoint(self: 'Heuristic', value: str) -> None:
+        self._checkpoint = value
+
+    @property
+    def every(self: 'Heuristic') -> int:
+        """int: Number of iterations between the checkpoints."""
+        return self._every
+
+    @every.setter
+    def every(self: 'Heuristic', value: int) -> None:
+        self._every = value
+
+    @property
+    def resume(self: 'Heuristic') -> str:
+        """str: Path of the checkpoint to be resumed by the next run or '' 
+        if there is none."""
+        return self._resume
+
+    @resume.setter
+    def resume(self: 'Heuristic', value: str) -> None:
+        self._resume = value
+
+    @property
+    def steps(self: 'Heuristic') -> int:
+        """int: Number of iterations of the current run."""
+        return self._steps
+
+    @steps.setter
+    def steps(self: 'Heuristic', value: int) -> None:
+        self._steps = value
+
+    @property
+    def bound(self: 'Heuristic') -> Optional[LowerBound]:
+        """Optional[LowerBound]: Lower bound of the makespan at which the 
+        heuristic stops or None if it never stops before its budget."""
+        return self._bound
+
+    @bound.setter
+    def bound(self: 'Heuristic', value: Optional[LowerBound]) -> None:
+        self._bound = value
+
+    @property
+    def tolerance(self: 'Heuristic') -> float:
+        """float: Relative tolerance over the lower bound of the makespan 
+        within which the heuristic stops."""
+        return self._tolerance
+
+    @tolerance.setter
+    def tolerance(self: 'Heuristic', value: float) -> None:
+        self._tolerance = value
+
+    @property
+    def target(self: 'Heuristic') -> float:
+        """float: Cost at which the current execution stops."""
+        return self._target
+
+    @property
+    def cancel_event(self: 'Heuristic') -> threading.Event:
+        """threading.Event: Event that, once set, interrupts the heuristic."""
+        return self._cancel_event
+
+    @cancel_event.setter
+    def cancel_event(self: 'Heuristic', value: threading.Event) -> None:
+        self._cancel_event = value
+
+    @property
+    def deadline(self: 'Heuristic') -> Optional[float]:
+        """Optional[float]: Time, since the epoch, in which the current 
+        execution must stop or None if there is no time limit."""
+        return self._deadline
+
+    @deadline.setter
+    def deadline(self: 'Heuristic', value: Optional[float]) -> None:
+        self._deadline = value
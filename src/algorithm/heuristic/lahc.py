@@ -2,7 +2,8 @@ from algorithm.neighborhood import Move
 from model.problem import Problem
 from model.solution import Solution
 from .heuristic import Heuristic
-from typing import List
+from typing import List, Dict, Optional
+import numpy as np
 import copy
 
 class LAHC(Heuristic):
@@ -28,7 +29,8 @@ class LAHC(Heuristic):
         self: 'LAHC', 
         initial_solution: Solution,
         max_iters: int,
-        best_known: bool = False
+        best_known: bool = False,
+        time_limit: Optional[float] = None
     ) -> None:
         """Executes the Late Acceptance Hill-Climbing and updates the best 
         solution. 
@@ -40,8 +42,13 @@ class LAHC(Heuristic):
                 been established, False otherwise. Note that the False option 
                 will define the initial best_solution as the initial_solution. 
                 Defaults to False.
+            time_limit (Optional[float]): The maximum time, in seconds, to 
+                execute or None if there is no time limit. Defaults to None.
         """
 
+        self.set_time_limit(time_limit)
+        self.set_target()
+
         # list of costs for each solution
         cost_list: List[float] = [
             initial_solution.cost * 1.5 for _ in range(self.__size)
@@ -55,14 +62,28 @@ class LAHC(Heuristic):
         # cost list index
         v: int = 0
 
-        for _ in range(max_iters):
-            move: Move = self.select_move(solution)
+        self._iters = 0
+        state: Optional[Dict[str, np.ndarray]] = self.restore(solution)
+        if state is not None:
+            cost_list = state['cost_list'].tolist()
+            v = int(state['v'])
+            self._iters = self._steps
+
+        while self._iters < max_iters:
+            if self.interrupted() or self.reached(): break
+
+            move: Optional[Move] = self.select_move(solution)
+            if move is None: break
+
             move.do_move(solution)
 
             if (solution.cost <= move.initial_cost or 
                 solution.cost <= cost_list[v]):
                 self.accept_move(move)
 
+                if solution.cost < move.initial_cost:
+                    self.offer(solution)
+
                 if solution.cost < self._best_solution.cost:
                     self._best_solution = copy.deepcopy(solution)
 
@@ -72,6 +93,9 @@ class LAHC(Heuristic):
             cost_list[v] = solution.cost
             v = (v + 1) % self.__size
 
+            self._iters += 1
+            self.step(solution, {'cost_list': cost_list, 'v': v})
+
     # region simple getters and setters
     @property
     def size(self: 'LAHC') -> int:
@@ -0,0 +1,287 @@
+from algorithm.constructive import Constructive
+from algorithm.constructive.insertion import Times, job_times, route_times, \
+    best_insertion, can_perform
+from model.classes import Engine
+from model.problem import Problem
+from model.solution import Solution
+from .heuristic import Heuristic
+from typing import List, Dict, Set, Tuple, Optional
+import copy
+
+# a removed job, with the index of the engine that performed it
+Removed = List[Tuple[int, Tuple[int, str]]]
+
+class LNS(Heuristic):
+    """This class is a Large Neighborhood Search implementation. At each
+    iteration, a destroy operator removes several jobs from the routes, which
+    are then reinserted by a repair operator while the rest of the routes stay
+    fixed, and the new solution is evaluated only once.
+
+    The destroy operators remove the jobs of the critical engine (the one that
+    finishes last), the jobs of a random yard or the jobs of a random subset of
+    stockpiles. The repair operator inserts each job at the position of the 
+    routes in which its engine finishes its reclaims first, following the 
+    greedy logic of the PostModel constructive, in which the job with the 
+    shortest finish time is assigned first, or a regret based variant, in 
+    which the job that would lose the most by not being assigned to its best 
+    engine is assigned first.
+    """
+
+    def __init__(
+        self: 'LNS',
+        problem: Problem,
+        constructive: Constructive,
+        size: int = 3,
+        regret: bool = False
+    ):
+        """Instantiates a new Large Neighborhood Search.
+
+        Args:
+            problem (Problem): The problem reference.
+            constructive (Constructive): The constructive procedure, used to
+                evaluate the solutions.
+            size (int): The number of stockpiles whose jobs are removed by the
+                random destroy operator. Defaults to 3.
+            regret (bool): True for the regret based repair operator, False
+                for the greedy one. Defaults to False.
+        """
+
+        super().__init__(problem, 'Large Neighborhood Search')
+
+        self.__constructive: Constructive = constructive
+        self.__size: int = size
+        self.__regret: bool = regret
+
+    def run(
+        self: 'LNS',
+        initial_solution: Solution,
+        max_iters: int,
+        best_known: bool = False,
+        time_limit: Optional[float] = None
+    ) -> None:
+        """Executes the Large Neighborhood Search and updates the best
+        solution.
+
+        Args:
+            initial_solution (Solution): The initial (input) solution.
+            max_iters (int): The maximum number of iterations to execute.
+            best_known (bool): True if the initial best_solution have already
+                been established, False otherwise. Note that the False option
+                will define the initial best_solution as the initial_solution.
+                Defaults to False.
+            time_limit (Optional[float]): The maximum time, in seconds, to
+                execute or None if there is no time limit. Defaults to None.
+        """
+
+        self.set_time_limit(time_limit)
+
+        if not best_known:
+            self._best_solution = initial_solution
+
+        solution: Solution = copy.deepcopy(initial_solution)
+        self.__constructive.solution = solution
+
+        self._iters = 0
+        while self._iters < max_iters:
+            if self.interrupted(): break
+
+            self._iters += 1
+
+            routes: List[List[Tuple[int, str]]] = [
+                list(route) for route in solution.routes
+            ]
+            cost: float = solution.cost
+
+            removed: Removed = self._rng.choice([
+                self.__destroy_engine, self.__destroy_yard, self.__destroy_random
+            ])(solution)
+
+            if not removed: continue
+
+            self.__repair(solution, removed)
+            self.__constructive.run(True)
+
+            if solution.cost <= cost:
+                if solution.cost < self._best_solution.cost:
+                    self._best_solution = copy.deepcopy(solution)
+
+            # the previous routes are restored
+            else:
+                for e, route in enumerate(routes):
+                    solution.routes[e][:] = route
+
+                self.__constructive.run(True)
+
+    def __remove(
+        self: 'LNS',
+        solution: Solution,
+        stockpiles: List[int]
+    ) -> Removed:
+        """This method removes the jobs of the given stockpiles from the
+        routes. It is called within the destroy operators and there is no need
+        to use it afterwards.
+
+        Args:
+            solution (Solution): The current solution.
+            stockpiles (List[int]): The stockpile indexes.
+
+        Returns:
+            List[Tuple[int, Tuple[int, str]]]: List with the removed jobs and
+                the index of the engine that performed each one.
+        """
+
+        selected: Set[int] = set(stockpiles)
+        removed: Removed = []
+
+        for e, route in enumerate(solution.routes):
+            removed += [(e, job) for job in route if job[0] in selected]
+            route[:] = [job for job in route if job[0] not in selected]
+
+        return removed
+
+    def __destroy_engine(self: 'LNS', solution: Solution) -> Removed:
+        """This method removes the jobs of the critical engine, i.e. the one
+        that finishes last. It is called within run() and there is no need to
+        use it afterwards.
+
+        Args:
+            solution (Solution): The current solution.
+
+        Returns:
+            List[Tuple[int, Tuple[int, str]]]: List with the removed jobs and
+                the index of the engine that performed each one.
+        """
+
+        e: int = max(
+            range(len(solution.routes)), key=lambda i: solution.start_time[i]
+        )
+
+        return self.__remove(solution, [stp for stp, _ in solution.routes[e]])
+
+    def __destroy_yard(self: 'LNS', solution: Solution) -> Removed:
+        """This method removes the jobs of the stockpiles of a random yard. It
+        is called within run() and there is no need to use it afterwards.
+
+        Args:
+            solution (Solution): The current solution.
+
+        Returns:
+            List[Tuple[int, Tuple[int, str]]]: List with the removed jobs and
+                the index of the engine that performed each one.
+        """
+
+        yard: int = self._rng.choice(
+            sorted({stp.yard for stp in self._problem.stockpiles})
+        )
+
+        return self.__remove(solution, [
+            i for i, stp in enumerate(self._problem.stockpiles)
+            if stp.yard == yard
+        ])
+
+    def __destroy_random(self: 'LNS', solution: Solution) -> Removed:
+        """This method removes the jobs of a random subset of stockpiles. It is
+        called within run() and there is no need to use it afterwards.
+
+        Args:
+            solution (Solution): The current solution.
+
+        Returns:
+            List[Tuple[int, Tuple[int, str]]]: List with the removed jobs and
+                the index of the engine that performed each one.
+        """
+
+        stockpiles: List[int] = sorted(
+            {stp for route in solution.routes for stp, _ in route}
+        )
+
+        return self.__remove(solution, self._rng.sample(
+            stockpiles, min(self.__size, len(stockpiles))
+        ))
+
+    def __repair(self: 'LNS', solution: Solution, removed: Removed) -> None:
+        """This method reinserts the removed jobs in the routes, one at a 
+        time, by the greedy or the regret criterion. The insertion cost of a 
+        job in an engine is the time in which the engine would finish its 
+        reclaims, with the job in the best position of its route, evaluated as 
+        in the build() of the constructive. It is called within run() and 
+        there is no need to use it afterwards.
+
+        Args:
+            solution (Solution): The current solution.
+            removed (List[Tuple[int, Tuple[int, str]]]): List with the removed
+                jobs and the index of the engine that performed each one.
+        """
+
+        engines: List[Engine] = self._problem.engines
+        constructive: Constructive = self.__constructive
+
+        # the engines start where the current output request begins
+        start: List[int] = constructive.positions[constructive.output_id] \
+            if constructive.output_id < len(constructive.positions) \
+            else [eng.pos_ini for eng in engines]
+
+        # the times of each route, updated whenever it receives a job
+        times: List[Times] = [
+            route_times(constructive, eng, route, pos) 
+            for eng, route, pos in zip(engines, solution.routes, start)
+        ]
+
+        pending: Dict[Tuple[int, str], int] = {job: e for e, job in removed}
+
+        while pending:
+            choice: Optional[Tuple[float, Tuple[int, str], int, int]] = None
+
+            for job, origin in pending.items():
+                costs: List[Tuple[float, int, int]] = sorted(
+                    best_insertion(
+                        times[e], job_times(constructive, eng, *job, start[e])
+                    ) + (e,)
+                    for e, eng in enumerate(engines)
+                    if can_perform(self._problem, eng, *job)
+                ) or [(0.0, len(solution.routes[origin]), origin)]
+
+                # greedy: the shortest finish time is the smallest criterion
+                # regret: the largest loss is the smallest (negative) criterion
+                criterion: float = costs[0][0] if not self.__regret else \
+                    -(costs[1][0] - costs[0][0] if len(costs) > 1
+                      else float('inf'))
+
+                if choice is None or criterion < choice[0]:
+                    choice = (criterion, job, costs[0][2], costs[0][1])
+
+            _, job, e, position = choice
+            del pending[job]
+
+            solution.routes[e].insert(position, job)
+            times[e] = route_times(
+                constructive, engines[e], solution.routes[e], start[e]
+            )
+
+    # region simple getters and setters
+    @property
+    def constructive(self: 'LNS') -> Constructive:
+        """Constructive: The constructive procedure."""
+        return self.__constructive
+
+    @constructive.setter
+    def constructive(self: 'LNS', value: Constructive) -> None:
+        self.__constructive = value
+
+    @property
+    def size(self: 'LNS') -> int:
+        """int: The number of stockpiles removed by the random operator."""
+        return self.__size
+
+    @size.setter
+    def size(self: 'LNS', value: int) -> None:
+        self.__size = value
+
+    @property
+    def regret(self: 'LNS') -> bool:
+        """bool: True for the regret based repair, False for the greedy one."""
+        return self.__regret
+
+    @regret.setter
+    def regret(self: 'LNS', value: bool) -> None:
+        self.__regret = value
@@ -0,0 +1,379 @@
+from algorithm.constructive import Constructive
+from algorithm.neighborhood import Move
+from config import Routes, Payload
+from model.classes import Engine
+from model.problem import Problem
+from model.solution import Solution
+from .heuristic import Heuristic
+from .payload import encode, decode
+from .worker import prepare, load
+from concurrent.futures import ProcessPoolExecutor, Future
+from typing import List, Dict, Set, Tuple, Optional
+import math
+import copy
+import os
+
+# an individual of the population: its cost and its route payload
+Individual = Tuple[float, Payload]
+
+class Memetic(Heuristic):
+    """This class is a Memetic Algorithm implementation, i.e. a genetic
+    algorithm whose offspring are improved by a local search. The genome of an
+    individual is its routes, the parents are chosen by binary tournaments and
+    the population is replaced by the best distinct individuals among the
+    parents and their offspring.
+
+    The crossover keeps the routes of a random subset of engines of the first
+    parent and places the remaining jobs in the order of the second parent,
+    preferably on the same engines, but only on engines whose rail reaches the
+    stockpile and that are able to perform the activity. The offspring are
+    mutated, improved by the moves and evaluated in worker processes, to which
+    they travel as route payloads.
+    """
+
+    def __init__(
+        self: 'Memetic',
+        problem: Problem,
+        population: int = 20,
+        mutation: int = 2,
+        local: int = 10,
+        workers: Optional[int] = None
+    ):
+        """Instantiates a new Memetic Algorithm.
+
+        Args:
+            problem (Problem): The problem reference.
+            population (int): The number of individuals. Defaults to 20.
+            mutation (int): The number of random moves applied to each
+                offspring. Defaults to 2.
+            local (int): The number of iterations of the local search applied
+                to each offspring. Defaults to 10.
+            workers (Optional[int]): The number of worker processes or None to
+                use one per core. Defaults to None.
+        """
+
+        super().__init__(problem, 'Memetic Algorithm')
+
+        self.__population: int = population
+        self.__mutation: int = mutation
+        self.__local: int = local
+        self.__workers: int = workers if workers is not None \
+            else os.cpu_count() or 1
+
+    def run(
+        self: 'Memetic',
+        initial_solution: Solution,
+        max_iters: int,
+        best_known: bool = False,
+        time_limit: Optional[float] = None
+    ) -> None:
+        """Executes the Memetic Algorithm and updates the best solution.
+
+        Args:
+            initial_solution (Solution): The initial (input) solution.
+            max_iters (int): The maximum number of offspring to evaluate.
+            best_known (bool): True if the initial best_solution have already
+                been established, False otherwise. Note that the False option
+                will define the initial best_solution as the initial_solution.
+                Defaults to False.
+            time_limit (Optional[float]): The maximum time, in seconds, to
+                execute or None if there is no time limit. Defaults to None.
+        """
+
+        self.set_time_limit(time_limit)
+
+        if not best_known:
+            self._best_solution = initial_solution
+
+        # the offspring all start as mutations of the initial solution, so 
+        # none of them changes if no neighborhood applies to it
+        if self.select_move(initial_solution) is None: return
+
+        initial: Payload = encode(initial_solution.routes)
+
+        with ProcessPoolExecutor(
+            max_workers=self.__workers,
+            initializer=prepare,
+            initargs=(initial_solution, self._moves)
+        ) as pool:
+
+            # the initial population is made of mutations of the solution
+            population: List[Individual] = [(initial_solution.cost, initial)]
+            population += self.__evaluate(
+                pool, [initial] * (self.__population - 1)
+            )
+            population = self.__select(population)
+
+            self._iters = 0
+            while self._iters < max_iters:
+                if self.interrupted(): break
+
+                size: int = min(self.__population, max_iters - self._iters)
+
+                offspring: List[Payload] = [
+                    self.__crossover(
+                        decode(self.__tournament(population)),
+                        decode(self.__tournament(population))
+                    ) for _ in range(size)
+                ]
+
+                evaluated: List[Individual] = self.__evaluate(pool, offspring)
+                selected: List[Individual] = self.__select(
+                    population + evaluated
+                )
+
+                self._iters += size
+
+                # if the moves changed no offspring and the population did 
+                # not change either, the next generations would repeat it
+                unchanged: bool = all(
+                    individual[1] == payload 
+                    for individual, payload in zip(evaluated, offspring)
+                )
+
+                if unchanged and selected == population: break
+                population = selected
+
+        if not population or population[0][0] >= self._best_solution.cost:
+            return
+
+        # the best individual is evaluated again in this process
+        solution: Solution = copy.deepcopy(initial_solution)
+        for e, route in enumerate(decode(population[0][1])):
+            solution.routes[e][:] = route
+
+        constructive: Constructive = self._moves[0].constructive
+        constructive.solution = solution
+        constructive.run(True)
+
+        # the constructive keeps working on the copy, as in the other methods
+        if solution.cost < self._best_solution.cost:
+            self._best_solution = copy.deepcopy(solution)
+
+    def __evaluate(
+        self: 'Memetic',
+        pool: ProcessPoolExecutor,
+        payloads: List[Payload]
+    ) -> List[Individual]:
+        """This method mutates, improves and evaluates the offspring in the
+        worker processes. It is called within run() and there is no need to
+        use it afterwards.
+
+        Args:
+            pool (ProcessPoolExecutor): The pool of worker processes.
+            payloads (List[Payload]): The route payloads of the offspring.
+
+        Returns:
+            List[Tuple[float, Payload]]: The evaluated offspring.
+        """
+
+        futures: List[Future] = [
+            pool.submit(
+                evolve, payload, self.__mutation, self.__local,
+                self._rng.randrange(2 ** 32), self._deadline
+            ) for payload in payloads
+        ]
+
+        return [future.result() for future in futures]
+
+    def __select(
+        self: 'Memetic',
+        individuals: List[Individual]
+    ) -> List[Individual]:
+        """This method selects the best distinct individuals, which form the
+        next population. It is called within run() and there is no need to
+        use it afterwards.
+
+        Args:
+            individuals (List[Tuple[float, Payload]]): The candidates.
+
+        Returns:
+            List[Tuple[float, Payload]]: The population, from the best to the
+                worst individual.
+        """
+
+        population: List[Individual] = []
+        seen: Set[Tuple[Tuple[int, ...], ...]] = set()
+
+        for cost, payload in sorted(individuals, key=lambda item: item[0]):
+            key: Tuple[Tuple[int, ...], ...] = tuple(payload)
+            if key in seen or math.isinf(cost): continue
+
+            seen.add(key)
+            population.append((cost, payload))
+
+            if len(population) == self.__population: break
+
+        return population
+
+    def __tournament(self: 'Memetic', population: List[Individual]) -> Payload:
+        """This method chooses a parent by a binary tournament. It is called
+        within run() and there is no need to use it afterwards.
+
+        Args:
+            population (List[Tuple[float, Payload]]): The population.
+
+        Returns:
+            Payload: The route payload of the parent.
+        """
+
+        return min(self._rng.choices(population, k=2), key=lambda item: item[0])[1]
+
+    def __crossover(self: 'Memetic', first: Routes, second: Routes) -> Payload:
+        """This method combines two parents. The routes of a random subset of
+        engines are copied from the first parent and the remaining activities
+        are placed in the order of the second one. It is called within run()
+        and there is no need to use it afterwards.
+
+        Args:
+            first (List[List[Tuple[int, str]]]): The routes of the first
+                parent.
+            second (List[List[Tuple[int, str]]]): The routes of the second
+                parent.
+
+        Returns:
+            Payload: The route payload of the offspring.
+        """
+
+        engines: List[Engine] = self._problem.engines
+        kept: List[bool] = [self._rng.random() < 0.5 for _ in engines]
+
+        child: Routes = [
+            list(route) if keep else [] for route, keep in zip(first, kept)
+        ]
+
+        # activities already performed on each stockpile, 'r' and 's'
+        done: Dict[int, Set[str]] = {}
+        for route in child:
+            for stp, atv in route:
+                done.setdefault(stp, set()).update('rs' if atv == 'b' else atv)
+
+        for e, route in enumerate(second):
+            for stp, atv in route:
+                needed: Set[str] = set('rs' if atv == 'b' else atv) - \
+                    done.get(stp, set())
+                if not needed: continue
+
+                job: Tuple[int, str] = \
+                    (stp, 'b' if len(needed) == 2 else needed.pop())
+
+                # the job stays on the same engine, if its route is open
+                target: int = e
+                if kept[e]:
+                    eligible: List[int] = [
+                        f for f, eng in enumerate(engines)
+                        if not kept[f] and self.__can_perform(eng, *job)
+                    ]
+
+                    if eligible:
+                        target = min(eligible, key=lambda f: len(child[f]))
+
+                child[target].append(job)
+                done.setdefault(stp, set()).update(
+                    'rs' if job[1] == 'b' else job[1]
+                )
+
+        return encode(child)
+
+    def __can_perform(self: 'Memetic', eng: Engine, stp: int, atv: str) -> bool:
+        """This method checks if an engine can perform a job, i.e. if it runs
+        on a rail of the stockpile and has the required speeds. It is called
+        within __crossover() and there is no need to use it afterwards.
+
+        Args:
+            eng (Engine): The engine reference.
+            stp (int): The stockpile index.
+            atv (str): The activity, 'r' to reclaim, 's' to stack or 'b' to
+                both.
+
+        Returns:
+            bool: True if the engine can perform the job, False otherwise.
+        """
+
+        return eng.rail in self._problem.stockpiles[stp].rails \
+            and (atv == 's' or eng.speed_reclaim > 0) \
+            and (atv == 'r' or eng.speed_stack > 0)
+
+    # region simple getters and setters
+    @property
+    def population(self: 'Memetic') -> int:
+        """int: The number of individuals."""
+        return self.__population
+
+    @population.setter
+    def population(self: 'Memetic', value: int) -> None:
+        self.__population = value
+
+    @property
+    def mutation(self: 'Memetic') -> int:
+        """int: The number of random moves applied to each offspring."""
+        return self.__mutation
+
+    @mutation.setter
+    def mutation(self: 'Memetic', value: int) -> None:
+        self.__mutation = value
+
+    @property
+    def local(self: 'Memetic') -> int:
+        """int: The number of iterations of the local search."""
+        return self.__local
+
+    @local.setter
+    def local(self: 'Memetic', value: int) -> None:
+        self.__local = value
+
+    @property
+    def workers(self: 'Memetic') -> int:
+        """int: The number of worker processes."""
+        return self.__workers
+
+    @workers.setter
+    def workers(self: 'Memetic', value: int) -> None:
+        self.__workers = value
+
+
+def evolve(
+    payload: Payload,
+    mutation: int,
+    local: int,
+    seed: int,
+    deadline: Optional[float]
+) -> Individual:
+    """This function mutates, improves and evaluates an offspring in a worker
+    process, whose state was initialized by prepare().
+
+    Args:
+        payload (Payload): The route payload of the offspring.
+        mutation (int): The number of random moves to apply.
+        local (int): The number of iterations of the local search.
+        seed (int): The random seed of this execution.
+        deadline (Optional[float]): Time, since the epoch, in which the
+            execution must stop or None if there is no time limit.
+
+    Returns:
+        Tuple[float, Payload]: The cost and the route payload of the offspring.
+    """
+    solution, heuristic = load(payload, seed, deadline)
+
+    move: Optional[Move]
+
+    # the mutation accepts any random move, while a move that can not be 
+    # selected means that no neighborhood applies to the offspring
+    for _ in range(mutation):
+        move = heuristic.select_move(solution)
+        if move is None: return solution.cost, encode(solution.routes)
+
+        move.do_move(solution)
+        heuristic.accept_move(move)
+
+    # the local search only accepts the moves that do not worsen the cost
+    for _ in range(local):
+        if heuristic.interrupted(): break
+
+        move = heuristic.select_move(solution)
+        if move is None: return solution.cost, encode(solution.routes)
+
+        if move.do_move(solution) <= 0: heuristic.accept_move(move)
+        else: heuristic.reject_move(move)
+
+    return solution.cost, encode(solution.routes)
@@ -0,0 +1,38 @@
+from config import Routes, Payload
+
+
+# the activities, whose indexes encode the jobs of the route payloads
+ACTIVITIES: str = 'rsb'
+
+
+def encode(routes: Routes) -> Payload:
+    """This function encodes the routes as a route payload, in which each job
+    is a single integer.
+
+    Args:
+        routes (List[List[Tuple[int, str]]]): The routes of a solution.
+
+    Returns:
+        List[Tuple[int, ...]]: The route payload.
+    """
+    return [
+        tuple(stp * len(ACTIVITIES) + ACTIVITIES.index(atv)
+              for stp, atv in route)
+        for route in routes
+    ]
+
+
+def decode(payload: Payload) -> Routes:
+    """This function decodes a route payload back to the routes.
+
+    Args:
+        payload (List[Tuple[int, ...]]): The route payload.
+
+    Returns:
+        List[List[Tuple[int, str]]]: The routes of a solution.
+    """
+    return [
+        [(job // len(ACTIVITIES), ACTIVITIES[job % len(ACTIVITIES)])
+         for job in route]
+        for route in payload
+    ]
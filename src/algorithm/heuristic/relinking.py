@@ -0,0 +1,195 @@
+from algorithm.constructive import Constructive
+from config import Routes
+from model.problem import Problem
+from model.solution import Solution
+from .heuristic import Heuristic
+from .elite import ElitePool
+from typing import List, Tuple, Optional
+import copy
+
+class PathRelinking(Heuristic):
+    """This class is a Path Relinking implementation. The initial solution is
+    connected to each solution of an elite pool, in both directions, by a path
+    of intermediate solutions, each one evaluated, in which the best of them
+    is kept.
+
+    At each step, the first job of each engine that differs from the guiding
+    solution is shifted, from wherever it is, to its position in the guiding
+    solution, and the best of these shifts is applied. Since the routes are
+    fixed from the beginning, every step fixes at least one more job and the
+    path reaches the guiding solution.
+    """
+
+    def __init__(
+        self: 'PathRelinking',
+        problem: Problem,
+        constructive: Constructive,
+        pool: ElitePool
+    ):
+        """Instantiates a new Path Relinking.
+
+        Args:
+            problem (Problem): The problem reference.
+            constructive (Constructive): The constructive procedure, used to
+                evaluate the intermediate solutions.
+            pool (ElitePool): The elite pool, which also receives the
+                improved solutions.
+        """
+
+        super().__init__(problem, 'Path Relinking')
+
+        self.__constructive: Constructive = constructive
+        self.__pool: ElitePool = pool
+
+    def run(
+        self: 'PathRelinking',
+        initial_solution: Solution,
+        max_iters: int,
+        best_known: bool = False,
+        time_limit: Optional[float] = None
+    ) -> None:
+        """Executes the Path Relinking and updates the best solution.
+
+        Args:
+            initial_solution (Solution): The initial (input) solution.
+            max_iters (int): The maximum number of steps to execute.
+            best_known (bool): True if the initial best_solution have already
+                been established, False otherwise. Note that the False option
+                will define the initial best_solution as the initial_solution.
+                Defaults to False.
+            time_limit (Optional[float]): The maximum time, in seconds, to
+                execute or None if there is no time limit. Defaults to None.
+        """
+
+        self.set_time_limit(time_limit)
+
+        if not best_known:
+            self._best_solution = initial_solution
+
+        self._iters = 0
+
+        # the elites may be replaced along the way, so their routes are copied
+        guides: List[Routes] = [
+            [list(route) for route in elite.routes]
+            for elite in self.__pool.solutions
+        ]
+
+        for routes in guides:
+            self.__relink(initial_solution, initial_solution.routes, routes,
+                          max_iters)
+            self.__relink(initial_solution, routes, initial_solution.routes,
+                          max_iters)
+
+    def __relink(
+        self: 'PathRelinking',
+        initial_solution: Solution,
+        source: Routes,
+        target: Routes,
+        max_iters: int
+    ) -> None:
+        """This method walks from the source routes to the target ones,
+        evaluating the intermediate solutions with the weights of the initial
+        solution. It is called within run() and there is no need to use it
+        afterwards.
+
+        Args:
+            initial_solution (Solution): The initial solution, whose copy is
+                used to evaluate the path.
+            source (List[List[Tuple[int, str]]]): The initial routes.
+            target (List[List[Tuple[int, str]]]): The guiding routes.
+            max_iters (int): The maximum number of steps to execute.
+        """
+
+        # the solutions must have the same jobs to be connected
+        if sorted(job for route in source for job in route) != \
+           sorted(job for route in target for job in route):
+            return
+
+        solution: Solution = copy.deepcopy(initial_solution)
+        for e, route in enumerate(source):
+            solution.routes[e][:] = route
+
+        self.__constructive.solution = solution
+
+        while self._iters < max_iters:
+            if self.interrupted(): break
+
+            # best step: cost, engine, position and job
+            chosen: Optional[Tuple[float, int, int, Tuple[int, str]]] = None
+
+            for e, route in enumerate(solution.routes):
+                pos: int = 0
+                while pos < len(target[e]) and pos < len(route) and \
+                      route[pos] == target[e][pos]:
+                    pos += 1
+
+                if pos == len(target[e]): continue
+
+                routes: List[List[Tuple[int, str]]] = [
+                    list(route) for route in solution.routes
+                ]
+
+                self.__shift(solution, target[e][pos], e, pos)
+                self.__constructive.run(True)
+
+                if chosen is None or solution.cost < chosen[0]:
+                    chosen = (solution.cost, e, pos, target[e][pos])
+
+                for f, saved in enumerate(routes):
+                    solution.routes[f][:] = saved
+
+            # the guiding solution was reached
+            if chosen is None: break
+
+            self._iters += 1
+
+            self.__shift(solution, chosen[3], chosen[1], chosen[2])
+            self.__constructive.run(True)
+
+            if solution.cost < self._best_solution.cost:
+                self._best_solution = copy.deepcopy(solution)
+                self.__pool.add(solution)
+
+    def __shift(
+        self: 'PathRelinking',
+        solution: Solution,
+        job: Tuple[int, str],
+        engine: int,
+        pos: int
+    ) -> None:
+        """This method shifts a job, from wherever it is, to a position of an
+        engine route. It is called within __relink() and there is no need to
+        use it afterwards.
+
+        Args:
+            solution (Solution): The current solution.
+            job (Tuple[int, str]): The job to be shifted.
+            engine (int): The index of the engine.
+            pos (int): The position in the engine route.
+        """
+
+        for route in solution.routes:
+            if job in route:
+                route.remove(job)
+                break
+
+        solution.routes[engine].insert(pos, job)
+
+    # region simple getters and setters
+    @property
+    def constructive(self: 'PathRelinking') -> Constructive:
+        """Constructive: The constructive procedure."""
+        return self.__constructive
+
+    @constructive.setter
+    def constructive(self: 'PathRelinking', value: Constructive) -> None:
+        self.__constructive = value
+
+    @property
+    def pool(self: 'PathRelinking') -> ElitePool:
+        """ElitePool: The elite pool."""
+        return self.__pool
+
+    @pool.setter
+    def pool(self: 'PathRelinking', value: ElitePool) -> None:
+        self.__pool = value
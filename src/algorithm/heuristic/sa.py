@@ -2,7 +2,8 @@ from algorithm.neighborhood import Move
 from model.problem import Problem
 from model.solution import Solution
 from .heuristic import Heuristic
-import random
+from typing import Dict, Optional
+import numpy as np
 import math
 import copy
 
@@ -38,19 +39,26 @@ class SA(Heuristic):
         self: 'SA', 
         initial_solution: Solution,
         max_iters: int,
-        best_known: bool = False
+        best_known: bool = False,
+        time_limit: Optional[float] = None
     ) -> None:
         """Executes the Simulated Annealing and updates the best solution. 
 
         Args:
             initial_solution (Solution): The initial (input) solution.
-            max_iters (int): The maximum number of iterations to execute.
+            max_iters (int): The maximum number of iterations to execute 
+                without improving the best solution.
             best_known (bool): True if the initial best_solution have already 
                 been established, False otherwise. Note that the False option 
                 will define the initial best_solution as the initial_solution. 
                 Defaults to False.
+            time_limit (Optional[float]): The maximum time, in seconds, to 
+                execute or None if there is no time limit. Defaults to None.
         """
 
+        self.set_time_limit(time_limit)
+        self.set_target()
+
         if not best_known:
             self._best_solution = initial_solution
 
@@ -58,28 +66,41 @@ class SA(Heuristic):
         temperature: float = self.__t0
         
         self._iters = 0
+        state: Optional[Dict[str, np.ndarray]] = self.restore(solution)
+        if state is not None:
+            temperature = float(state['temperature'])
+            self._iters = int(state['iters'])
+
         while temperature > self.__eps and self._iters < max_iters:
+            if self.interrupted() or self.reached(): break
+
             solution.start_time = initial_solution.start_time.copy()
 
-            move: Move = self.select_move(solution)
+            move: Optional[Move] = self.select_move(solution)
+            if move is None: break
+
             delta: float = move.do_move(solution)
 
-            # if the solution is improved
+            # if the solution is improved (the iterations only restart with 
+            # the best solution, since the search may cycle between worse 
+            # and improved solutions without ever reaching it)
             if delta < 0:
                 self.accept_move(move)
-                self._iters = 0
+                self.offer(solution)
 
                 if (solution.cost < self._best_solution.cost):
                     self._best_solution = copy.deepcopy(solution)
+                    self._iters = 0
 
             # if solution is not improved, but is accepted
             elif delta == 0:
                 self.accept_move(move)
 
             # solution is not improved, but may be accepted with a probability
+            # (the delta is scaled back to the time unit of the temperature)
             else:
-                x: float = random.uniform(0, 1)
-                if x < math.exp(-delta / temperature):
+                x: float = self._rng.uniform(0, 1)
+                if x < math.exp(-delta / (temperature * solution.time_scale)):
                     self.accept_move(move)
 
                 # if solution is rejected
@@ -93,6 +114,10 @@ class SA(Heuristic):
             if temperature < self.__eps:
                 temperature = self.__t0
 
+            self.step(
+                solution, {'temperature': temperature, 'iters': self._iters}
+            )
+
     # region simple getters and setters
     @property
     def alpha(self: 'SA') -> float:
@@ -0,0 +1,264 @@
+from algorithm.neighborhood import Move
+from model.problem import Problem
+from model.solution import Solution
+from .heuristic import Heuristic
+from .payload import ACTIVITIES
+from typing import List, Dict, Set, Tuple, Optional
+import numpy as np
+import copy
+
+class TabuSearch(Heuristic):
+    """This class is a Tabu Search implementation. At each iteration, a batch
+    of neighbors is sampled from the moves and the best non-tabu one becomes
+    the current solution, even if it is worse.
+
+    The tabu attributes are the positions left by the jobs of the accepted
+    moves, i.e. a job can not return to the same position of the same engine
+    while the attribute is in the tabu list. The attributes are hashed and
+    kept in a fixed-size ring buffer, whose content is mirrored in a hash table
+    for constant time lookup. A tabu neighbor is still accepted if it improves
+    the best solution (aspiration criterion).
+
+    Note that an iteration evaluates a whole batch of neighbors, so a run of 
+    max_iters iterations evaluates max_iters * batch neighbors.
+    """
+
+    def __init__(
+        self: 'TabuSearch',
+        problem: Problem,
+        tenure: int,
+        batch: int = 10
+    ):
+        """Instantiates a new Tabu Search.
+
+        Args:
+            problem (Problem): The problem reference.
+            tenure (int): The size of the tabu list, i.e. the number of
+                attributes kept as tabu.
+            batch (int): The number of neighbors evaluated at each iteration.
+                Defaults to 10.
+        """
+
+        super().__init__(problem, 'Tabu Search')
+
+        self.__tenure: int = tenure
+        self.__batch: int = batch
+
+        # ring buffer of hashed attributes and its occurrence table
+        self.__tabu_list: List[Optional[int]] = [None] * tenure
+        self.__tabu_table: Dict[int, int] = {}
+        self.__index: int = 0
+
+    def run(
+        self: 'TabuSearch',
+        initial_solution: Solution,
+        max_iters: int,
+        best_known: bool = False,
+        time_limit: Optional[float] = None
+    ) -> None:
+        """Executes the Tabu Search and updates the best solution.
+
+        Args:
+            initial_solution (Solution): The initial (input) solution.
+            max_iters (int): The maximum number of iterations to execute, 
+                each one evaluating a batch of neighbors.
+            best_known (bool): True if the initial best_solution have already
+                been established, False otherwise. Note that the False option
+                will define the initial best_solution as the initial_solution.
+                Defaults to False.
+            time_limit (Optional[float]): The maximum time, in seconds, to
+                execute or None if there is no time limit. Defaults to None.
+        """
+
+        self.set_time_limit(time_limit)
+        self.set_target()
+
+        if not best_known:
+            self._best_solution = initial_solution
+
+        solution: Solution = copy.deepcopy(initial_solution)
+
+        self._iters = 0
+        state: Optional[Dict[str, np.ndarray]] = self.restore(solution)
+        if state is not None:
+            self.__restore_tabu(state)
+            self._iters = self._steps
+
+        while self._iters < max_iters:
+            if self.interrupted() or self.reached(): break
+
+            routes: List[List[Tuple[int, str]]] = [
+                list(route) for route in solution.routes
+            ]
+
+            # best neighbor of the batch: cost, changed routes and attributes
+            chosen: Optional[Tuple[float, Dict[int, List[Tuple[int, str]]],
+                                   Set[int]]] = None
+            move: Optional[Move] = None
+
+            for _ in range(self.__batch):
+                move = self.select_move(solution)
+                if move is None: break
+
+                move.do_move(solution)
+                cost: float = solution.cost
+
+                changed: Dict[int, List[Tuple[int, str]]] = {
+                    e: list(route) for e, route in enumerate(solution.routes)
+                    if route != routes[e]
+                }
+
+                tabu: bool = any(
+                    hash(attribute) in self.__tabu_table
+                    for attribute in self.__attributes(changed, routes, True)
+                )
+
+                # aspiration criterion, a tabu neighbor may improve the best
+                if (not tabu or cost < self._best_solution.cost) and \
+                   (chosen is None or cost < chosen[0]):
+                    chosen = (cost, changed, {
+                        hash(attribute) for attribute in
+                        self.__attributes(changed, routes, False)
+                    })
+
+                self.reject_move(move)
+
+            # the run ends when no neighbor is left to be chosen, while the 
+            # one chosen before the moves ran out is still applied
+            if move is None and chosen is None: break
+
+            # applies the chosen neighbor, whose attributes become tabu
+            if chosen is not None:
+                improved: bool = chosen[0] < solution.cost
+
+                for e, route in chosen[1].items():
+                    solution.routes[e][:] = route
+
+                self._moves[0].constructive.solution = solution
+                self._moves[0].constructive.run(True)
+
+                for attribute in chosen[2]: self.__add_tabu(attribute)
+
+                if improved: self.offer(solution)
+
+                if solution.cost < self._best_solution.cost:
+                    self._best_solution = copy.deepcopy(solution)
+
+            self._iters += 1
+            self.step(solution, {
+                'tabu': [
+                    attribute if attribute is not None else 0 
+                    for attribute in self.__tabu_list
+                ],
+                'filled': [
+                    attribute is not None for attribute in self.__tabu_list
+                ],
+                'index': self.__index
+            })
+
+    def __attributes(
+        self: 'TabuSearch',
+        changed: Dict[int, List[Tuple[int, str]]],
+        routes: List[List[Tuple[int, str]]],
+        arrivals: bool
+    ) -> Set[Tuple[int, int, int]]:
+        """This method lists the attributes of a neighbor, i.e. the jobs whose
+        positions have changed, along with their engine and position. The jobs 
+        are encoded as in the route payloads, so that the hashes of the 
+        attributes do not depend on the process and can be checkpointed. It 
+        is called within run() and there is no need to use it afterwards.
+
+        Args:
+            changed (Dict[int, List[Tuple[int, str]]]): The routes changed by
+                the move, by engine index.
+            routes (List[List[Tuple[int, str]]]): The routes before the move.
+            arrivals (bool): True for the positions taken by the jobs, False
+                for the positions left by them.
+
+        Returns:
+            Set[Tuple[int, int, int]]: Set of attributes, each one with the 
+                encoded job, the engine index and the position in the route.
+        """
+
+        attributes: Set[Tuple[int, int, int]] = set()
+
+        for e, new in changed.items():
+            old: List[Tuple[int, str]] = routes[e]
+            route, other = (new, old) if arrivals else (old, new)
+
+            attributes.update(
+                (job[0] * len(ACTIVITIES) + ACTIVITIES.index(job[1]), e, pos)
+                for pos, job in enumerate(route)
+                if pos >= len(other) or other[pos] != job
+            )
+
+        return attributes
+
+    def __add_tabu(self: 'TabuSearch', attribute: int) -> None:
+        """This method adds a hashed attribute to the tabu list, discarding
+        the oldest one if the list is full. It is called within run() and there
+        is no need to use it afterwards.
+
+        Args:
+            attribute (int): The hashed attribute.
+        """
+
+        if self.__tenure <= 0: return
+
+        oldest: Optional[int] = self.__tabu_list[self.__index]
+        if oldest is not None:
+            self.__tabu_table[oldest] -= 1
+            if self.__tabu_table[oldest] == 0: del self.__tabu_table[oldest]
+
+        self.__tabu_list[self.__index] = attribute
+        self.__tabu_table[attribute] = self.__tabu_table.get(attribute, 0) + 1
+        self.__index = (self.__index + 1) % self.__tenure
+
+    def __restore_tabu(
+        self: 'TabuSearch', 
+        state: Dict[str, np.ndarray]
+    ) -> None:
+        """This method restores the tabu list of a checkpoint and its 
+        occurrence table. It is called within run() and there is no need to 
+        use it afterwards.
+
+        Args:
+            state (Dict[str, np.ndarray]): The state of the checkpoint, with 
+                the hashed attributes of the tabu list, which of its positions 
+                are filled and the index of the next one.
+        """
+
+        self.__tabu_list = [
+            int(attribute) if filled else None for attribute, filled in 
+            zip(state['tabu'].tolist(), state['filled'].tolist())
+        ]
+
+        self.__tabu_table = {}
+        for attribute in self.__tabu_list:
+            if attribute is not None:
+                self.__tabu_table[attribute] = \
+                    self.__tabu_table.get(attribute, 0) + 1
+
+        self.__index = int(state['index'])
+
+    # region simple getters and setters
+    @property
+    def tenure(self: 'TabuSearch') -> int:
+        """int: The size of the tabu list."""
+        return self.__tenure
+
+    @tenure.setter
+    def tenure(self: 'TabuSearch', value: int) -> None:
+        self.__tenure = value
+        self.__tabu_list = [None] * value
+        self.__tabu_table = {}
+        self.__index = 0
+
+    @property
+    def batch(self: 'TabuSearch') -> int:
+        """int: The number of neighbors evaluated at each iteration."""
+        return self.__batch
+
+    @batch.setter
+    def batch(self: 'TabuSearch', value: int) -> None:
+        self.__batch = value
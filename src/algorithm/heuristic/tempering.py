@@ -0,0 +1,294 @@
+from algorithm.constructive import Constructive
+from algorithm.neighborhood import Move
+from config import Payload
+from model.problem import Problem
+from model.solution import Solution
+from .heuristic import Heuristic
+from .payload import encode, decode
+from .worker import prepare, load
+from concurrent.futures import ProcessPoolExecutor, Future
+from typing import List, Tuple, Optional
+import math
+import copy
+import os
+
+class ParallelTempering(Heuristic):
+    """This class is a Parallel Tempering (or Replica Exchange) implementation.
+    Several replicas of the solution are annealed at fixed temperatures, which
+    are spread geometrically between a minimum and a maximum one, in worker
+    processes. After every exchange interval, the replicas of adjacent
+    temperatures swap their solutions by the Metropolis criterion, so that the
+    good solutions descend to the colder replicas while the hotter ones keep
+    exploring.
+
+    The replicas travel between the processes as route payloads, i.e. as
+    tuples of encoded jobs, and are evaluated again by the workers, so that
+    neither the schedules nor the problem are sent at each exchange.
+    """
+
+    def __init__(
+        self: 'ParallelTempering',
+        problem: Problem,
+        replicas: int = 4,
+        t_min: float = 0.01,
+        t_max: float = 1.0,
+        exchange: int = 100,
+        workers: Optional[int] = None
+    ):
+        """Instantiates a new Parallel Tempering.
+
+        Args:
+            problem (Problem): The problem reference.
+            replicas (int): The number of replicas. Defaults to 4.
+            t_min (float): The temperature of the coldest replica. Defaults to
+                0.01.
+            t_max (float): The temperature of the hottest replica. Defaults to
+                1.0.
+            exchange (int): The number of iterations of each replica between
+                the exchanges. Defaults to 100.
+            workers (Optional[int]): The number of worker processes or None to
+                use one per replica, limited by the number of cores. Defaults
+                to None.
+        """
+
+        super().__init__(problem, 'Parallel Tempering')
+
+        self.__replicas: int = replicas
+        self.__t_min: float = t_min
+        self.__t_max: float = t_max
+        self.__exchange: int = exchange
+        self.__workers: int = workers if workers is not None \
+            else min(replicas, os.cpu_count() or 1)
+
+    def run(
+        self: 'ParallelTempering',
+        initial_solution: Solution,
+        max_iters: int,
+        best_known: bool = False,
+        time_limit: Optional[float] = None
+    ) -> None:
+        """Executes the Parallel Tempering and updates the best solution.
+
+        Args:
+            initial_solution (Solution): The initial (input) solution.
+            max_iters (int): The maximum number of iterations of each replica.
+            best_known (bool): True if the initial best_solution have already
+                been established, False otherwise. Note that the False option
+                will define the initial best_solution as the initial_solution.
+                Defaults to False.
+            time_limit (Optional[float]): The maximum time, in seconds, to
+                execute or None if there is no time limit. Defaults to None.
+        """
+
+        self.set_time_limit(time_limit)
+
+        if not best_known:
+            self._best_solution = initial_solution
+
+        temperatures: List[float] = self.temperatures()
+
+        # every replica starts from the initial solution
+        payloads: List[Payload] = [encode(initial_solution.routes)] * \
+            self.__replicas
+        costs: List[float] = [initial_solution.cost] * self.__replicas
+
+        best_payload: Optional[Payload] = None
+        best_cost: float = self._best_solution.cost
+
+        with ProcessPoolExecutor(
+            max_workers=self.__workers,
+            initializer=prepare,
+            initargs=(initial_solution, self._moves)
+        ) as pool:
+            epoch: int = 0
+            self._iters = 0
+            while self._iters < max_iters:
+                if self.interrupted(): break
+
+                iters: int = min(self.__exchange, max_iters - self._iters)
+
+                futures: List[Future] = [
+                    pool.submit(
+                        anneal, payloads[k], temperatures[k], iters,
+                        self._rng.randrange(2 ** 32), self._deadline
+                    ) for k in range(self.__replicas)
+                ]
+
+                for k, future in enumerate(futures):
+                    payload, cost, replica_payload, replica_cost = \
+                        future.result()
+
+                    payloads[k], costs[k] = payload, cost
+                    if replica_cost < best_cost:
+                        best_payload, best_cost = replica_payload, replica_cost
+
+                self._iters += iters
+
+                # the even and the odd pairs of replicas alternate
+                for k in range(epoch % 2, self.__replicas - 1, 2):
+                    if self.__swap(
+                        costs[k], costs[k + 1],
+                        temperatures[k], temperatures[k + 1],
+                        initial_solution.time_scale
+                    ):
+                        payloads[k], payloads[k + 1] = \
+                            payloads[k + 1], payloads[k]
+                        costs[k], costs[k + 1] = costs[k + 1], costs[k]
+
+                epoch += 1
+
+        if best_payload is None: return
+
+        # the best replica is evaluated again in this process
+        solution: Solution = copy.deepcopy(initial_solution)
+        for e, route in enumerate(decode(best_payload)):
+            solution.routes[e][:] = route
+
+        constructive: Constructive = self._moves[0].constructive
+        constructive.solution = solution
+        constructive.run(True)
+
+        # the constructive keeps working on the copy, as in the other methods
+        if solution.cost < self._best_solution.cost:
+            self._best_solution = copy.deepcopy(solution)
+
+    def temperatures(self: 'ParallelTempering') -> List[float]:
+        """This method calculates the temperature of each replica, from the
+        coldest to the hottest one, in a geometric progression.
+
+        Returns:
+            List[float]: List with the temperature of each replica.
+        """
+
+        if self.__replicas == 1: return [self.__t_min]
+
+        ratio: float = (self.__t_max / self.__t_min) ** \
+            (1 / (self.__replicas - 1))
+
+        return [self.__t_min * ratio ** k for k in range(self.__replicas)]
+
+    def __swap(
+        self: 'ParallelTempering',
+        cost_1: float,
+        cost_2: float,
+        temperature_1: float,
+        temperature_2: float,
+        time_scale: int
+    ) -> bool:
+        """This method decides, by the Metropolis criterion, whether two
+        replicas must swap their solutions. It is called within run() and
+        there is no need to use it afterwards.
+
+        Args:
+            cost_1 (float): The cost of the colder replica.
+            cost_2 (float): The cost of the hotter replica.
+            temperature_1 (float): The temperature of the colder replica.
+            temperature_2 (float): The temperature of the hotter replica.
+            time_scale (int): The time scale of the costs.
+
+        Returns:
+            bool: True if the replicas must swap, False otherwise.
+        """
+
+        # the costs are scaled back to the time unit of the temperatures
+        exponent: float = (1 / temperature_1 - 1 / temperature_2) * \
+            (cost_1 - cost_2) / time_scale
+
+        return exponent >= 0 or self._rng.uniform(0, 1) < math.exp(exponent)
+
+    # region simple getters and setters
+    @property
+    def replicas(self: 'ParallelTempering') -> int:
+        """int: The number of replicas."""
+        return self.__replicas
+
+    @replicas.setter
+    def replicas(self: 'ParallelTempering', value: int) -> None:
+        self.__replicas = value
+
+    @property
+    def t_min(self: 'ParallelTempering') -> float:
+        """float: The temperature of the coldest replica."""
+        return self.__t_min
+
+    @t_min.setter
+    def t_min(self: 'ParallelTempering', value: float) -> None:
+        self.__t_min = value
+
+    @property
+    def t_max(self: 'ParallelTempering') -> float:
+        """float: The temperature of the hottest replica."""
+        return self.__t_max
+
+    @t_max.setter
+    def t_max(self: 'ParallelTempering', value: float) -> None:
+        self.__t_max = value
+
+    @property
+    def exchange(self: 'ParallelTempering') -> int:
+        """int: The number of iterations of each replica between the
+        exchanges.
+        """
+        return self.__exchange
+
+    @exchange.setter
+    def exchange(self: 'ParallelTempering', value: int) -> None:
+        self.__exchange = value
+
+    @property
+    def workers(self: 'ParallelTempering') -> int:
+        """int: The number of worker processes."""
+        return self.__workers
+
+    @workers.setter
+    def workers(self: 'ParallelTempering', value: int) -> None:
+        self.__workers = value
+
+
+def anneal(
+    payload: Payload,
+    temperature: float,
+    max_iters: int,
+    seed: int,
+    deadline: Optional[float]
+) -> Tuple[Payload, float, Payload, float]:
+    """This function anneals a replica at a fixed temperature in a worker
+    process, whose state was initialized by prepare().
+
+    Args:
+        payload (List[Tuple[int, ...]]): The route payload of the replica.
+        temperature (float): The temperature of the replica.
+        max_iters (int): The number of iterations to execute.
+        seed (int): The random seed of this execution.
+        deadline (Optional[float]): Time, since the epoch, in which the
+            execution must stop or None if there is no time limit.
+
+    Returns:
+        Tuple[List[Tuple[int, ...]], float, List[Tuple[int, ...]], float]: The
+            route payload and the cost of the replica, followed by the route
+            payload and the cost of the best solution found.
+    """
+    solution, heuristic = load(payload, seed, deadline)
+
+    best: Tuple[Payload, float] = (payload, solution.cost)
+
+    for _ in range(max_iters):
+        if heuristic.interrupted(): break
+
+        move: Optional[Move] = heuristic.select_move(solution)
+        if move is None: break
+
+        delta: float = move.do_move(solution)
+
+        # the delta is scaled back to the time unit of the temperature
+        if delta <= 0 or heuristic.rng.uniform(0, 1) < \
+           math.exp(-delta / (temperature * solution.time_scale)):
+            heuristic.accept_move(move)
+
+            if solution.cost < best[1]:
+                best = (encode(solution.routes), solution.cost)
+
+        else:
+            heuristic.reject_move(move)
+
+    return encode(solution.routes), solution.cost, best[0], best[1]
@@ -0,0 +1,128 @@
+from algorithm.neighborhood import Move
+from config import Candidate
+from model.problem import Problem
+from model.solution import Solution
+from .heuristic import Heuristic
+from typing import List, Optional
+import copy
+
+class VND(Heuristic):
+    """This class is a Variable Neighborhood Descent implementation. The
+    neighborhoods are fully explored, in the order they were added, and the
+    search returns to the first one whenever an improvement is found, so that
+    it stops at a local optimum of all of them.
+
+    Only the moves that enumerate their candidates (i.e. that implement
+    gen_moves()) are used and, since no random choice is made, the descent is
+    deterministic.
+    """
+
+    def __init__(
+        self: 'VND',
+        problem: Problem,
+        first_improvement: bool = True
+    ):
+        """Instantiates a new Variable Neighborhood Descent.
+
+        Args:
+            problem (Problem): The problem reference.
+            first_improvement (bool): True if the first improving candidate of
+                a neighborhood must be accepted, False if the best one must be
+                accepted after exploring all of them. Defaults to True.
+        """
+
+        super().__init__(problem, 'Variable Neighborhood Descent')
+
+        self.__first_improvement: bool = first_improvement
+
+    def run(
+        self: 'VND',
+        initial_solution: Solution,
+        max_iters: int,
+        best_known: bool = False,
+        time_limit: Optional[float] = None
+    ) -> None:
+        """Executes the Variable Neighborhood Descent and updates the best
+        solution.
+
+        Args:
+            initial_solution (Solution): The initial (input) solution.
+            max_iters (int): The maximum number of neighborhood explorations.
+            best_known (bool): True if the initial best_solution have already
+                been established, False otherwise. Note that the False option
+                will define the initial best_solution as the initial_solution.
+                Defaults to False.
+            time_limit (Optional[float]): The maximum time, in seconds, to
+                execute or None if there is no time limit. Defaults to None.
+        """
+
+        self.set_time_limit(time_limit)
+
+        if not best_known:
+            self._best_solution = initial_solution
+
+        moves: List[Move] = [
+            move for move in self._moves
+            if type(move).gen_moves is not Move.gen_moves
+        ]
+
+        solution: Solution = copy.deepcopy(initial_solution)
+
+        k: int = 0
+        self._iters = 0
+        while k < len(moves) and self._iters < max_iters:
+            if self.interrupted(): break
+
+            self._iters += 1
+            k = 0 if self.__explore(moves[k], solution) else k + 1
+
+        if solution.cost < self._best_solution.cost:
+            self._best_solution = solution
+
+    def __explore(self: 'VND', move: Move, solution: Solution) -> bool:
+        """This method explores a neighborhood and applies its first or best
+        improving candidate. It is called within run() and there is no need to
+        use it afterwards.
+
+        Args:
+            move (Move): The neighborhood to be explored.
+            solution (Solution): The current solution.
+
+        Returns:
+            bool: True if the solution was improved, False otherwise.
+        """
+
+        best: Optional[Candidate] = None
+        best_delta: float = 0
+
+        for candidate in move.gen_moves(solution):
+            if self.interrupted(): break
+
+            delta: float = move.do_move(solution, candidate)
+
+            if delta < 0 and self.__first_improvement:
+                self.accept_move(move)
+                return True
+
+            # the solution is restored, so the generation is still valid
+            self.reject_move(move)
+
+            if delta < best_delta:
+                best, best_delta = candidate, delta
+
+        if best is None: return False
+
+        move.do_move(solution, best)
+        self.accept_move(move)
+
+        return True
+
+    # region simple getters and setters
+    @property
+    def first_improvement(self: 'VND') -> bool:
+        """bool: True for first improvement, False for best improvement."""
+        return self.__first_improvement
+
+    @first_improvement.setter
+    def first_improvement(self: 'VND', value: bool) -> None:
+        self.__first_improvement = value
@@ -0,0 +1,60 @@
+from algorithm.constructive import Constructive
+from algorithm.neighborhood import Move
+from config import Payload
+from model.solution import Solution
+from .heuristic import Heuristic
+from .payload import decode
+from typing import List, Tuple, Optional
+import random
+
+# the state of a worker process: its solution and its heuristic
+state: Optional[Tuple[Solution, Heuristic]] = None
+
+
+def prepare(solution: Solution, moves: List[Move]) -> None:
+    """This function initializes a worker process with its state, whose 
+    moves already refer to the solution through their constructive.
+
+    Args:
+        solution (Solution): The initial solution, with the model weights.
+        moves (List[Move]): The moves of the heuristic.
+    """
+    global state
+
+    heuristic: Heuristic = Heuristic(solution.problem, 'Worker')
+    for move in moves: heuristic.add_move(move)
+
+    state = (solution, heuristic)
+
+
+def load(
+    payload: Payload,
+    seed: int,
+    deadline: Optional[float]
+) -> Tuple[Solution, Heuristic]:
+    """This function starts an execution in a worker process, whose state was 
+    initialized by prepare(), from the routes of a payload. The solution is 
+    evaluated again, since only its routes were received.
+
+    Args:
+        payload (List[Tuple[int, ...]]): The route payload of the solution.
+        seed (int): The random seed of this execution.
+        deadline (Optional[float]): Time, since the epoch, in which the
+            execution must stop or None if there is no time limit.
+
+    Returns:
+        Tuple[Solution, Heuristic]: The solution of the worker, with the 
+            routes of the payload, and its heuristic.
+    """
+    solution, heuristic = state
+    heuristic.deadline = deadline
+    heuristic.rng = random.Random(seed)
+
+    for e, route in enumerate(decode(payload)):
+        solution.routes[e][:] = route
+
+    constructive: Constructive = heuristic.moves[0].constructive
+    constructive.solution = solution
+    constructive.run(True)
+
+    return solution, heuristic
@@ -1,7 +1,9 @@
 from algorithm.constructive import Constructive
 from model.problem import Problem
 from model.solution import Solution
-from typing import Optional
+from config import Candidate
+from typing import Optional, Iterator
+import random
 
 class Move:
     """This class represents a Move (or Neighborhood). The basic methods as 
@@ -27,6 +29,9 @@ class Move:
 
         self._constructive: Constructive = constructive
 
+        # random stream of the move, shared with the heuristic that uses it
+        self._rng: random.Random = random.Random(0)
+
         self._current_solution: Optional[Solution] = None
         self._intermediate_state: bool = False
 
@@ -111,6 +116,21 @@ class Move:
 
         raise NotImplementedError
 
+    def gen_moves(self: 'Move', solution: Solution) -> Iterator[Candidate]:
+        """This method lazily generates every candidate of the neighborhood, 
+        in a deterministic order, each one to be executed by do_move(). The 
+        candidates are only valid for the solution as it was when they were 
+        generated, so the generation must restart once a move is accepted.
+
+        Args:
+            solution (Solution): The solution to be modified.
+
+        Yields:
+            Tuple[int, ...]: The candidate, i.e. the indexes that define it.
+        """
+
+        raise NotImplementedError
+
     def has_move(self: 'Move', solution: Solution) -> bool:
         """This method returns a boolean indicating whether this neighborhood 
         can be applied to the current solution.
@@ -151,6 +171,15 @@ class Move:
     def constructive(self: 'Move', value: Constructive) -> None:
         self._constructive = value
 
+    @property
+    def rng(self: 'Move') -> random.Random:
+        """random.Random: The random stream of the move."""
+        return self._rng
+
+    @rng.setter
+    def rng(self: 'Move', value: random.Random) -> None:
+        self._rng = value
+
     @property
     def name(self: 'Move') -> str:
         """str: The move name."""
@@ -3,8 +3,8 @@ from model.classes import Engine
 from model.problem import Problem
 from model.solution import Solution
 from .move import Move
-from typing import Optional, List, Tuple
-import random
+from config import Candidate
+from typing import Optional, List, Tuple, Iterator
 
 class Shift(Move):
     """This class represents a Shift Move. A neighbor in the Shift Move is 
@@ -25,7 +25,7 @@ class Shift(Move):
         """
         super().__init__(problem, constructive, 'Shift')
 
-        self._engine: Engine = random.choice(problem.engines)
+        self._engine: Engine = self._rng.choice(problem.engines)
         self._route: List[Tuple[int, str]] = []
         self._job: Tuple[int, str] = ()
         self._pos: Optional[int] = None
@@ -51,22 +51,38 @@ class Shift(Move):
 
         self._constructive.run(True)
 
-    def do_move(self: 'Shift', solution: Solution) -> float:
+    def do_move(
+        self: 'Shift', 
+        solution: Solution, 
+        candidate: Optional[Candidate] = None
+    ) -> float:
         """This method returns does the move and returns the impact 
         (delta cost) in the solution.
     
         Args:
             solution (Solution): The solution to be modified.
+            candidate (Optional[Candidate]): The candidate to be executed, 
+                with the engine index, the current position of the job and its 
+                new position, as generated by gen_moves(), or None for a random 
+                one. Defaults to None.
 
         Returns:
             float: The impact (delta cost) of this move in the solution.
         """
-        if self.has_move(solution):
-            self._job = random.choice(self._route)
+        if candidate is not None:
+            e, self._pos, pos = candidate
+
+            self._engine = self._problem.engines[e]
+            self._route = solution.routes[e]
+            self._job = self._route.pop(self._pos)
+            self._route.insert(pos, self._job)
+
+        elif self.has_move(solution):
+            self._job = self._rng.choice(self._route)
             self._pos = self._route.index(self._job)
 
             self._route.remove(self._job)
-            self._route.insert(random.randrange(len(self._route)), self._job)
+            self._route.insert(self._rng.randrange(len(self._route)), self._job)
 
         return super().do_move(solution)
 
@@ -84,10 +100,30 @@ class Shift(Move):
         self.reset()
 
         for _ in range(int(1e3)):
-            self._engine = random.choice(self._problem.engines)
+            self._engine = self._rng.choice(self._problem.engines)
             self._route = self._current_solution.routes[self._engine.id - 1]
             if self.has_move(solution): break
 
+    def gen_moves(self: 'Shift', solution: Solution) -> Iterator[Candidate]:
+        """This method lazily generates every candidate of the neighborhood, 
+        i.e. each job of each engine moved to each other position of its route.
+
+        Args:
+            solution (Solution): The solution to be modified.
+
+        Yields:
+            Tuple[int, int, int]: The engine index, the current position of 
+                the job and its new position.
+        """
+
+        for e, route in enumerate(solution.routes):
+            for pos in range(len(route)):
+                for new in range(len(route)):
+
+                    # moving a job one position back is the same as moving 
+                    # the previous job one position forward
+                    if new != pos and new != pos - 1: yield e, pos, new
+
     def has_move(self: 'Shift', solution: Solution) -> bool:
         """This method returns a boolean indicating whether this neighborhood 
         can be applied to the current solution.
@@ -107,10 +143,11 @@ class Shift(Move):
         (mainly to avoid the need of creating another object).
         """
 
-        self._engine = random.choice(self._problem.engines)
+        self._engine = self._rng.choice(self._problem.engines)
         self._route = self._current_solution.routes[self._engine.id - 1]
-        self._job = random.choice(self._route)
-        self._pos = self._route.index(self._job)
+        # the engine may not have received any jobs
+        self._job = self._rng.choice(self._route) if self._route else ()
+        self._pos = self._route.index(self._job) if self._route else None
 
     # region simple getters and setters
     @property
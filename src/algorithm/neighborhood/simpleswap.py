@@ -3,8 +3,8 @@ from model.classes import Engine
 from model.problem import Problem
 from model.solution import Solution
 from .move import Move
-from typing import Optional, List, Tuple
-import random
+from config import Candidate
+from typing import Optional, List, Tuple, Iterator
 
 
 class SimpleSwap(Move):
@@ -30,8 +30,8 @@ class SimpleSwap(Move):
 
         super().__init__(problem, constructive, 'SimpleSwap')
 
-        self._engine_1: Engine = random.choice(problem.engines)
-        self._engine_2: Engine = random.choice(problem.engines)
+        self._engine_1: Engine = self._rng.choice(problem.engines)
+        self._engine_2: Engine = self._rng.choice(problem.engines)
 
         # try to get the engine from the neighboring yard
         index: int = problem.engines.index(self._engine_1)
@@ -74,17 +74,42 @@ class SimpleSwap(Move):
 
         self._constructive.run(True)
 
-    def do_move(self: 'SimpleSwap', solution: Solution) -> float:
+    def do_move(
+        self: 'SimpleSwap', 
+        solution: Solution, 
+        candidate: Optional[Candidate] = None
+    ) -> float:
         """This method returns does the move and returns the impact 
         (delta cost) in the solution.
     
         Args:
             solution (Solution): The solution to be modified.
+            candidate (Optional[Candidate]): The candidate to be executed, 
+                with the indexes of both engines and the (same) position of 
+                their jobs, as generated by gen_moves(), or None for a random 
+                one. Defaults to None.
 
         Returns:
             float: The impact (delta cost) of this move in the solution.
         """
 
+        if candidate is not None:
+            e_1, e_2, self._pos_1, self._pos_2 = candidate
+
+            self._current_solution = solution
+            self._engine_1 = self._problem.engines[e_1]
+            self._engine_2 = self._problem.engines[e_2]
+            self._route_1 = solution.routes[e_1]
+            self._route_2 = solution.routes[e_2]
+            self._job_1 = self._route_1[self._pos_1]
+            self._job_2 = self._route_2[self._pos_2]
+
+            # the jobs take the position of each other
+            self._route_1[self._pos_1] = self._job_2
+            self._route_2[self._pos_2] = self._job_1
+
+            return super().do_move(solution)
+
         self._pos_1 = self._route_1.index(self._job_1)
         self._pos_2 = self._route_2.index(self._job_2)
 
@@ -110,7 +135,9 @@ class SimpleSwap(Move):
         self.reset()
 
         for _ in range(int(1e3)):
-            self._job_1 = random.choice(self._route_1)
+            if not self._route_1 or not self._route_2: break
+
+            self._job_1 = self._rng.choice(self._route_1)
             self._pos_1 = self._route_1.index(self._job_1)
 
             try:
@@ -118,11 +145,36 @@ class SimpleSwap(Move):
                 self._job_2 = self._route_2[self._pos_2]
 
             except IndexError:
-                self._job_2 = random.choice(self._route_2)
+                self._job_2 = self._rng.choice(self._route_2)
                 self._pos_2 = self._route_2.index(self._job_2)
 
             if self.has_move(solution): break
 
+    def gen_moves(
+        self: 'SimpleSwap', 
+        solution: Solution
+    ) -> Iterator[Candidate]:
+        """This method lazily generates every candidate of the neighborhood, 
+        i.e. each pair of jobs of the same activity and in the same position 
+        on neighboring engines.
+
+        Args:
+            solution (Solution): The solution to be modified.
+
+        Yields:
+            Tuple[int, int, int, int]: The indexes of both engines and the 
+                positions of their jobs.
+        """
+
+        for e_1 in range(len(self._problem.engines) - 1):
+            e_2: int = e_1 + 1
+
+            for pos, (job_1, job_2) in enumerate(
+                zip(solution.routes[e_1], solution.routes[e_2])
+            ):
+                if job_1[1] == job_2[1] and job_1 != job_2:
+                    yield e_1, e_2, pos, pos
+
     def has_move(self: 'SimpleSwap', solution: Solution) -> bool:
         """This method returns a boolean indicating whether this neighborhood 
         can be applied to the current solution.
@@ -135,6 +187,9 @@ class SimpleSwap(Move):
                 solution, False otherwise.
         """
 
+        if not self._job_1 or not self._job_2:
+            return False
+
         return self._job_1[1] == self._job_2[1] and self._pos_1 == self._pos_2
 
     def reset(self: 'SimpleSwap') -> None:
@@ -142,7 +197,7 @@ class SimpleSwap(Move):
         (mainly to avoid the need of creating another object).
         """
 
-        self._engine_1 = random.choice(self._problem.engines)
+        self._engine_1 = self._rng.choice(self._problem.engines)
 
         # try to get the engine from the neighboring yard
         index: int = self._problem.engines.index(self._engine_1)
@@ -155,11 +210,12 @@ class SimpleSwap(Move):
         self._route_1 = self._current_solution.routes[self._engine_1.id - 1]
         self._route_2 = self._current_solution.routes[self._engine_2.id - 1]
 
-        self._job_1 = random.choice(self._route_1)
-        self._pos_1 = self._route_1.index(self._job_1)
+        # the engines may not have received any jobs
+        self._job_1 = self._rng.choice(self._route_1) if self._route_1 else ()
+        self._pos_1 = self._route_1.index(self._job_1) if self._route_1 else None
 
-        self._job_2 = random.choice(self._route_2)
-        self._pos_2 = self._route_2.index(self._job_2)
+        self._job_2 = self._rng.choice(self._route_2) if self._route_2 else ()
+        self._pos_2 = self._route_2.index(self._job_2) if self._route_2 else None
 
     # region simple getters and setters
     @property
@@ -3,7 +3,6 @@ from model.problem import Problem
 from model.solution import Solution
 from .move import Move
 from typing import Optional, List, Tuple
-import random
 
 class SmartShift(Move):
     """This class represents a Smart Shift Move. A neighbor in the Smart Shift 
@@ -62,11 +61,11 @@ class SmartShift(Move):
             float: The impact (delta cost) of this move in the solution.
         """
 
-        self._job = random.choice(self._route)
+        self._job = self._rng.choice(self._route)
         self._pos = self._route.index(self._job)
 
         self._route.remove(self._job)
-        self._route.insert(random.randrange(len(self._route)), self._job)
+        self._route.insert(self._rng.randrange(len(self._route)), self._job)
 
         return super().do_move(solution)
 
@@ -84,7 +83,7 @@ class SmartShift(Move):
         self.reset()
 
         for _ in range(int(1e3)):
-            self._engine_id = random.choice(self._make_span)[1]
+            self._engine_id = self._rng.choice(self._make_span)[1]
             self._route = self._current_solution.routes[self._engine_id - 1]
             if self.has_move(solution): break
 
@@ -117,10 +116,11 @@ class SmartShift(Move):
             engine_duration
         ))
 
-        self._engine_id = random.choice(self._make_span)[1]
+        self._engine_id = self._rng.choice(self._make_span)[1]
         self._route = self._current_solution.routes[self._engine_id - 1]
-        self._job = random.choice(self._route)
-        self._pos = self._route.index(self._job)
+        # the engine may not have received any jobs
+        self._job = self._rng.choice(self._route) if self._route else ()
+        self._pos = self._route.index(self._job) if self._route else None
 
     # region simple getters and setters
     @property
@@ -3,7 +3,6 @@ from model.problem import Problem
 from model.solution import Solution
 from .move import Move
 from typing import Optional, List, Tuple
-import random
 
 
 class SmartSimpleSwap(Move):
@@ -103,7 +102,9 @@ class SmartSimpleSwap(Move):
         self.reset()
 
         for _ in range(int(1e3)):
-            self._job_1 = random.choice(self._route_1)
+            if not self._route_1 or not self._route_2: break
+
+            self._job_1 = self._rng.choice(self._route_1)
             self._pos_1 = self._route_1.index(self._job_1)
 
             try:
@@ -111,7 +112,7 @@ class SmartSimpleSwap(Move):
                 self._job_2 = self._route_2[self._pos_2]
 
             except IndexError:
-                self._job_2 = random.choice(self._route_2)
+                self._job_2 = self._rng.choice(self._route_2)
                 self._pos_2 = self._route_2.index(self._job_2)
 
             if self.has_move(solution): break
@@ -128,6 +129,9 @@ class SmartSimpleSwap(Move):
                 solution, False otherwise.
         """
 
+        if not self._job_1 or not self._job_2:
+            return False
+
         return self._job_1[1] == self._job_2[1] and self._pos_1 == self._pos_2
 
     def reset(self: 'SmartSimpleSwap') -> None:
@@ -145,7 +149,7 @@ class SmartSimpleSwap(Move):
             engine_duration
         ))
 
-        self._engine_1_id = random.choice(self._make_span)[1]
+        self._engine_1_id = self._rng.choice(self._make_span)[1]
 
         # try to get the engine from the neighboring yard
         try:
@@ -157,11 +161,12 @@ class SmartSimpleSwap(Move):
         self._route_1 = self._current_solution.routes[self._engine_1_id - 1]
         self._route_2 = self._current_solution.routes[self._engine_2_id - 1]
 
-        self._job_1 = random.choice(self._route_1)
-        self._pos_1 = self._route_1.index(self._job_1)
+        # the engines may not have received any jobs
+        self._job_1 = self._rng.choice(self._route_1) if self._route_1 else ()
+        self._pos_1 = self._route_1.index(self._job_1) if self._route_1 else None
 
-        self._job_2 = random.choice(self._route_2)
-        self._pos_2 = self._route_2.index(self._job_2)
+        self._job_2 = self._rng.choice(self._route_2) if self._route_2 else ()
+        self._pos_2 = self._route_2.index(self._job_2) if self._route_2 else None
 
    # region simple getters and setters
     @property
@@ -3,7 +3,6 @@ from model.problem import Problem
 from model.solution import Solution
 from .move import Move
 from typing import Optional, List, Tuple
-import random
 
 
 class SmartSwap(Move):
@@ -84,8 +83,8 @@ class SmartSwap(Move):
         self._route_2.remove(self._job_2)
 
         try:
-            self._route_1.insert(random.randrange(len(self._route_1)), self._job_2)
-            self._route_2.insert(random.randrange(len(self._route_2)), self._job_1)
+            self._route_1.insert(self._rng.randrange(len(self._route_1)), self._job_2)
+            self._route_2.insert(self._rng.randrange(len(self._route_2)), self._job_1)
 
         except ValueError:
             self._route_1.insert(self._pos_1, self._job_2)
@@ -107,8 +106,10 @@ class SmartSwap(Move):
         self.reset()
 
         for _ in range(int(1e3)):
-            self._job_1 = random.choice(self._route_1)
-            self._job_2 = random.choice(self._route_2)
+            if not self._route_1 or not self._route_2: break
+
+            self._job_1 = self._rng.choice(self._route_1)
+            self._job_2 = self._rng.choice(self._route_2)
             if self.has_move(solution): break
 
     def has_move(self: 'SmartSwap', solution: Solution) -> bool:
@@ -123,6 +124,9 @@ class SmartSwap(Move):
                 solution, False otherwise.
         """
 
+        if not self._job_1 or not self._job_2:
+            return False
+
         return self._job_1[1] == self._job_2[1]
 
     def reset(self: 'SmartSwap') -> None:
@@ -140,7 +144,7 @@ class SmartSwap(Move):
             engine_duration
         ))
 
-        self._engine_1_id = random.choice(self._make_span)[1]
+        self._engine_1_id = self._rng.choice(self._make_span)[1]
 
         # try to get the engine from the neighboring yard
         try:
@@ -152,11 +156,12 @@ class SmartSwap(Move):
         self._route_1 = self._current_solution.routes[self._engine_1_id - 1]
         self._route_2 = self._current_solution.routes[self._engine_2_id - 1]
 
-        self._job_1 = random.choice(self._route_1)
-        self._job_2 = random.choice(self._route_2)
+        # the engines may not have received any jobs
+        self._job_1 = self._rng.choice(self._route_1) if self._route_1 else ()
+        self._job_2 = self._rng.choice(self._route_2) if self._route_2 else ()
 
-        self._pos_1 = self._route_1.index(self._job_1)
-        self._pos_2 = self._route_2.index(self._job_2)
+        self._pos_1 = self._route_1.index(self._job_1) if self._route_1 else None
+        self._pos_2 = self._route_2.index(self._job_2) if self._route_2 else None
 
     # region simple getters and setters
     @property
@@ -3,7 +3,6 @@ from model.problem import Problem
 from model.solution import Solution
 from .move import Move
 from typing import Optional, List, Tuple
-import random
 
 
 class SmartSwitch(Move):
@@ -71,7 +70,7 @@ class SmartSwitch(Move):
             solution.routes[self._engine_id - 1]
 
         self._job_1, self._job_2 = [
-            tuple(i)[0] for i in random.sample(list(enumerate(route)), 2)
+            tuple(i)[0] for i in self._rng.sample(list(enumerate(route)), 2)
         ]
 
         route[self._job_1], route[self._job_2] = \
@@ -93,7 +92,7 @@ class SmartSwitch(Move):
         self.reset()
 
         for _ in range(int(1e3)):
-            self._engine_id = random.choice(self._make_span)[1]
+            self._engine_id = self._rng.choice(self._make_span)[1]
             if self.has_move(solution): break
 
     def has_move(self: 'SmartSwitch', solution: Solution) -> bool:
@@ -122,7 +121,7 @@ class SmartSwitch(Move):
             engine_duration
         ))
 
-        self._engine_id = random.choice(self._make_span)[1]
+        self._engine_id = self._rng.choice(self._make_span)[1]
         
         self._job_1 = None
         self._job_2 = None
@@ -3,8 +3,8 @@ from model.classes import Engine
 from model.problem import Problem
 from model.solution import Solution
 from .move import Move
-from typing import Optional, List, Tuple
-import random
+from config import Candidate
+from typing import Optional, List, Tuple, Iterator
 
 
 class Switch(Move):
@@ -26,7 +26,7 @@ class Switch(Move):
 
         super().__init__(problem, constructive, 'Switch')
 
-        self._engine: Engine = random.choice(problem.engines)
+        self._engine: Engine = self._rng.choice(problem.engines)
 
         self._job_1: Optional[int] = None
         self._job_2: Optional[int] = None        
@@ -55,23 +55,36 @@ class Switch(Move):
 
         self._constructive.run(True)
 
-    def do_move(self: 'Switch', solution: Solution) -> float:
+    def do_move(
+        self: 'Switch', 
+        solution: Solution, 
+        candidate: Optional[Candidate] = None
+    ) -> float:
         """This method returns does the move and returns the impact 
         (delta cost) in the solution.
     
         Args:
             solution (Solution): The solution to be modified.
+            candidate (Optional[Candidate]): The candidate to be executed, 
+                with the engine index and the positions of both jobs, as 
+                generated by gen_moves(), or None for a random one. Defaults 
+                to None.
 
         Returns:
             float: The impact (delta cost) of this move in the solution.
         """
 
+        if candidate is not None:
+            e, self._job_1, self._job_2 = candidate
+            self._engine = self._problem.engines[e]
+
         route: List[Tuple[int, str]] = \
             solution.routes[self._engine.id - 1]
 
-        self._job_1, self._job_2 = [
-            tuple(i)[0] for i in random.sample(list(enumerate(route)), 2)
-        ]
+        if candidate is None:
+            self._job_1, self._job_2 = [
+                tuple(i)[0] for i in self._rng.sample(list(enumerate(route)), 2)
+            ]
 
         route[self._job_1], route[self._job_2] = \
             route[self._job_2], route[self._job_1]
@@ -90,9 +103,26 @@ class Switch(Move):
         self.reset()
 
         for _ in range(int(1e3)):
-            self._engine = random.choice(self._problem.engines)
+            self._engine = self._rng.choice(self._problem.engines)
             if self.has_move(solution): break
 
+    def gen_moves(self: 'Switch', solution: Solution) -> Iterator[Candidate]:
+        """This method lazily generates every candidate of the neighborhood, 
+        i.e. each pair of jobs of each engine.
+
+        Args:
+            solution (Solution): The solution to be modified.
+
+        Yields:
+            Tuple[int, int, int]: The engine index and the positions of both 
+                jobs.
+        """
+
+        for e, route in enumerate(solution.routes):
+            for pos_1 in range(len(route) - 1):
+                for pos_2 in range(pos_1 + 1, len(route)):
+                    yield e, pos_1, pos_2
+
     def has_move(self: 'Switch', solution: Solution) -> bool:
         """This method returns a boolean indicating whether this neighborhood 
         can be applied to the current solution.
@@ -109,7 +139,7 @@ class Switch(Move):
         (mainly to avoid the need of creating another object).
         """
 
-        self._engine = random.choice(self._problem.engines)
+        self._engine = self._rng.choice(self._problem.engines)
         
         self._job_1 = None
         self._job_2 = None
@@ -0,0 +1,32 @@
+from typing import Tuple
+import numpy as np
+import random
+
+
+# the keys of the streams drawn from the master seed of a run
+MODEL: Tuple[int, ...] = (0,)
+HEURISTIC: Tuple[int, ...] = (1,)
+POLISH: Tuple[int, ...] = (2,)
+
+
+def spawn(seed: int, *key: int) -> random.Random:
+    """This function creates an independent random stream, derived from a
+    master seed and a key, so that each component of a run (and each worker
+    or start of a parallel run) draws from its own reproducible stream,
+    regardless of the order in which the components are executed.
+
+    Args:
+        seed (int): The master seed of the run.
+        *key (int): The key of the stream, e.g. HEURISTIC or HEURISTIC + (k,)
+            for the k-th start of a multi-start run.
+
+    Returns:
+        random.Random: The random stream.
+    """
+    sequence: np.random.SeedSequence = np.random.SeedSequence(
+        abs(seed), spawn_key=key
+    )
+
+    return random.Random(int.from_bytes(
+        sequence.generate_state(4, np.uint32).tobytes(), 'little'
+    ))
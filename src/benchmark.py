@@ -0,0 +1,237 @@
+from config import Parmeters, Objective
+from algorithm.constructive import LinModel, Backend, CBC, HiGHS, PostModel
+from model.problem import Problem
+from model.solution import Solution
+from experiment import parse_list
+from typing import List, Dict, Callable, Any
+import tracemalloc
+import copy
+import time
+import csv
+import sys
+import os
+
+# type alias for the rows of a benchmark table
+Row = Dict[str, Any]
+
+def main():
+    """This is the main function of the benchmark, responsible of running the
+    selected benchmark on the instances and writing its results table.
+    """
+    parms: Parmeters = {
+        'instances': '1-10,s1-s10,m1-m10,b1-b10',
+        'repeats': 3
+    }
+
+    read_args(sys.argv, parms)
+
+    benchmark: str = sys.argv[1]
+    if benchmark not in BENCHMARKS: print_usage(parms)
+
+    rows: List[Row] = []
+    for instance in parse_list(parms['instances'], 'instance_'):
+        problem: Problem = Problem(f'./tests/{instance}.json')
+
+        for row in BENCHMARKS[benchmark](problem, parms):
+            rows.append({'instance': instance, **row})
+            print(', '.join(f'{key}: {value}' for key, value in rows[-1].items()))
+
+    write_table(f'./out/results/benchmark_{benchmark}.csv', rows)
+
+
+def benchmark_lp(problem: Problem, parms: Parmeters) -> List[Row]:
+    """This function compares the solver backends of the linear model, by the
+    best time of its resolution (including the .lp file) and its objective.
+
+    Args:
+        problem (Problem): The problem reference.
+        parms (Parmeters): The operating guidelines.
+
+    Returns:
+        List[Dict[str, Any]]: One row for each backend.
+    """
+    backends: List[Backend] = [CBC(), HiGHS('highs-ds'), HiGHS('highs-ipm')]
+
+    rows: List[Row] = []
+    for backend in backends:
+        model: LinModel = LinModel(problem, backend)
+
+        # the first resolution also loads the solver libraries
+        objective: Objective = model.resolve()
+
+        times: List[float] = []
+        for _ in range(parms['repeats']):
+            start: float = time.perf_counter()
+            objective = model.resolve()
+            times.append(time.perf_counter() - start)
+
+        rows.append({
+            'backend': backend.name if not isinstance(backend, HiGHS)
+                else f'{backend.name} ({backend.method})',
+            'time': round(min(times), 4),
+            'objective': objective[0]
+        })
+
+    return rows
+
+
+def benchmark_presolve(problem: Problem, parms: Parmeters) -> List[Row]:
+    """This function compares the complete and the reduced linear models, by 
+    their size and by the best times of their building and resolution.
+
+    Args:
+        problem (Problem): The problem reference.
+        parms (Parmeters): The operating guidelines.
+
+    Returns:
+        List[Dict[str, Any]]: One row for each model.
+    """
+    # the first model also loads the solver libraries
+    LinModel(problem).resolve()
+
+    rows: List[Row] = []
+    for reduce in (False, True):
+        build: List[float] = []
+        times: List[float] = []
+
+        for _ in range(parms['repeats']):
+            start: float = time.perf_counter()
+            model: LinModel = LinModel(problem, reduce=reduce)
+            build.append(time.perf_counter() - start)
+
+            start = time.perf_counter()
+            objective: Objective = model.resolve()
+            times.append(time.perf_counter() - start)
+
+        rows.append({
+            'model': 'reduced' if reduce else 'complete',
+            'columns': model.omp.num_cols,
+            'rows': model.omp.num_rows,
+            'build': round(min(build), 4),
+            'time': round(min(times), 4),
+            'objective': objective[0]
+        })
+
+    return rows
+
+
+def benchmark_memory(problem: Problem, parms: Parmeters) -> List[Row]:
+    """This function measures the memory of the domain objects of an 
+    instance (stockpiles, engines, inputs and outputs, with their qualities), 
+    the best time of a deep copy of a solution, which drags the problem along, 
+    and the throughput of the constructive, i.e. the schedules built per 
+    second from the same routes.
+
+    Args:
+        problem (Problem): The problem reference.
+        parms (Parmeters): The operating guidelines.
+
+    Returns:
+        List[Dict[str, Any]]: A single row.
+    """
+    tracemalloc.start()
+    objects: List[Any] = copy.deepcopy([
+        problem.stockpiles, problem.engines, problem.inputs, problem.outputs
+    ])
+    memory: int = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    model: LinModel = LinModel(problem)
+    model.log = False
+
+    solution: Solution = Solution(problem)
+    solution.set_objective(model.resolve())
+
+    constructive: PostModel = PostModel(problem, solution)
+    constructive.run()
+
+    copies: List[float] = []
+    builds: List[float] = []
+
+    for _ in range(parms['repeats']):
+        start: float = time.perf_counter()
+        copy.deepcopy(solution)
+        copies.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        for _ in range(1000): constructive.run(True)
+        builds.append(time.perf_counter() - start)
+
+    return [{
+        'objects': len(objects[0]) + len(objects[1]) + len(objects[2]) 
+            + len(objects[3]),
+        'memory': round(memory / 1024, 1),
+        'deepcopy': round(min(copies) * 1000, 3),
+        'builds': round(1000 / min(builds))
+    }]
+
+
+# benchmarks, by name, each one producing the rows of an instance
+BENCHMARKS: Dict[str, Callable[[Problem, Parmeters], List[Row]]] = {
+    'lp': benchmark_lp,
+    'presolve': benchmark_presolve,
+    'memory': benchmark_memory
+}
+
+
+def write_table(file_path: str, rows: List[Row]) -> None:
+    """This function writes a .csv table with the rows of the benchmark.
+
+    Args:
+        file_path (str): The table file path.
+        rows (List[Dict[str, Any]]): The benchmark rows.
+    """
+    os.makedirs(os.path.dirname(file_path), exist_ok=True)
+    with open(file_path, 'w', newline='') as file:
+        writer = csv.DictWriter(file, fieldnames=list(rows[0]) if rows else [])
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def read_args(args: List[str], parms: Parmeters) -> None:
+    """This function reads the input arguments.
+
+    Args:
+        args (List[str]): The terminal argument list.
+        parms (Parmeters): The operating guidelines.
+    """
+    if len(args) < 2: print_usage(parms)
+
+    index: int = 2
+    while index < len(args):
+        option: str = args[index]
+        index += 1
+
+        if option == '-instances': parms['instances'] = args[index]
+        elif option == '-repeats': parms['repeats'] = int(args[index])
+        else: print_usage(parms)
+        index += 1
+
+    if parms['repeats'] < 1: print_usage(parms)
+
+
+def print_usage(parms: Parmeters) -> None:
+    """This function prints the program usage.
+
+    Args:
+        parms (Parmeters): The operating guidelines.
+    """
+    usage: str = \
+        f'Usage: python3 src/benchmark.py <benchmark> [options]\n' + \
+        f'    <benchmark> : {", ".join(BENCHMARKS)}.\n' + \
+        f'\nOptions:\n' + \
+        f'    -instances <instances> : instances of the benchmark, e.g. 1-10 or b1-b10,s1 (default: {parms["instances"]}).\n' + \
+        f'    -repeats <repeats>     : repetitions of each measure, of which the best is kept (default: {parms["repeats"]}).\n' + \
+        f'\nExamples:\n' + \
+        f'    python3 src/benchmark.py lp\n' + \
+        f'    python3 src/benchmark.py lp -instances b1-b10 -repeats 5\n' + \
+        f'    python3 src/benchmark.py presolve -instances m1-m10,b1-b10\n' + \
+        f'    python3 src/benchmark.py memory -instances s1-s10,b1-b10 -repeats 5\n' + \
+        f'\nThe results table is written to out/results/benchmark_<benchmark>.csv.\n'
+
+    print(usage)
+    sys.exit()
+
+
+if __name__ == '__main__':
+    main()
@@ -24,6 +24,8 @@ Objective = Tuple[Optional[float], Weights, Weights]
 # type aliases for the solver
 Route = List[Tuple[float, int, int, str]]
 Routes = List[List[Tuple[int, str]]]
+Candidate = Tuple[int, ...]
+Payload = List[Tuple[int, ...]]
 
 # type aliases for instance generator data
 QualityIni = List[Dict[str, Union[str, float]]]
@@ -0,0 +1,338 @@
+from config import Parmeters
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import List, Dict, Tuple, Union, Optional, Any
+import subprocess
+import itertools
+import ujson
+import csv
+import sys
+import os
+
+# type aliases for the experiment jobs
+Option = Dict[str, Union[str, int, float]]
+Variant = Tuple[str, Option]
+Job = Dict[str, Any]
+
+# variants of each experiment, i.e. the output folder and the solver options
+EXPERIMENTS: Dict[str, List[Variant]] = {
+    'constructive': [('constructive', {})],
+    'lahc': [('heuristic/lahc', {'algorithm': 'lahc'})],
+    'sa': [('heuristic/sa', {'algorithm': 'sa'})],
+    'tabu': [('heuristic/tabu', {'algorithm': 'tabu'})],
+    'lns': [('heuristic/lns', {'algorithm': 'lns'})],
+    'pt': [('heuristic/pt', {'algorithm': 'pt'})],
+    'memetic': [('heuristic/memetic', {'algorithm': 'memetic'})],
+    'inverse': [
+        ('inverse', {'constructive': 'premodel'}),
+        ('inverse/lahc', {'constructive': 'premodel', 'algorithm': 'lahc'}),
+        ('inverse/sa', {'constructive': 'premodel', 'algorithm': 'sa'})
+    ],
+    'feedback': [
+        ('feedback/lahc', {'feedback': 5, 'algorithm': 'lahc'}),
+        ('feedback/sa', {'feedback': 5, 'algorithm': 'sa'})
+    ],
+    'default': [('', {})]
+}
+
+EXPERIMENTS['all'] = [
+    variant for name in ('constructive', 'lahc', 'sa', 'inverse', 'feedback')
+    for variant in EXPERIMENTS[name]
+]
+
+def main():
+    """This is the main function of the experiment runner, responsible of
+    expanding the parameter grid into jobs, running them in parallel and
+    writing the consolidated results table.
+    """
+    parms: Parmeters = {
+        'instances': '1-10',
+        'seeds': '1-5',
+        'workers': os.cpu_count() or 1,
+        'timeout': 0.0,
+        'grid': {}
+    }
+
+    read_args(sys.argv, parms)
+
+    experiment: str = sys.argv[1]
+    jobs: List[Job] = expand(experiment, parms)
+
+    # jobs whose output already exists were finished by a previous execution
+    pending: List[Job] = [
+        job for job in jobs if not os.path.exists(job['path'])
+    ]
+
+    print(f'{experiment}: {len(jobs)} jobs, {len(jobs) - len(pending)} done, '
+          f'{len(pending)} to run with {parms["workers"]} workers.')
+
+    with ThreadPoolExecutor(max_workers=parms['workers']) as pool:
+        futures = [
+            pool.submit(execute, job, parms['timeout']) for job in pending
+        ]
+
+        for count, future in enumerate(as_completed(futures), 1):
+            job: Job = future.result()
+            log: str = ''
+            if job['status'] != 'done' and os.path.exists(job['log']):
+                log = f' (see {job["log"]})'
+
+            print(
+                f'[{count}/{len(pending)}] {job["output"]}: {job["status"]}'
+                f'{log}'
+            )
+
+    write_table(f'./out/results/{experiment}.csv', jobs)
+
+
+def expand(experiment: str, parms: Parmeters) -> List[Job]:
+    """This function expands the parameter grid of an experiment into jobs,
+    one for each instance, seed, variant and combination of grid values.
+
+    Args:
+        experiment (str): The experiment name.
+        parms (Parmeters): The operating guidelines.
+
+    Returns:
+        List[Dict[str, Any]]: List of jobs, each one with the instance, seed,
+            solver options, output file name, its path and the path of the 
+            log of its errors.
+    """
+    if experiment not in EXPERIMENTS: print_usage(parms)
+
+    grid: Dict[str, List[str]] = parms['grid']
+    combinations: List[Dict[str, str]] = [
+        dict(zip(grid.keys(), values))
+        for values in itertools.product(*grid.values())
+    ]
+
+    jobs: List[Job] = []
+    for folder, options in EXPERIMENTS[experiment]:
+        for combination in combinations:
+            suffix: str = ''.join(
+                f'_{key}{value}' for key, value in combination.items()
+            )
+
+            for instance in parse_list(parms['instances'], 'instance_'):
+                for seed in parse_list(parms['seeds']):
+                    name: str = instance.replace('instance_', '').upper()
+                    output: str = os.path.join(
+                        folder, f'I{name}S{seed}{suffix}.json'
+                    )
+
+                    jobs.append({
+                        'instance': instance,
+                        'seed': seed,
+                        'folder': folder,
+                        'options': {**options, **combination, 'seed': seed},
+                        'output': output,
+                        'path': './out/json/' + output,
+                        'log': './out/json/' + 
+                            os.path.splitext(output)[0] + '.log',
+                        'status': 'done'
+                    })
+
+    return jobs
+
+
+def execute(job: Job, timeout: float) -> Job:
+    """This function runs a single job in its own solver process.
+
+    Args:
+        job (Dict[str, Any]): The job to be executed.
+        timeout (float): Maximum time, in seconds, for the job (0 means that
+            there is no time limit).
+
+    Returns:
+        Dict[str, Any]: The job, with its status updated and the errors of 
+            the solver, if any, written to its log.
+    """
+    command: List[str] = [
+        sys.executable, os.path.join(os.path.dirname(__file__), 'main.py'),
+        f'{job["instance"]}.json', job['output']
+    ]
+
+    for option, value in job['options'].items():
+        command += [f'-{option}', str(value)]
+
+    stderr: bytes = b''
+    try:
+        process = subprocess.run(
+            command,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            timeout=timeout if timeout > 0 else None
+        )
+
+        stderr = process.stderr
+        job['status'] = 'done' if process.returncode == 0 \
+            and os.path.exists(job['path']) else 'failed'
+
+    except subprocess.TimeoutExpired as error:
+        stderr = error.stderr or b''
+        job['status'] = 'timeout'
+
+    # e.g. the traceback of a failed job, while the log of a previous 
+    # execution is removed if this one has no errors
+    if stderr:
+        os.makedirs(os.path.dirname(job['log']), exist_ok=True)
+        with open(job['log'], 'wb') as file: file.write(stderr)
+
+    elif os.path.exists(job['log']): os.remove(job['log'])
+
+    return job
+
+
+def write_table(file_path: str, jobs: List[Job]) -> None:
+    """This function writes a .csv table with the results of all the jobs of
+    the experiment, including the ones executed previously.
+
+    Args:
+        file_path (str): The table file path.
+        jobs (List[Dict[str, Any]]): The experiment jobs.
+    """
+    keys: List[str] = sorted({
+        key for job in jobs for key in job['options'] if key != 'seed'
+    })
+
+    os.makedirs(os.path.dirname(file_path), exist_ok=True)
+    with open(file_path, 'w', newline='') as file:
+        writer = csv.writer(file)
+        writer.writerow(
+            ['instance', 'seed', 'folder'] + keys +
+            ['status', 'objective', 'makespan', 'gap', 'time']
+        )
+
+        for job in jobs:
+            result: Optional[Dict[str, Any]] = read_result(job['path'])
+
+            writer.writerow(
+                [job['instance'], job['seed'], job['folder']] +
+                [job['options'].get(key, '') for key in keys] +
+                ([
+                    job['status'],
+                    result['objective'],
+                    result['makespan'],
+                    ' '.join(str(gap) for gap in result['gap']),
+                    result.get('time', '')
+                ] if result is not None else [job['status'], '', '', '', ''])
+            )
+
+
+def read_result(file_path: str) -> Optional[Dict[str, Any]]:
+    """This function reads the main results of a solution file, written in
+    any of the output formats of the solver.
+
+    Args:
+        file_path (str): The solution file path.
+
+    Returns:
+        Optional[Dict[str, Any]]: Dictionary with the objective, makespan,
+            gaps and time of the solution or None if the file does not exist.
+    """
+    if not os.path.exists(file_path): return None
+
+    with open(file_path, 'r') as file:
+        lines: List[str] = file.read().splitlines()
+
+    # the first line of a ndjson file is the header and the others are records
+    try:
+        result: Dict[str, Any] = ujson.loads('\n'.join(lines))
+        reclaims: List[Dict[str, Any]] = result['reclaims']
+
+    except ValueError:
+        result = ujson.loads(lines[0])
+        reclaims = [
+            record for record in map(ujson.loads, lines[1:])
+            if record['type'] == 'reclaim'
+        ]
+
+    result['makespan'] = round(max(
+        [item['start_time'] + item['duration'] for item in reclaims],
+        default=0
+    ), 2)
+
+    return result
+
+
+def parse_list(value: str, prefix: str = '') -> List[str]:
+    """This function parses a list of values separated by commas, in which
+    ranges such as 1-10 or b1-b10 are expanded.
+
+    Args:
+        value (str): The list to be parsed.
+        prefix (str): Prefix added to each value. Defaults to ''.
+
+    Returns:
+        List[str]: The expanded list of values.
+    """
+    values: List[str] = []
+
+    for item in value.split(','):
+        if '-' in item:
+            first, last = item.split('-')
+            name: str = first.rstrip('0123456789')
+            values += [
+                f'{prefix}{name}{n}' for n in
+                range(int(first[len(name):]), int(last[len(name):]) + 1)
+            ]
+
+        else:
+            values.append(f'{prefix}{item}')
+
+    return values
+
+
+def read_args(args: List[str], parms: Parmeters) -> None:
+    """This function reads the input arguments.
+
+    Args:
+        args (List[str]): The terminal argument list.
+        parms (Parmeters): The operating guidelines.
+    """
+    if len(args) < 2: print_usage(parms)
+
+    index: int = 2
+    while index < len(args):
+        option: str = args[index]
+        index += 1
+
+        if option == '-instances': parms['instances'] = args[index]
+        elif option == '-seeds': parms['seeds'] = args[index]
+        elif option == '-workers': parms['workers'] = int(args[index])
+        elif option == '-timeout': parms['timeout'] = float(args[index])
+        elif option == '-grid' and '=' in args[index]:
+            key, values = args[index].split('=', 1)
+            parms['grid'][key] = values.split(',')
+        else: print_usage(parms)
+        index += 1
+
+
+def print_usage(parms: Parmeters) -> None:
+    """This function prints the program usage.
+
+    Args:
+        parms (Parmeters): The operating guidelines.
+    """
+    usage: str = \
+        f'Usage: python3 src/experiment.py <experiment> [options]\n' + \
+        f'    <experiment> : {", ".join(EXPERIMENTS)}.\n' + \
+        f'\nOptions:\n' + \
+        f'    -instances <instances> : instances to be solved, e.g. 1-10 or b1-b10,s1 (default: {parms["instances"]}).\n' + \
+        f'    -seeds <seeds>         : random seeds, e.g. 1-5 or 1,3 (default: {parms["seeds"]}).\n' + \
+        f'    -workers <workers>     : number of jobs executed in parallel (default: {parms["workers"]}).\n' + \
+        f'    -timeout <timeout>     : maximum time of each job in seconds, 0 for no limit (default: {parms["timeout"]}).\n' + \
+        f'    -grid <option=values>  : solver option and its values separated by commas (repeatable).\n' + \
+        f'\nExamples:\n' + \
+        f'    python3 src/experiment.py all\n' + \
+        f'    python3 src/experiment.py lahc -instances s1-s10 -seeds 1-3 -workers 8\n' + \
+        f'    python3 src/experiment.py sa -grid alpha=0.9,0.98 -grid t0=1,1e5\n' + \
+        f'\nThe solutions are written to the out/json folder, jobs whose solution already exists are\n' + \
+        f'skipped, the errors of each job are written next to its solution (.log), and the results\n' + \
+        f'table is written to out/results/<experiment>.csv.\n'
+
+    print(usage)
+    sys.exit()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,88 @@
+from config import Parmeters
+from model.generator import Generator
+from typing import List
+import sys
+import os
+
+def main():
+    """This is the main function of the instance generator, responsible of
+    parsing the input and writing the generated instance.
+    """
+    parms: Parmeters = {
+        'name': '',
+        'seed': 0,
+        'stockpiles': 32,
+        'engines': 8,
+        'yards': 4,
+        'inputs': 3,
+        'outputs': 1,
+        'parameters': 6,
+        'demand': 0.3
+    }
+
+    read_args(sys.argv, parms)
+
+    file_name: str = sys.argv[1]
+    if parms['name'] == '':
+        parms['name'] = os.path.splitext(os.path.basename(file_name))[0]
+
+    generator: Generator = Generator(**parms)
+    generator.write('./tests/' + file_name)
+
+
+def read_args(args: List[str], parms: Parmeters) -> None:
+    """This function reads the input arguments.
+
+    Args:
+        args (List[str]): The terminal argument list.
+        parms (Parmeters): The operating guidelines.
+    """
+    if len(args) < 2: print_usage(parms)
+
+    index: int = 2
+    while index < len(args):
+        option: str = args[index]
+        index += 1
+
+        if option == '-name': parms['name'] = args[index]
+        elif option == '-seed': parms['seed'] = int(args[index])
+        elif option == '-stockpiles': parms['stockpiles'] = int(args[index])
+        elif option == '-engines': parms['engines'] = int(args[index])
+        elif option == '-yards': parms['yards'] = int(args[index])
+        elif option == '-inputs': parms['inputs'] = int(args[index])
+        elif option == '-outputs': parms['outputs'] = int(args[index])
+        elif option == '-parameters': parms['parameters'] = int(args[index])
+        elif option == '-demand': parms['demand'] = float(args[index])
+        else: print_usage(parms)
+        index += 1
+
+
+def print_usage(parms: Parmeters) -> None:
+    """This function prints the program usage.
+
+    Args:
+        parms (Parmeters): The operating guidelines.
+    """
+    usage: str = \
+        f'Usage: python3 src/generate.py <output> [options]\n' + \
+        f'    <output> : Name of the (output) instance file.\n' + \
+        f'\nOptions:\n' + \
+        f'    -name <name>             : instance name (default: output file name).\n' + \
+        f'    -seed <seed>             : random seed (default: {parms["seed"]}).\n' + \
+        f'    -stockpiles <stockpiles> : number of stockpiles (default: {parms["stockpiles"]}).\n' + \
+        f'    -engines <engines>       : number of engines (default: {parms["engines"]}).\n' + \
+        f'    -yards <yards>           : number of yards, served by yards + 1 rails (default: {parms["yards"]}).\n' + \
+        f'    -inputs <inputs>         : number of ore inputs (default: {parms["inputs"]}).\n' + \
+        f'    -outputs <outputs>       : number of output requests (default: {parms["outputs"]}).\n' + \
+        f'    -parameters <parameters> : number of quality parameters (default: {parms["parameters"]}).\n' + \
+        f'    -demand <demand>         : fraction of the initial ore requested by the outputs (default: {parms["demand"]}).\n' + \
+        f'\nExamples:\n' + \
+        f'    python3 src/generate.py instance_g1.json\n' + \
+        f'    python3 src/generate.py instance_g2.json -seed 2 -stockpiles 400 -engines 24 -yards 6 -outputs 5 -parameters 10\n'
+
+    print(usage)
+    sys.exit()
+
+
+if __name__ == '__main__':
+    main()
@@ -1,50 +1,190 @@
 from config import Objective, Parmeters
-from algorithm.constructive import Constructive, LinModel, PreModel, PostModel
+from algorithm.constructive import Constructive, LinModel, PreModel, PostModel, \
+    Backend, CBC, HiGHS, Portfolio, Convergence, Delta, Replanner, LowerBound
 from algorithm.neighborhood import Shift, SimpleSwap, Swap, Switch, \
     SmartSimpleSwap, SmartShift, SmartSwap, SmartSwitch
-from algorithm.heuristic import Heuristic, SA, LAHC
+from algorithm.heuristic import Heuristic, SA, LAHC, TabuSearch, VND, LNS, \
+    ParallelTempering, ElitePool, PathRelinking, Memetic, Exact
+from algorithm.heuristic.payload import encode, decode
+from algorithm.constructive.portfolio import Round
+from algorithm.streams import spawn, MODEL, HEURISTIC, POLISH
+from config import Payload
 from model.problem import Problem
 from model.solution import Solution
-from typing import List, Optional
-import random
+from concurrent.futures import ProcessPoolExecutor, Future
+from typing import List, Tuple, Optional
+import copy
+import os
 import sys
 import time
 
+# the heuristic approaches of the -algorithm option, '' for none
+ALGORITHMS: Tuple[str, ...] = (
+    '', 'lahc', 'sa', 'tabu', 'vnd', 'lns', 'pt', 'memetic', 'exact'
+)
+
 def main():
     """This is the main function of the program, responsible of parsing the 
     input, instantiating moves and heuristics and printing the results.
     """
-    parms: Parmeters = {
+    parms: Parmeters = default_parms()
+
+    read_args(sys.argv, parms)
+    
+    start: float = time.time()
+    problem: Problem = Problem('./tests/' + sys.argv[1])
+    model: LinModel = LinModel(problem)
+
+    solution: Solution = run(problem, model, parms)
+    solution.write(
+        './out/json/' + sys.argv[2], time.time() - start, parms['format']
+    )
+
+    if parms['jobs'] != '': 
+        solution.write_jobs('./out/jobs/' + parms['jobs'])
+
+
+def default_parms() -> Parmeters:
+    """This function creates the default operating guidelines.
+
+    Returns:
+        Parmeters: The operating guidelines, with their default values.
+    """
+    return {
         'constructive': 'postmodel',
         'algorithm': '',
+        'arithmetic': 'float',
+        'lp': 'cbc',
+        'threads': 0,
+        'lptime': 0.0,
+        'lpgap': 1e-4,
+        'emphasis': 0,
+        'verbose': 0,
+        'format': 'pretty',
+        'jobs': '',
         'feedback': 0,
+        'portfolio': 1,
+        'pipeline': 0,
+        'patience': 0,
+        'delta': '',
         'seed': 0,
         'maxiters': int(1e3),
+        'tolerance': 0.0,
         'lsize': int(1e3),
         'alpha': 0.9,
         'samax': int(1e3),
-        't0': 1.0
+        't0': 1.0,
+        'tenure': 50,
+        'batch': 10,
+        'improvement': 'first',
+        'polish': 0,
+        'destroy': 3,
+        'repair': 'greedy',
+        'replicas': 4,
+        'tmin': 0.01,
+        'tmax': 1.0,
+        'exchange': 100,
+        'starts': 1,
+        'elite': 0,
+        'diversity': 0.1,
+        'population': 20,
+        'mutation': 2,
+        'local': 10,
+        'miptime': 60.0,
+        'mipgap': 1e-4,
+        'checkpoint': '',
+        'every': int(1e3),
+        'resume': ''
     }
 
-    read_args(sys.argv, parms)
-    
-    random.seed(parms['seed'])
-    problem: Problem = Problem('./tests/' + sys.argv[1])
-    solution: Solution = Solution(problem)
-    model: LinModel = LinModel(problem)
 
+def run(problem: Problem, model: LinModel, parms: Parmeters) -> Solution:
+    """This function solves a problem, from the constructive procedure to the 
+    feedback approach, and returns the solution ready to be written.
+
+    Args:
+        problem (Problem): The problem reference.
+        model (LinModel): The linear model.
+        parms (Parmeters): The operating guidelines.
+
+    Returns:
+        Solution: The solution, with its deliveries already defined.
+    """
+    # each component draws from its own stream of the seed
+    model.rng = spawn(parms['seed'], *MODEL)
+    model.backend = create_backend(parms)
+    model.time = 0.0
+
+    solution: Solution = Solution(problem, parms['arithmetic'] == 'fixed')
     constructive: Constructive = construct(problem, solution, model, parms)
 
+    pool: Optional[ElitePool] = ElitePool(
+        parms['elite'], parms['diversity']
+    ) if parms['elite'] > 0 else None
+
+    # the configured heuristic, which also runs in the feedback approach
     solver: Optional[Heuristic] = None
     if parms['algorithm'] != '':
-        solver = solve(problem, solution, constructive, parms)
-        solution = solver.best_solution
-
+        if parms['starts'] > 1:
+            solution = multi_start(problem, solution, constructive, pool, parms)
+            solver = create_heuristic(problem, constructive, parms, pool)
+
+        else:
+            solver = solve(problem, solution, constructive, parms, pool)
+            solution = solver.best_solution
+
+        # the elite solutions are connected to the best one
+        if pool is not None:
+            relinking: PathRelinking = PathRelinking(
+                problem, constructive, pool
+            )
+            relinking.run(solution, parms['maxiters'])
+            solution = relinking.best_solution
+
+    # the feedback may converge before its last interaction
+    converged: Tuple[str, int] = ('', 0)
     if parms['feedback'] > 0: 
-        feedback_approach(solution, model, solver, constructive, parms)
+        solution, converged = feedback_approach(
+            solution, model, solver, constructive, parms
+        )
+
+    if parms['polish'] > 0:
+        solution = polish(problem, solution, constructive, parms)
+
+    # the changes known after the plan was made, applied to it
+    if parms['delta'] != '':
+        replanner: Replanner = Replanner(problem, model, constructive)
+        replanner.replan(solution, Delta.load('./tests/' + parms['delta']))
 
     solution.set_deliveries()
-    solution.write('./out/json/' + sys.argv[2])
+    solution.lp_status = model.status
+    solution.lp_time = model.time
+    solution.converged, solution.rounds_saved = converged
+
+    return solution
+
+
+def create_backend(parms: Parmeters, exact: bool = False) -> Backend:
+    """This function creates the selected solver backend of the linear 
+    model, with its solver controls, or the backend of the exact method.
+
+    Args:
+        parms (Parmeters): The operating guidelines.
+        exact (bool): True for the backend of the exact method, which is 
+            always CBC, since it solves an integer program. Defaults to False.
+
+    Returns:
+        Backend: The solver backend.
+    """
+    backend: Backend = CBC() if parms['lp'] == 'cbc' or exact else HiGHS()
+
+    backend.threads = parms['threads']
+    backend.time_limit = parms['miptime'] if exact else parms['lptime']
+    backend.gap = parms['mipgap'] if exact else parms['lpgap']
+    backend.emphasis = parms['emphasis']
+    backend.verbose = parms['verbose'] > 0
+
+    return backend
 
 
 def construct(
@@ -102,7 +242,9 @@ def solve(
     problem: Problem,
     solution: Solution,
     constructive: Constructive, 
-    parms: Parmeters
+    parms: Parmeters,
+    pool: Optional[ElitePool] = None,
+    key: Tuple[int, ...] = HEURISTIC
 ) -> Optional[Heuristic]:
     """This functions runs the selected heuristic approach.
 
@@ -111,6 +253,55 @@ def solve(
         solution (Solution): The solution reference.
         constructive (Constructive): The constructive procedure.
         parms (Parmeters): The operating guidelines.
+        pool (Optional[ElitePool]): The elite pool fed by the heuristic, if 
+            there is one. Defaults to None.
+        key (Tuple[int, ...]): The key of the random stream of the heuristic. 
+            Defaults to HEURISTIC.
+
+    Returns:
+        Optional[Heuristic]: The heuristic procedure.
+    """
+    solver: Heuristic = create_heuristic(
+        problem, constructive, parms, pool, key
+    )
+
+    # only the first run is checkpointed, the feedback ones are short
+    if parms['checkpoint'] != '': 
+        solver.checkpoint = './out/checkpoints/' + parms['checkpoint']
+        solver.every = parms['every']
+
+    # a missing checkpoint starts the run, so that it is always relaunched 
+    # with the same command
+    if parms['resume'] != '' \
+    and os.path.exists('./out/checkpoints/' + parms['resume']):
+        solver.resume = './out/checkpoints/' + parms['resume']
+
+    solver.run(solution, parms['maxiters'])
+    solver.offer(solver.best_solution)
+    solver.checkpoint = ''
+
+    return solver
+
+
+def create_heuristic(
+    problem: Problem,
+    constructive: Constructive, 
+    parms: Parmeters,
+    pool: Optional[ElitePool] = None,
+    key: Tuple[int, ...] = HEURISTIC
+) -> Optional[Heuristic]:
+    """This functions creates the selected heuristic approach, with its 
+    neighborhoods, random stream, elite pool and lower bound, without 
+    running it.
+
+    Args:
+        problem (Problem): The problem reference.
+        constructive (Constructive): The constructive procedure.
+        parms (Parmeters): The operating guidelines.
+        pool (Optional[ElitePool]): The elite pool fed by the heuristic, if 
+            there is one. Defaults to None.
+        key (Tuple[int, ...]): The key of the random stream of the heuristic. 
+            Defaults to HEURISTIC.
 
     Returns:
         Optional[Heuristic]: The heuristic procedure.
@@ -120,14 +311,149 @@ def solve(
     elif parms['algorithm'] == 'sa': solver = SA(
         problem, parms['alpha'], parms['t0'], parms['samax']
     )
+    elif parms['algorithm'] == 'tabu': solver = TabuSearch(
+        problem, parms['tenure'], parms['batch']
+    )
+    elif parms['algorithm'] == 'vnd': solver = VND(
+        problem, parms['improvement'] == 'first'
+    )
+    elif parms['algorithm'] == 'lns': solver = LNS(
+        problem, constructive, parms['destroy'], parms['repair'] == 'regret'
+    )
+    elif parms['algorithm'] == 'pt': solver = ParallelTempering(
+        problem, parms['replicas'], parms['tmin'], parms['tmax'], 
+        parms['exchange']
+    )
+    elif parms['algorithm'] == 'memetic': solver = Memetic(
+        problem, parms['population'], parms['mutation'], parms['local']
+    )
+    elif parms['algorithm'] == 'exact': solver = Exact(
+        problem, constructive, create_backend(parms, True)
+    )
     else: print_usage(parms)
 
     create_neighborhoods(problem, solver, constructive)
-    solver.run(solution, parms['maxiters'])
+    solver.rng = spawn(parms['seed'], *key)
+    solver.elite = pool
+
+    # the run stops as soon as it reaches the lower bound of the makespan
+    if parms['tolerance'] >= 0:
+        solver.bound = LowerBound(problem, constructive)
+        solver.tolerance = parms['tolerance']
 
     return solver
 
 
+def multi_start(
+    problem: Problem,
+    solution: Solution,
+    constructive: Constructive, 
+    pool: Optional[ElitePool],
+    parms: Parmeters
+) -> Solution:
+    """This function runs the selected heuristic approach several times, 
+    from the same initial solution with independent random streams of the 
+    seed, in parallel processes, whose elite solutions feed the shared elite 
+    pool.
+
+    Args:
+        problem (Problem): The problem reference.
+        solution (Solution): The initial solution.
+        constructive (Constructive): The constructive procedure.
+        pool (Optional[ElitePool]): The shared elite pool, if there is one.
+        parms (Parmeters): The operating guidelines.
+
+    Returns:
+        Solution: The best solution found by the runs.
+    """
+    with ProcessPoolExecutor(min(parms['starts'], os.cpu_count() or 1)) \
+    as executor:
+        futures: List[Future] = [
+            executor.submit(
+                start, problem, solution, constructive, parms, k
+            ) for k in range(parms['starts'])
+        ]
+
+        payloads: List[Payload] = [
+            payload for future in futures for payload in future.result()
+        ]
+
+    # the routes are evaluated again with the weights of this process
+    best: Solution = solution
+    for payload in payloads:
+        candidate: Solution = copy.deepcopy(solution)
+        for e, route in enumerate(decode(payload)):
+            candidate.routes[e][:] = route
+
+        constructive.solution = candidate
+        constructive.run(True)
+
+        if pool is not None: pool.add(candidate)
+        if candidate.cost < best.cost: best = candidate
+
+    return best
+
+
+def start(
+    problem: Problem,
+    solution: Solution,
+    constructive: Constructive, 
+    parms: Parmeters,
+    k: int
+) -> List[Payload]:
+    """This function runs the selected heuristic approach in a process of 
+    the multi-start mode.
+
+    Args:
+        problem (Problem): The problem reference.
+        solution (Solution): The initial solution.
+        constructive (Constructive): The constructive procedure.
+        parms (Parmeters): The operating guidelines.
+        k (int): The index of this run, which defines its random stream.
+
+    Returns:
+        List[Payload]: The route payloads of the elite solutions of this run 
+            or only of its best solution, if there is no elite pool.
+    """
+    pool: Optional[ElitePool] = ElitePool(
+        parms['elite'], parms['diversity']
+    ) if parms['elite'] > 0 else None
+
+    solver: Heuristic = solve(
+        problem, solution, constructive, parms, pool, HEURISTIC + (k,)
+    )
+
+    if pool is None: return [encode(solver.best_solution.routes)]
+    return [encode(elite.routes) for elite in pool.solutions]
+
+
+def polish(
+    problem: Problem,
+    solution: Solution,
+    constructive: Constructive, 
+    parms: Parmeters
+) -> Solution:
+    """This function polishes a solution with the Variable Neighborhood 
+    Descent, which stops at a local optimum of all of its neighborhoods.
+
+    Args:
+        problem (Problem): The problem reference.
+        solution (Solution): The solution to be polished.
+        constructive (Constructive): The constructive procedure.
+        parms (Parmeters): The operating guidelines.
+
+    Returns:
+        Solution: The polished solution.
+    """
+    solver: VND = VND(problem, parms['improvement'] == 'first')
+
+    create_neighborhoods(problem, solver, constructive)
+    solver.rng = spawn(parms['seed'], *POLISH)
+    solver.run(solution, parms['maxiters'])
+
+    return solver.best_solution
+
+
 def create_neighborhoods(
     problem: Problem, 
     solver: Heuristic, 
@@ -156,8 +482,12 @@ def feedback_approach(
     solver: Optional[Heuristic],
     constructive: Constructive,
     parms: Parmeters
-) -> None:
-    """This functions runs the feedback approach.
+) -> Tuple[Solution, Tuple[str, int]]:
+    """This functions runs the feedback approach. At each interaction, the 
+    routes are built again for the weights of the linear model and, if there 
+    is a heuristic, its best solution for these weights is carried to the 
+    next interaction. The best solution of all the interactions is kept, 
+    since a later one may be worse.
 
     Args:
         solution (Solution): The solution reference.
@@ -165,16 +495,85 @@ def feedback_approach(
         solver (Heuristic): The heuristic procedure.
         constructive (Constructive): The constructive procedure.
         parms (Parmeters): The operating guidelines.
+
+    Returns:
+        Tuple[Solution, Tuple[str, int]]: The best solution of the 
+            interactions and the criterion that stopped the interactions 
+            early, or '' if all of them were executed, with the interactions 
+            saved.
     """
-    for _ in range(parms['feedback']):
-        model.add_weights('x', list(solution.weights.values()))
-        model.add_weights('y', list(solution.inputs.values()))
+    # the pipeline needs a heuristic whose run overlaps the next resolution
+    pipeline: bool = parms['pipeline'] == 1 and solver != None
 
-        objective: Objective = model.resolve()
-        solution.set_objective(objective)
+    portfolio: Optional[Portfolio] = None
+    if parms['portfolio'] > 1 or pipeline:
+        portfolio = Portfolio(
+            solution.problem, model, parms['portfolio'], 
+            parms['arithmetic'] == 'fixed'
+        )
 
-        constructive.run()
-        if solver != None: solver.run(solution, parms['maxiters'], True)
+    # the round submitted in background for the next interaction, if any
+    pending: Optional[Round] = None
+
+    convergence: Optional[Convergence] = None
+    if parms['patience'] > 0:
+        convergence = Convergence(parms['patience'])
+        convergence.start(solution)
+
+    # the next interactions change the solution in place
+    best: Solution = copy.deepcopy(solution)
+
+    i: int = 0
+    try:
+        while i < parms['feedback']:
+            objective: Objective
+
+            if pending != None and not portfolio.is_stale(pending, solution):
+                objective = portfolio.collect(pending)
+
+            elif portfolio != None: 
+                if pending != None: portfolio.discard(pending)
+                objective = portfolio.resolve(solution)
+
+            else:
+                model.add_weights('x', list(solution.weights.values()))
+                model.add_weights('y', list(solution.inputs.values()))
+                objective = model.resolve()
+
+            pending = None
+            if convergence != None and convergence.is_repeated(objective): 
+                break
+
+            solution.set_objective(objective)
+
+            # the constructive may still evaluate a copy made by the heuristic
+            constructive.solution = solution
+            constructive.run()
+            if solver != None: 
+                # the next resolution starts from the weights of this one, 
+                # which the heuristic is not expected to change
+                if pipeline and i + 1 < parms['feedback']:
+                    pending = portfolio.submit(solution)
+
+                # the best solution of the previous weights is not comparable
+                solver.run(solution, parms['maxiters'])
+                solution = solver.best_solution
+
+            # e.g. the winner of a portfolio must have been evaluated again
+            assert solution.matches_weights(), \
+                'the reclaims of the solution do not match its weights.'
+
+            if solution.cost < best.cost: best = copy.deepcopy(solution)
+
+            i += 1
+            if convergence != None and convergence.update(solution): break
+
+    finally:
+        if pending != None: portfolio.discard(pending)
+        if portfolio != None: portfolio.close()
+
+    if convergence == None or convergence.reason == '': return best, ('', 0)
+    return best, (convergence.reason, parms['feedback'] - i)
 
 
 def read_args(args: List[str], parms: Parmeters) -> None:
@@ -193,9 +592,23 @@ def read_args(args: List[str], parms: Parmeters) -> None:
 
         if option == '-constructive': parms['constructive'] = args[index]
         elif option == '-algorithm': parms['algorithm'] = args[index]
+        elif option == '-arithmetic': parms['arithmetic'] = args[index]
+        elif option == '-lp': parms['lp'] = args[index]
+        elif option == '-threads': parms['threads'] = int(args[index])
+        elif option == '-lptime': parms['lptime'] = float(args[index])
+        elif option == '-lpgap': parms['lpgap'] = float(args[index])
+        elif option == '-emphasis': parms['emphasis'] = int(args[index])
+        elif option == '-verbose': parms['verbose'] = int(args[index])
+        elif option == '-format': parms['format'] = args[index]
+        elif option == '-jobs': parms['jobs'] = args[index]
         elif option == '-feedback': parms['feedback'] = int(args[index])
+        elif option == '-portfolio': parms['portfolio'] = int(args[index])
+        elif option == '-pipeline': parms['pipeline'] = int(args[index])
+        elif option == '-patience': parms['patience'] = int(args[index])
+        elif option == '-delta': parms['delta'] = args[index]
         elif option == '-seed': parms['seed'] = int(args[index])
         elif option == '-maxiters': parms['maxiters'] = int(args[index])
+        elif option == '-tolerance': parms['tolerance'] = float(args[index])
 
         # LAHC
         elif option == '-lsize': parms['lsize'] = int(args[index])
@@ -204,9 +617,92 @@ def read_args(args: List[str], parms: Parmeters) -> None:
         elif option == '-alpha': parms['alpha'] = float(args[index])
         elif option == '-samax': parms['samax'] = int(args[index])
         elif option == '-t0': parms['t0'] = float(args[index])
+
+        # Tabu Search
+        elif option == '-tenure': parms['tenure'] = int(args[index])
+        elif option == '-batch': parms['batch'] = int(args[index])
+
+        # VND
+        elif option == '-improvement': parms['improvement'] = args[index]
+        elif option == '-polish': parms['polish'] = int(args[index])
+
+        # LNS
+        elif option == '-destroy': parms['destroy'] = int(args[index])
+        elif option == '-repair': parms['repair'] = args[index]
+
+        # Parallel Tempering
+        elif option == '-replicas': parms['replicas'] = int(args[index])
+        elif option == '-tmin': parms['tmin'] = float(args[index])
+        elif option == '-tmax': parms['tmax'] = float(args[index])
+        elif option == '-exchange': parms['exchange'] = int(args[index])
+
+        # multi-start and elite pool
+        elif option == '-starts': parms['starts'] = int(args[index])
+        elif option == '-elite': parms['elite'] = int(args[index])
+        elif option == '-diversity': parms['diversity'] = float(args[index])
+
+        # Memetic Algorithm
+        elif option == '-population': parms['population'] = int(args[index])
+        elif option == '-mutation': parms['mutation'] = int(args[index])
+        elif option == '-local': parms['local'] = int(args[index])
+
+        # Exact
+        elif option == '-miptime': parms['miptime'] = float(args[index])
+        elif option == '-mipgap': parms['mipgap'] = float(args[index])
+
+        # checkpoints
+        elif option == '-checkpoint': parms['checkpoint'] = args[index]
+        elif option == '-every': parms['every'] = int(args[index])
+        elif option == '-resume': parms['resume'] = args[index]
         else: print_usage(parms)
         index += 1
 
+    if parms['constructive'] != 'premodel' \
+    and parms['constructive'] != 'postmodel':
+        print_usage(parms)
+
+    if parms['algorithm'] not in ALGORITHMS:
+        print_usage(parms)
+
+    if parms['repair'] != 'greedy' and parms['repair'] != 'regret':
+        print_usage(parms)
+
+    if parms['replicas'] < 1 or parms['exchange'] < 1 \
+    or not 0 < parms['tmin'] <= parms['tmax']:
+        print_usage(parms)
+
+    if parms['starts'] < 1 or parms['elite'] < 0:
+        print_usage(parms)
+
+    if parms['population'] < 2 or parms['mutation'] < 0 or parms['local'] < 0:
+        print_usage(parms)
+
+    # only LAHC, SA and Tabu Search runs, in a single process, can be resumed
+    if (parms['checkpoint'] != '' or parms['resume'] != '') \
+    and (parms['algorithm'] not in ('lahc', 'sa', 'tabu') 
+         or parms['starts'] > 1):
+        print_usage(parms)
+
+    if parms['improvement'] != 'first' and parms['improvement'] != 'best':
+        print_usage(parms)
+
+    if parms['arithmetic'] != 'float' and parms['arithmetic'] != 'fixed':
+        print_usage(parms)
+
+    if parms['format'] not in ('pretty', 'compact', 'ndjson'):
+        print_usage(parms)
+
+    if parms['lp'] != 'cbc' and parms['lp'] != 'highs':
+        print_usage(parms)
+
+    if parms['threads'] < -1 or parms['lptime'] < 0 or parms['lpgap'] < 0 \
+    or parms['emphasis'] not in (0, 1, 2):
+        print_usage(parms)
+
+    if parms['portfolio'] < 1 or parms['pipeline'] not in (0, 1) \
+    or parms['patience'] < 0:
+        print_usage(parms)
+
 
 def print_usage(parms: Parmeters) -> None:
     """This function prints the program usage.
@@ -220,20 +716,72 @@ def print_usage(parms: Parmeters) -> None:
         f'    <output> : Name of the (output) solution file.\n' + \
         f'\nOptions:\n' + \
         f'    -constructive <constructive> : premodel, postmodel (default: {parms["constructive"]}).\n' + \
-        f'    -algorithm <algorithm>       : lahc, sa.\n' + \
+        f'    -algorithm <algorithm>       : {", ".join(ALGORITHMS[1:])}.\n' + \
+        f'    -arithmetic <arithmetic>     : float, fixed (default: {parms["arithmetic"]}).\n' + \
+        f'    -lp <lp>                     : solver of the linear model, cbc, highs (default: {parms["lp"]}).\n' + \
+        f'    -threads <threads>           : threads of the linear model solver, 0 for its default, -1 for all cores (default: {parms["threads"]}).\n' + \
+        f'    -lptime <lptime>             : maximum time of each linear model resolution in seconds, 0 for no limit (default: {parms["lptime"]}).\n' + \
+        f'    -lpgap <lpgap>               : relative gap of the linear model solver (default: {parms["lpgap"]}).\n' + \
+        f'    -emphasis <emphasis>         : search emphasis of the linear model solver, 0 default, 1 feasibility, 2 optimality (default: {parms["emphasis"]}).\n' + \
+        f'    -verbose <verbose>           : 1 to print the log of the linear model solver (default: {parms["verbose"]}).\n' + \
+        f'    -format <format>             : pretty, compact, ndjson (default: {parms["format"]}).\n' + \
+        f'    -jobs <jobs>                 : name of the (optional) binary columnar job table file (.npz).\n' + \
         f'    -feedback <feedback>         : maximum number of feedback interactions with the model (defaulf: {parms["feedback"]}).\n' + \
+        f'    -portfolio <portfolio>       : linear models solved in parallel at each feedback interaction, keeping the best (default: {parms["portfolio"]}).\n' + \
+        f'    -pipeline <pipeline>         : 1 to solve the next feedback linear models in background while the heuristic runs (default: {parms["pipeline"]}).\n' + \
+        f'    -patience <patience>         : feedback interactions without improvement before stopping, also stopped by repeated linear model results, 0 to always run all of them (default: {parms["patience"]}).\n' + \
         f'    -seed <seed>                 : random seed (default: {parms["seed"]}).\n' + \
         f'    -maxiters <maxiters>         : maximum number of interactions (default: {parms["maxiters"]}).\n' + \
+        f'    -tolerance <tolerance>       : relative tolerance over the makespan lower bound within which LAHC, SA and Tabu Search stop, negative to never stop (default: {parms["tolerance"]}).\n' + \
+        f'    -delta <delta>               : name of the (optional) file with the changes of the instance, applied to the plan by replanning it (.json).\n' + \
+        f'    -checkpoint <checkpoint>     : name of the (optional) checkpoint file of the LAHC, SA and Tabu Search runs (.npz).\n' + \
+        f'    -every <every>               : iterations between the checkpoints (default: {parms["every"]}).\n' + \
+        f'    -resume <checkpoint>         : name of the checkpoint file from which the run is resumed, if it exists.\n' + \
         f'\n    LAHC parameters:\n' + \
         f'        -lsize <lsize> : LAHC list size (default: {parms["lsize"]}).\n' + \
-        f'\n    SA parameters:\n' + \
+        f'\n    SA parameters (maxiters counts the iterations without improving the best solution):\n' + \
         f'        -alpha <alpha> : cooling rate for the Simulated Annealing (default: {parms["alpha"]}).\n' + \
         f'        -samax <samax> : iterations before updating the temperature for Simulated Annealing (default: {parms["samax"]}).\n' + \
         f'        -t0 <t0>       : initial temperature for the Simulated Annealing (default: {parms["t0"]}). \n' + \
+        f'\n    Tabu Search parameters (maxiters is the number of batches):\n' + \
+        f'        -tenure <tenure> : size of the tabu list (default: {parms["tenure"]}).\n' + \
+        f'        -batch <batch>   : neighbors evaluated at each iteration (default: {parms["batch"]}).\n' + \
+        f'\n    VND parameters:\n' + \
+        f'        -improvement <improvement> : first, best (default: {parms["improvement"]}).\n' + \
+        f'        -polish <polish>           : 1 to polish the final solution with the VND (default: {parms["polish"]}).\n' + \
+        f'\n    LNS parameters:\n' + \
+        f'        -destroy <destroy> : stockpiles removed by the random destroy operator (default: {parms["destroy"]}).\n' + \
+        f'        -repair <repair>   : greedy, regret (default: {parms["repair"]}).\n' + \
+        f'\n    Parallel Tempering parameters:\n' + \
+        f'        -replicas <replicas> : number of replicas, each one in a worker process (default: {parms["replicas"]}).\n' + \
+        f'        -tmin <tmin>         : temperature of the coldest replica (default: {parms["tmin"]}).\n' + \
+        f'        -tmax <tmax>         : temperature of the hottest replica (default: {parms["tmax"]}).\n' + \
+        f'        -exchange <exchange> : iterations between the replica exchanges (default: {parms["exchange"]}).\n' + \
+        f'\n    Multi-start and elite pool parameters:\n' + \
+        f'        -starts <starts>       : parallel runs of the algorithm, with independent random streams (default: {parms["starts"]}).\n' + \
+        f'        -elite <elite>         : size of the elite pool connected by path relinking, 0 to disable it (default: {parms["elite"]}).\n' + \
+        f'        -diversity <diversity> : minimum distance between elite solutions, as a fraction of the jobs (default: {parms["diversity"]}).\n' + \
+        f'\n    Memetic Algorithm parameters (maxiters is the number of offspring):\n' + \
+        f'        -population <population> : number of individuals (default: {parms["population"]}).\n' + \
+        f'        -mutation <mutation>     : random moves applied to each offspring (default: {parms["mutation"]}).\n' + \
+        f'        -local <local>           : local search iterations applied to each offspring (default: {parms["local"]}).\n' + \
+        f'\n    Exact method parameters (for small instances, e.g. s1-s10):\n' + \
+        f'        -miptime <miptime> : maximum time of each resolution in seconds, 0 for no limit (default: {parms["miptime"]}).\n' + \
+        f'        -mipgap <mipgap>   : relative gap in which each resolution stops (default: {parms["mipgap"]}).\n' + \
         f'\nExamples:\n' + \
         f'    python3 src/main.py instance_1.json out_1.json\n' + \
         f'    python3 src/main.py instance_1.json out_1.json -constructive premodel -seed 1\n' + \
-        f'    python3 src/main.py instance_1.json out_1.json -algorithm sa -alpha 0.98 -samax 1000 -t0 1e5\n'
+        f'    python3 src/main.py instance_1.json out_1.json -algorithm sa -alpha 0.98 -samax 1000 -t0 1e5\n' + \
+        f'    python3 src/main.py instance_1.json out_1.json -algorithm pt -replicas 8\n' + \
+        f'    python3 src/main.py instance_b1.json out_b1.json -feedback 5 -threads 1 -lptime 10\n' + \
+        f'    python3 src/main.py instance_m1.json out_m1.json -algorithm lahc -feedback 5 -portfolio 4\n' + \
+        f'    python3 src/main.py instance_b1.json out_b1.json -algorithm sa -feedback 10 -pipeline 1\n' + \
+        f'    python3 src/main.py instance_b1.json out_b1.json -algorithm lahc -feedback 20 -patience 3\n' + \
+        f'    python3 src/main.py instance_s1.json out_s1.json -algorithm sa -maxiters 100000 -tolerance 0.01\n' + \
+        f'    python3 src/main.py instance_s1.json out_s1.json -algorithm exact -miptime 30\n' + \
+        f'    python3 src/main.py instance_1.json out_1.json -algorithm lahc -starts 4 -elite 10\n' + \
+        f'    python3 src/main.py instance_b1.json out_b1.json -algorithm lahc -checkpoint b1.npz -resume b1.npz\n' + \
+        f'    python3 src/main.py instance_b5.json out_b5.json -delta delta_b5.json\n'
     
     print(usage)
     sys.exit()
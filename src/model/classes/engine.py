@@ -7,6 +7,10 @@ class Engine:
     working configuration, whether as a stacker, reclaimer or both.
     """
 
+    __slots__ = (
+        '_id', '_speed_stack', '_speed_reclaim', '_pos_ini', '_rail', '_yards'
+    )
+
     def __init__(
         self: 'Engine', 
         id: int,
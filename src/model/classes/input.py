@@ -8,6 +8,8 @@ class Input:
     when the input is available.
     """
 
+    __slots__ = ('_id', '_weight', '_quality', '_time')
+
     def __init__(
         self: 'Input',
         id: int,
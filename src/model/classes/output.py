@@ -7,6 +7,8 @@ class Output:
     of ore requested in the output, the quality parameters of these ores and 
     when the output request can be started."""
 
+    __slots__ = ('_id', '_destination', '_weight', '_quality', '_time')
+
     def __init__(
         self: 'Output',
         id: int,
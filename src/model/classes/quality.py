@@ -3,6 +3,8 @@ class Quality:
     parameter name and its percentage.
     """
 
+    __slots__ = ('_parameter', '_value')
+
     def __init__(self: 'Quality', parameter: str, value: float):
         """Instantiates a new Quality parameter.
 
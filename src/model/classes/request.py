@@ -7,6 +7,8 @@ class Request(Quality):
     percentage and its importance on the request.
     """
 
+    __slots__ = ('_minimum', '_maximum', '_goal', '_importance')
+
     def __init__(
         self: 'Request', 
         parameter: str,
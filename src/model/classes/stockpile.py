@@ -8,6 +8,11 @@ class Stockpile:
     access to it, its ore capacity, initial weight and quality parameters.
     """
 
+    __slots__ = (
+        '_id', '_position', '_yard', '_rails', '_capacity', '_weight_ini', 
+        '_quality_ini'
+    )
+
     def __init__(
         self: 'Stockpile',
         id: int,
@@ -0,0 +1,390 @@
+from config import Instance, QualityIni, Stock, Eng, Inp, Out, Travels, \
+    Qualities
+from typing import List, Tuple
+import random
+import ujson
+import os
+
+
+class Generator:
+    """This class represents a Generator of synthetic instances for the Ore
+    Mixing Problem and the Machine Scheduling Problem. The instances follow
+    the same .json schema read by the Problem class and are built from a
+    seed, so that the same parameters always produce the same instance.
+
+    The yard layout is consistent by construction: the stockpiles are placed
+    in a line and distributed among the yards, each yard is served by the
+    rails on both of its sides, and each engine runs on a single rail with
+    access to the yards next to it. Thus, every engine can reach at least
+    one stockpile and every stockpile can be reached by at least one engine.
+    """
+
+    def __init__(
+        self: 'Generator',
+        name: str,
+        seed: int = 0,
+        stockpiles: int = 32,
+        engines: int = 8,
+        yards: int = 4,
+        inputs: int = 3,
+        outputs: int = 1,
+        parameters: int = 6,
+        demand: float = 0.3
+    ):
+        """Instantiates a new Generator.
+
+        Args:
+            name (str): The instance name.
+            seed (int): The random seed. Defaults to 0.
+            stockpiles (int): The number of stockpiles. Defaults to 32.
+            engines (int): The number of engines. Defaults to 8.
+            yards (int): The number of yards, which are served by yards + 1
+                rails. Defaults to 4.
+            inputs (int): The number of ore inputs. Defaults to 3.
+            outputs (int): The number of output requests. Defaults to 1.
+            parameters (int): The number of quality parameters. Defaults to 6.
+            demand (float): Fraction of the initial ore in the yard that is
+                requested by all outputs together. Defaults to 0.3.
+        """
+
+        assert stockpiles >= yards > 0, \
+            'each yard must have at least one stockpile.'
+
+        assert engines > 0 and inputs > 0 and outputs > 0 and parameters > 0, \
+            'the instance must have engines, inputs, outputs and parameters.'
+
+        assert 0 < demand < 1, 'the demand must be a fraction of the yard.'
+
+        self._name: str = name
+        self._seed: int = seed
+        self._stockpiles: int = stockpiles
+        self._engines: int = engines
+        self._yards: int = yards
+        self._inputs: int = inputs
+        self._outputs: int = outputs
+        self._parameters: int = parameters
+        self._demand: float = demand
+
+        # travel time is the setup time plus the time to cross each position
+        self._setup_time: float = 10.0
+        self._position_time: float = 20.0
+
+        # ranges of the quality parameters, defined for each generation
+        self._ranges: List[Tuple[str, float, float]] = []
+
+        self._random: random.Random = random.Random(seed)
+
+    def generate(self: 'Generator') -> Instance:
+        """This method generates a new instance.
+
+        Returns:
+            Dict[str, Union[str, Stock, Eng, Inp, Out, Travels]]: The instance
+                data, with the same keys and structure of the .json files read
+                by the Problem class.
+        """
+
+        # restarts the random stream so that the instance only depends on seed
+        self._random.seed(self._seed)
+
+        # the first parameters follow the usual iron ore quality parameters 
+        # and the remaining ones are generic
+        self._ranges = [
+            ('Fe', 50.0, 95.0),
+            ('SiO2', 0.0, 1.0),
+            ('Al2O3', 0.0, 6.0),
+            ('P', 0.0, 2.0),
+            ('+31.5', 0.0, 1.0),
+            ('-6.3', 2.0, 6.0)
+        ][:self._parameters] + [
+            (f'Q{j + 1}', 0.0, 10.0) for j in range(6, self._parameters)
+        ]
+
+        stockpiles: Stock = self.__stockpiles()
+        distances: Travels = [
+            [float(abs(i - j)) for j in range(self._stockpiles)]
+            for i in range(self._stockpiles)
+        ]
+
+        return {
+            'info': [self._name, 1000, 1],
+            'stockpiles': stockpiles,
+            'engines': self.__engines(),
+            'inputs': self.__inputs(stockpiles),
+            'outputs': self.__outputs(stockpiles),
+            'distancesTravel': distances,
+            'timeTravel': [
+                [self._setup_time + self._position_time * d for d in line]
+                for line in distances
+            ]
+        }
+
+    def write(self: 'Generator', file_path: str) -> None:
+        """This method generates a new instance and writes it in a .json file
+        and, for that, the UltraJSON packege is necessary.
+
+        UltraJSON is an ultra fast JSON encoder and decoder written in pure C
+        with bindings for Python 3.5+. To install it just run pip as usual on
+        the command prompt:
+
+            $ pip install ujson
+
+        For more information, access https://pypi.org/project/ujson/.
+
+        Args:
+            file_path (str): The instance file path.
+        """
+
+        instance: Instance = self.generate()
+
+        os.makedirs(os.path.dirname(file_path) or '.', exist_ok=True)
+        with open(file_path, 'w') as file:
+            ujson.dump(instance, file, indent=2)
+
+    def __quality(self: 'Generator') -> QualityIni:
+        """This method draws the quality parameters of an ore. It is called
+        within generate() and there is no need to use it afterwards.
+
+        Returns:
+            List[Dict[str, Union[str, float]]]: List with the quality
+                parameters.
+        """
+
+        return [
+            {
+                'parameter': parameter,
+                'value': round(self._random.uniform(low, high), 2)
+            } for parameter, low, high in self._ranges
+        ]
+
+    def __stockpiles(self: 'Generator') -> Stock:
+        """This method generates the stockpiles, which are placed in a line
+        and distributed among the yards alternately. It is called within
+        generate() and there is no need to use it afterwards.
+
+        Returns:
+            List[Dict[str, Union[int, float, List[int], QualityIni]]]: List
+                with the stockpile data.
+        """
+
+        stockpiles: Stock = []
+
+        for i in range(self._stockpiles):
+            capacity: float = round(self._random.uniform(1500, 2100), 1)
+            yard: int = i % self._yards + 1
+
+            stockpiles.append({
+                'id': i + 1,
+                'position': i,
+                'yard': yard,
+                'rails': [yard, yard + 1],
+                'capacity': capacity,
+                'weightIni': round(
+                    capacity * self._random.uniform(0.7, 0.95), 1
+                ),
+                'qualityIni': self.__quality()
+            })
+
+        return stockpiles
+
+    def __engines(self: 'Generator') -> Eng:
+        """This method generates the engines, which are distributed among the
+        rails alternately, and each one has access to the yards next to its
+        rail. It is called within generate() and there is no need to use it
+        afterwards.
+
+        Returns:
+            List[Dict[str, Union[int, float, List[int]]]]: List with the engine
+                data.
+        """
+
+        engines: Eng = []
+
+        for e in range(self._engines):
+            rail: int = e % (self._yards + 1) + 1
+
+            # the initial position is one of the stockpiles on the rail
+            reachable: List[int] = [
+                i for i in range(self._stockpiles)
+                if rail in (i % self._yards + 1, i % self._yards + 2)
+            ]
+
+            engines.append({
+                'id': e + 1,
+                'speedStack': round(self._random.uniform(20, 50), 1),
+                'speedReclaim': round(self._random.uniform(20, 50), 1),
+                'posIni': self._random.choice(reachable),
+                'rail': rail,
+                'yards': [
+                    yard for yard in (rail - 1, rail)
+                    if 1 <= yard <= self._yards
+                ]
+            })
+
+        return engines
+
+    def __inputs(self: 'Generator', stockpiles: Stock) -> Inp:
+        """This method generates the ore inputs, whose total weight is a
+        fraction of the free capacity of the yard. It is called within
+        generate() and there is no need to use it afterwards.
+
+        Args:
+            stockpiles (Stock): List with the stockpile data.
+
+        Returns:
+            List[Dict[str, Union[int, float, QualityIni]]]: List with the ore
+                input data.
+        """
+
+        free: float = sum(
+            stp['capacity'] - stp['weightIni'] for stp in stockpiles
+        )
+
+        return [
+            {
+                'id': h + 1,
+                'weight': round(
+                    free * self._random.uniform(0.2, 0.5) / self._inputs, 1
+                ),
+                'quality': self.__quality(),
+                'time': round(self._random.uniform(1, 10), 1)
+            } for h in range(self._inputs)
+        ]
+
+    def __outputs(self: 'Generator', stockpiles: Stock) -> Out:
+        """This method generates the output requests. The requested weights
+        add up to the demand fraction of the initial ore in the yard and the
+        quality limits are drawn around the mean quality of the yard, so that
+        the requests can be met by blending. It is called within generate()
+        and there is no need to use it afterwards.
+
+        Args:
+            stockpiles (Stock): List with the stockpile data.
+
+        Returns:
+            List[Dict[str, Union[int, float, Qualities]]]: List with the output
+                request data.
+        """
+
+        total: float = sum(stp['weightIni'] for stp in stockpiles)
+        shares: List[float] = [
+            self._random.uniform(0.5, 1.5) for _ in range(self._outputs)
+        ]
+
+        # mean quality of the yard, weighted by the ore in each stockpile
+        mean: List[float] = [
+            sum(
+                stp['weightIni'] * stp['qualityIni'][j]['value']
+                for stp in stockpiles
+            ) / total for j in range(self._parameters)
+        ]
+
+        outputs: Out = []
+
+        for k, share in enumerate(shares):
+            quality: Qualities = []
+
+            for j, (parameter, low, high) in enumerate(self._ranges):
+                spread: float = (high - low) * self._random.uniform(0.05, 0.2)
+                goal: float = mean[j] + spread * self._random.uniform(-0.5, 0.5)
+
+                quality.append({
+                    'parameter': parameter,
+                    'minimum': round(max(low, goal - spread), 2),
+                    'maximum': round(min(high, goal + spread), 2),
+                    'goal': round(goal, 2),
+                    'importance': self._random.choice([10, 100, 1000])
+                })
+
+            outputs.append({
+                'id': k + 1,
+                'destination': k + 1,
+                'weight': round(
+                    total * self._demand * share / sum(shares), 1
+                ),
+                'quality': quality,
+                'time': round(self._random.uniform(1, 10), 1)
+            })
+
+        return outputs
+
+    # region simple getters and setters
+    @property
+    def name(self: 'Generator') -> str:
+        """str: The instance name."""
+        return self._name
+
+    @name.setter
+    def name(self: 'Generator', value: str) -> None:
+        self._name = value
+
+    @property
+    def seed(self: 'Generator') -> int:
+        """int: The random seed."""
+        return self._seed
+
+    @seed.setter
+    def seed(self: 'Generator', value: int) -> None:
+        self._seed = value
+
+    @property
+    def stockpiles(self: 'Generator') -> int:
+        """int: The number of stockpiles."""
+        return self._stockpiles
+
+    @stockpiles.setter
+    def stockpiles(self: 'Generator', value: int) -> None:
+        self._stockpiles = value
+
+    @property
+    def engines(self: 'Generator') -> int:
+        """int: The number of engines."""
+        return self._engines
+
+    @engines.setter
+    def engines(self: 'Generator', value: int) -> None:
+        self._engines = value
+
+    @property
+    def yards(self: 'Generator') -> int:
+        """int: The number of yards."""
+        return self._yards
+
+    @yards.setter
+    def yards(self: 'Generator', value: int) -> None:
+        self._yards = value
+
+    @property
+    def inputs(self: 'Generator') -> int:
+        """int: The number of ore inputs."""
+        return self._inputs
+
+    @inputs.setter
+    def inputs(self: 'Generator', value: int) -> None:
+        self._inputs = value
+
+    @property
+    def outputs(self: 'Generator') -> int:
+        """int: The number of output requests."""
+        return self._outputs
+
+    @outputs.setter
+    def outputs(self: 'Generator', value: int) -> None:
+        self._outputs = value
+
+    @property
+    def parameters(self: 'Generator') -> int:
+        """int: The number of quality parameters."""
+        return self._parameters
+
+    @parameters.setter
+    def parameters(self: 'Generator', value: int) -> None:
+        self._parameters = value
+
+    @property
+    def demand(self: 'Generator') -> float:
+        """float: Fraction of the initial ore requested by all outputs."""
+        return self._demand
+
+    @demand.setter
+    def demand(self: 'Generator', value: float) -> None:
+        self._demand = value
@@ -1,6 +1,7 @@
-from config import Stockpiles, Engines, Inputs, Outputs, Travels
+from config import Stockpiles, Engines, Inputs, Outputs, Travels, Instance
 from model.classes import Stockpile, Engine, Input, Output, Quality, Request
-from typing import List, Union
+from typing import List, Union, Optional
+import numpy as np
 import ujson
 
 
@@ -18,15 +19,21 @@ class Problem:
     For more information, access https://pypi.org/project/ujson/.
     """
 
-    def __init__(self: 'Problem', instance_path: str):
+    def __init__(self: 'Problem', instance_path: Union[str, Instance]):
         """Build a new Problem from a file.
         
         Args:
-            instance_path (str): The instance file path.
+            instance_path (Union[str, Instance]): The instance file path or 
+                the instance data already loaded, with the same structure of 
+                the .json file.
         """
         
-        with open(instance_path, 'r') as file:
-            data = ujson.load(file)
+        if isinstance(instance_path, str):
+            with open(instance_path, 'r') as file:
+                data = ujson.load(file)
+
+        else:
+            data = instance_path
 
         self._info: List[Union[str, int]] = data['info']
 
@@ -75,6 +82,52 @@ class Problem:
         self._distances_travel: Travels = data['distancesTravel']
         self._time_travel: Travels = data['timeTravel']
 
+        # quality matrices, built on demand by their getters
+        self._quality_matrix: Optional[np.ndarray] = None
+        self._request_matrix: Optional[np.ndarray] = None
+
+    @property
+    def quality_matrix(self: 'Problem') -> np.ndarray:
+        """np.ndarray: Matrix with the quality parameters of each stockpile, in 
+        which the lines are the stockpiles and the columns, the parameters. It 
+        is built on the first access and cached afterwards.
+        """
+
+        if self._quality_matrix is None:
+            self._quality_matrix = np.array([
+                [quality.value for quality in stp.quality_ini]
+                for stp in self._stockpiles
+            ], dtype=float)
+
+        return self._quality_matrix
+
+    @property
+    def request_matrix(self: 'Problem') -> np.ndarray:
+        """np.ndarray: Tensor with the minimum, maximum and goal of each 
+        requested quality parameter, in this order, in which the lines of each 
+        matrix are the requests and the columns, the parameters. It is built 
+        on the first access and cached afterwards.
+        """
+
+        if self._request_matrix is None:
+            self._request_matrix = np.array([
+                [
+                    [getattr(request, bound) for request in out.quality]
+                    for out in self._outputs
+                ] for bound in ('minimum', 'maximum', 'goal')
+            ], dtype=float)
+
+        return self._request_matrix
+
+    def reset_matrices(self: 'Problem') -> None:
+        """This method discards the cached quality matrices. It must be called 
+        whenever the stockpiles or the outputs change, so that the matrices 
+        are built again on their next access.
+        """
+
+        self._quality_matrix = None
+        self._request_matrix = None
+
     # region simple getters and setters
     @property
     def info(self: 'Problem') -> List[Union[str, int]]:
@@ -1,8 +1,9 @@
 from config import Routes, Weights, Jobs, Deliveries, Result, Qualities, Objective
-from model.classes import Request
 from .problem import Problem
-from typing import Optional, List, Tuple
+from typing import Optional, List, Tuple, Union, Dict, Set, Callable, IO, Any
 import numpy as np
+import tempfile
+import copy
 import ujson
 import os
 
@@ -12,20 +13,38 @@ class Solution:
     and the Ore Mixing Problem.
     """
 
-    def __init__(self: 'Solution', problem: Problem):
+    def __init__(self: 'Solution', problem: Problem, fixed_point: bool = False):
         """Instantiates a new Solution.
      
         Args:
             problem (Problem): Problem considered.
+            fixed_point (bool): True if the times of the schedule must be 
+                represented as integer hundredths of the time unit, False if 
+                they must be represented as rounded floats. The fixed point 
+                times are converted back only when writing the solution. 
+                Defaults to False.
         """
 
         self._problem: Problem = problem
+        self._fixed_point: bool = fixed_point
 
         # Ore Mixing Problem
         self._objective: Optional[float] = None 
         self._weights: Weights = []
         self._inputs: Weights = []
 
+        # report of the linear model resolutions, recorded with the solution
+        self._lp_status: str = ''
+        self._lp_time: float = 0.0
+
+        # report of the feedback approach, recorded if it converged early
+        self._converged: str = ''
+        self._rounds_saved: int = 0
+
+        # report of the exact method, recorded if the schedule comes from it
+        self._mip_status: str = ''
+        self._mip_bound: float = 0.0
+
         # Machine Scheduling Problem
         self._cost: float = float('inf')
         self._routes: Routes = [[] for _ in range(len(problem.engines))]
@@ -47,25 +66,22 @@ class Solution:
 
         self._has_deliveries = True
 
-        # defines the quality values ​​of each parameter for each order
-        self.__quality_mean()
-
-        # iterates over a list of requests to save quality data
-        requests: List[List[Request]] = [
-            out.quality for out in self._problem.outputs
-        ]
+        # calculates the delivered quality and its deviation from the limits
+        quality: np.ndarray = self.quality()
+        deviations: np.ndarray = self.deviations(quality)
 
         # saves quality data for each parameter of each request
-        for req, out in zip(requests, self._problem.outputs):
+        for k, out in enumerate(self._problem.outputs):
             quality_list: Qualities = [
                 {
-                    'parameter': quality.parameter,
-                    'value': quality.value,
-                    'minimum': quality.minimum, 
-                    'maximum': quality.maximum,
-                    'goal': quality.goal,
-                    'importance': quality.importance
-                } for quality in req
+                    'parameter': request.parameter,
+                    'value': round(float(quality[k, j]), 2),
+                    'minimum': request.minimum, 
+                    'maximum': request.maximum,
+                    'goal': request.goal,
+                    'importance': request.importance,
+                    'deviation': round(float(deviations[k, j]), 2)
+                } for j, request in enumerate(out.quality)
             ]
 
             # calculates the time the request was initiated and completed
@@ -73,6 +89,7 @@ class Solution:
             end: float
 
             start, end = self.work_time(out.id)
+            start, end = self.to_time(start), self.to_time(end)
 
             # calculates the optimal delivery duration
             optimal_duration: float = out.weight / sum([
@@ -150,7 +167,49 @@ class Solution:
 
         return start, end
 
-    def write(self: 'Solution', file_path: str, time) -> None:
+    def matches_weights(self: 'Solution') -> bool:
+        """This method checks if the reclaims were built for the weights of 
+        the solution, i.e. if the weight reclaimed from each stockpile for 
+        each request of the reclaims is its weight in the linear model result, 
+        rounded as in the reclaims.
+
+        Returns:
+            bool: True if the reclaims match the weights, False otherwise.
+        """
+
+        reclaimed: Dict[Tuple[int, int], float] = {}
+        for item in self._reclaims:
+            key: Tuple[int, int] = (item['output'] - 1, item['stockpile'] - 1)
+            reclaimed[key] = reclaimed.get(key, 0.0) + item['weight']
+
+        requests: Set[int] = {k for k, _ in reclaimed}
+        weights: List[List[float]] = list(self._weights.values())
+
+        return all(
+            abs(reclaimed.get((k, i), 0.0) - round(weight, 1)) < 1e-6
+            for k in requests for i, weight in enumerate(weights[k])
+        )
+
+    def to_time(self: 'Solution', value: Union[int, float]) -> float:
+        """This method converts a time of the schedule to the time unit used 
+        in the output file. In the fixed point mode the times are integer 
+        hundredths, otherwise they are already represented as floats.
+
+        Args:
+            value (Union[int, float]): The time of the schedule.
+
+        Returns:
+            float: The time in the output time unit.
+        """
+
+        return round(value / 100, 2) if self._fixed_point else value
+
+    def write(
+        self: 'Solution', 
+        file_path: str, 
+        time: Optional[float] = None,
+        mode: str = 'pretty'
+    ) -> None:
         """This method writes the solution in a .json file and, for that, 
         the UltraJSON packege is necessary.
     
@@ -162,25 +221,124 @@ class Solution:
 
         For more information, access https://pypi.org/project/ujson/.
 
+        The file is written atomically, i.e. the content is written to a 
+        temporary file in the same directory that then replaces the output 
+        file, so that a partial file is never observed.
+
         Args:
             file_path (str): The output file path.
+            time (Optional[float]): The execution time, in seconds, to be 
+                recorded with the solution. Defaults to None.
+            mode (str): The output format. It must be 'pretty' for an indented 
+                JSON, 'compact' for a JSON without indentation or 'ndjson' for 
+                a newline delimited JSON, whose first line has the solution 
+                header and each of the following lines a single stack, reclaim 
+                or output record, streamed as they are converted. Defaults to 
+                'pretty'.
         """
 
         assert self._has_deliveries, \
             'calling write() before mandatory call to set_deliveries().'
 
-        result: Result = {
-            'info': self._problem.info,
-            'objective': self._objective,
-            'gap': self._gap,
-            'stacks': self._stacks,
-            'reclaims': self._reclaims,
-            'outputs': self._deliveries
+        assert mode == 'pretty' or mode == 'compact' or mode == 'ndjson', \
+            'the output mode must be \'pretty\', \'compact\' or \'ndjson\'.'
+
+        def dump(file: IO) -> None:
+            if mode == 'ndjson':
+                file.write(ujson.dumps(self.__header(time)) + '\n')
+
+                for kind, jobs in (('stack', self._stacks), 
+                                   ('reclaim', self._reclaims)):
+                    for job in jobs:
+                        file.write(ujson.dumps(
+                            {'type': kind, **self.__convert_job(job)}
+                        ) + '\n')
+
+                for delivery in self._deliveries:
+                    file.write(
+                        ujson.dumps({'type': 'output', **delivery}) + '\n'
+                    )
+
+            else:
+                ujson.dump(
+                    self.payload(time), file, indent=2 if mode == 'pretty' else 0
+                )
+
+        self.__replace(file_path, 'w', dump)
+
+    def payload(self: 'Solution', time: Optional[float] = None) -> Result:
+        """This method builds the content of the solution file, the same one 
+        written by write() in the 'pretty' and 'compact' modes, so that it can 
+        be sent without touching the disk.
+
+        Args:
+            time (Optional[float]): The execution time, in seconds, to be 
+                recorded with the solution. Defaults to None.
+
+        Returns:
+            Dict[str, Union[str, float, Jobs, Deliveries]]: The solution 
+                data.
+        """
+
+        assert self._has_deliveries, \
+            'calling payload() before mandatory call to set_deliveries().'
+
+        result: Result = self.__header(time)
+        result['stacks'] = [self.__convert_job(job) for job in self._stacks]
+        result['reclaims'] = [self.__convert_job(job) for job in self._reclaims]
+        result['outputs'] = self._deliveries
+
+        return result
+
+    def write_jobs(self: 'Solution', file_path: str) -> None:
+        """This method writes the job table in a binary columnar .npz file 
+        and, for that, the NumPy package is required. The file holds one 
+        array for each attribute of the stacks and reclaims, prefixed with 
+        'stacks_' and 'reclaims_' respectively, and a 'time_scale' array with 
+        the number of stored time units in one unit of time, since in the 
+        fixed point mode the times are stored as integer hundredths.
+
+        Args:
+            file_path (str): The output file path.
+        """
+
+        columns: Dict[str, np.ndarray] = {
+            'time_scale': np.array([self.time_scale])
         }
 
-        os.makedirs(os.path.dirname(file_path), exist_ok=True)
-        with open(file_path, 'w') as file:
-            ujson.dump(result, file, indent=2)
+        for name, jobs in (('stacks', self._stacks), 
+                           ('reclaims', self._reclaims)):
+            for key, column in self.job_table(jobs).items():
+                columns[f'{name}_{key}'] = column
+
+        self.__replace(file_path, 'wb', lambda file: np.savez(file, **columns))
+
+    def job_table(self: 'Solution', jobs: Jobs) -> Dict[str, np.ndarray]:
+        """This method converts a list of jobs to a columnar table, in which 
+        the identifiers are integer arrays and the weights are float arrays. 
+        The times are integer arrays in the fixed point mode and float arrays 
+        otherwise.
+
+        Args:
+            jobs (List[Dict[str, Union[int, float]]]): The list of jobs.
+
+        Returns:
+            Dict[str, np.ndarray]: Dictionary whose keys are the attributes of 
+                the jobs and the values ​​are arrays with their information.
+        """
+
+        time_type: type = np.int64 if self._fixed_point else np.float64
+        keys: List[str] = list(jobs[0].keys()) if jobs else []
+
+        return {
+            key: np.fromiter(
+                (job[key] for job in jobs), 
+                np.float64 if key == 'weight' else 
+                time_type if key == 'start_time' or key == 'duration' else 
+                np.int32,
+                len(jobs)
+            ) for key in keys
+        }
 
     def reset(self: 'Solution') -> None:
         """This method is called whenever the solution should be reset 
@@ -190,9 +348,138 @@ class Solution:
         self._reclaims = []
         self._deliveries = []
 
-    def __quality_mean(self: 'Solution') -> None:
-        """This method calculates and sets the value of the final quality of 
-        each request and, for that, the NumPy package is required.
+    def __deepcopy__(self: 'Solution', memo: Dict[int, Any]) -> 'Solution':
+        """This method copies the solution, e.g. when a heuristic keeps its 
+        best one. The problem is shared with the copy instead of being copied 
+        along with its stockpiles, engines, inputs, outputs and travel times, 
+        since no solution changes it.
+
+        Args:
+            memo (Dict[int, Any]): The objects already copied, by their id.
+
+        Returns:
+            Solution: The copy of the solution.
+        """
+
+        memo[id(self._problem)] = self._problem
+
+        solution: Solution = Solution.__new__(Solution)
+        memo[id(self)] = solution
+
+        for name, value in self.__dict__.items():
+            setattr(solution, name, copy.deepcopy(value, memo))
+
+        return solution
+
+    def __header(self: 'Solution', time: Optional[float]) -> Result:
+        """This method builds the header of the solution file. It is called 
+        within write() and payload() and there is no need to use it afterwards.
+
+        Args:
+            time (Optional[float]): The execution time, in seconds, or None if 
+                it must not be recorded.
+
+        Returns:
+            Dict[str, Union[str, float, Jobs, Deliveries]]: The instance 
+                information, the objective value, the gaps and, if defined, 
+                the execution time, the status and wall time of the linear 
+                model resolutions, the early convergence of the feedback and 
+                the status and makespan bound of the exact method.
+        """
+
+        result: Result = {
+            'info': self._problem.info,
+            'objective': self._objective,
+            'gap': self._gap
+        }
+
+        if time is not None:
+            result['time'] = round(time, 2)
+
+        if self._lp_status != '':
+            result['lp_status'] = self._lp_status
+            result['lp_time'] = round(self._lp_time, 4)
+
+        if self._converged != '':
+            result['converged'] = self._converged
+            result['rounds_saved'] = self._rounds_saved
+
+        if self._mip_status != '':
+            result['mip_status'] = self._mip_status
+            result['mip_bound'] = round(self.to_time(self._mip_bound), 2)
+
+        return result
+
+    def __convert_job(
+        self: 'Solution', 
+        job: Dict[str, Union[int, float]]
+    ) -> Dict[str, Union[int, float]]:
+        """This method converts the times of a job to the time unit used in 
+        the output file. It is called within write() and payload() and there is 
+        no need to use it afterwards.
+
+        Args:
+            job (Dict[str, Union[int, float]]): The job.
+
+        Returns:
+            Dict[str, Union[int, float]]: The converted job.
+        """
+
+        if not self._fixed_point:
+            return job
+
+        return {
+            **job,
+            'start_time': self.to_time(job['start_time']),
+            'duration': self.to_time(job['duration'])
+        }
+
+    def __replace(
+        self: 'Solution', 
+        file_path: str, 
+        file_mode: str, 
+        dump: Callable[[IO], None]
+    ) -> None:
+        """This method atomically replaces a file. The content is dumped to a 
+        temporary file in the same directory, which is then renamed to the 
+        final path. It is called within the writing methods and there is no 
+        need to use it afterwards.
+
+        Args:
+            file_path (str): The output file path.
+            file_mode (str): The mode in which the temporary file is opened.
+            dump (Callable[[IO], None]): Function that writes the content to 
+                the opened file.
+        """
+
+        directory: str = os.path.dirname(file_path) or '.'
+        os.makedirs(directory, exist_ok=True)
+
+        fd, temp_path = tempfile.mkstemp(
+            dir=directory, prefix='.', suffix='.tmp'
+        )
+
+        try:
+            with os.fdopen(fd, file_mode) as file:
+                dump(file)
+
+            # the temporary file is created readable only by its owner
+            os.chmod(temp_path, 0o644)
+            os.replace(temp_path, file_path)
+
+        except BaseException:
+            os.remove(temp_path)
+            raise
+
+    def quality(
+        self: 'Solution', 
+        weights: Optional[List[List[float]]] = None
+    ) -> np.ndarray:
+        """This method calculates the quality delivered to each request as 
+        the weighted mean of the stockpile qualities and, for that, the NumPy 
+        package is required. All the requests are computed at once by a single 
+        matrix product with the quality matrix cached in the problem, which 
+        is not modified.
 
         NumPy is library that offers comprehensive mathematical functions, 
         random number generators, linear algebra routines, Fourier transforms, 
@@ -201,32 +488,63 @@ class Solution:
             $ pip install numpy
 
         For more information, access https://numpy.org/.
-        """
 
-        assert self._weights, \
-            'calling __quality_mean() with a empty list of weights.'
+        Args:
+            weights (Optional[List[List[float]]]): Matrix with the weights 
+                reclaimed from each stockpile (columns) for each request 
+                (lines). Defaults to None, in which case the weights of this 
+                solution are considered.
+
+        Returns:
+            np.ndarray: Matrix with the delivered quality, in which the lines 
+                are the requests and the columns, the quality parameters.
+        """
 
-        quality_list: List[List[float]] = [
-            [quality.value for quality in stp.quality_ini]  
-            for stp in self._problem.stockpiles
-        ]
+        if weights is None:
+            assert self._weights, \
+                'calling quality() with a empty list of weights.'
 
-        try:
-            # calculates the quality based on the weight taken from each pile
-            mean: List[List[float]] = [
-                list(np.average(quality_list, axis=0, weights=wl)) 
-                for wl in list(self._weights.values())
-            ]
+            weights = list(self._weights.values())
 
-            # assigns the calculated quality value to its respective parameter
-            for quality, out in zip(mean, self._problem.outputs):
-                for value, request in zip(quality, out.quality):
-                    request.value = round(value, 2)
+        matrix: np.ndarray = np.asarray(weights, dtype=float)
+        total: np.ndarray = matrix.sum(axis=1, keepdims=True)
 
-        # if the model is infeasible the np.average() function throws an exception
-        except ZeroDivisionError:
+        # if the model is infeasible there is no weight to compute the mean
+        if not np.all(total > 0):
             raise ZeroDivisionError('the model is infeasible or unbounded.')
 
+        return matrix @ self._problem.quality_matrix / total
+
+    def deviations(
+        self: 'Solution', 
+        quality: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """This method calculates how far the delivered quality of each 
+        parameter of each request is from the requested limits. Negative 
+        values are below the minimum, positive values are above the maximum 
+        and zero indicates that the parameter is within its limits.
+
+        Args:
+            quality (Optional[np.ndarray]): Matrix with the delivered quality, 
+                as returned by quality(). Defaults to None, in which case the 
+                quality of this solution is calculated.
+
+        Returns:
+            np.ndarray: Matrix with the deviations, in which the lines are the 
+                requests and the columns, the quality parameters.
+        """
+
+        if quality is None:
+            quality = self.quality()
+
+        minimum: np.ndarray
+        maximum: np.ndarray
+
+        minimum, maximum, _ = self._problem.request_matrix
+
+        return np.minimum(quality - minimum, 0) \
+             + np.maximum(quality - maximum, 0)
+
     # region simple getters and setters
     @property
     def problem(self: 'Solution') -> Problem:
@@ -237,6 +555,24 @@ class Solution:
     def problem(self: 'Solution', value: Problem) -> None:
         self._problem = value
     
+    @property
+    def fixed_point(self: 'Solution') -> bool:
+        """bool: Flag that indicates whether the times of the schedule are 
+        represented as integer hundredths of the time unit.
+        """
+        return self._fixed_point
+
+    @fixed_point.setter
+    def fixed_point(self: 'Solution', value: bool) -> None:
+        self._fixed_point = value
+
+    @property
+    def time_scale(self: 'Solution') -> int:
+        """int: Number of internal time units in one unit of time of the 
+        output file.
+        """
+        return 100 if self._fixed_point else 1
+
     @property
     def objective(self: 'Solution') -> Optional[float]:
         """Optional[float]: The solution objective value."""
@@ -268,6 +604,65 @@ class Solution:
     def inputs(self: 'Solution', value: Weights) -> None:
         self._inputs = value
 
+    @property
+    def lp_status(self: 'Solution') -> str:
+        """str: The status of the last resolution of the linear model or '' 
+        if it must not be recorded."""
+        return self._lp_status
+
+    @lp_status.setter
+    def lp_status(self: 'Solution', value: str) -> None:
+        self._lp_status = value
+
+    @property
+    def lp_time(self: 'Solution') -> float:
+        """float: Wall time, in seconds, of the resolutions of the linear 
+        model."""
+        return self._lp_time
+
+    @lp_time.setter
+    def lp_time(self: 'Solution', value: float) -> None:
+        self._lp_time = value
+
+    @property
+    def converged(self: 'Solution') -> str:
+        """str: The criterion that stopped the feedback approach early or '' 
+        if it must not be recorded."""
+        return self._converged
+
+    @converged.setter
+    def converged(self: 'Solution', value: str) -> None:
+        self._converged = value
+
+    @property
+    def rounds_saved(self: 'Solution') -> int:
+        """int: The feedback interactions saved by the early convergence."""
+        return self._rounds_saved
+
+    @rounds_saved.setter
+    def rounds_saved(self: 'Solution', value: int) -> None:
+        self._rounds_saved = value
+
+    @property
+    def mip_status(self: 'Solution') -> str:
+        """str: The status of the exact method that built the schedule or '' 
+        if it must not be recorded."""
+        return self._mip_status
+
+    @mip_status.setter
+    def mip_status(self: 'Solution', value: str) -> None:
+        self._mip_status = value
+
+    @property
+    def mip_bound(self: 'Solution') -> float:
+        """float: The lower bound of the makespan proved by the exact method, 
+        in the time representation of the schedule."""
+        return self._mip_bound
+
+    @mip_bound.setter
+    def mip_bound(self: 'Solution', value: float) -> None:
+        self._mip_bound = value
+
     @property
     def cost(self: 'Solution') -> float:
         """float: The solution cost."""
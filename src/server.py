@@ -0,0 +1,303 @@
+from config import Parmeters, Result, Instance
+from algorithm.constructive import LinModel
+from model.problem import Problem
+from main import default_parms, read_args, run
+from concurrent.futures import ProcessPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from socketserver import ThreadingMixIn, UnixStreamServer
+from collections import OrderedDict
+from contextlib import redirect_stdout
+from typing import List, Dict, Tuple, Union, Any
+import hashlib
+import signal
+import ujson
+import time
+import sys
+import io
+import os
+
+# instances already read by this worker, by their hash
+cache: 'OrderedDict[str, Instance]' = OrderedDict()
+cache_size: int = 16
+
+def main():
+    """This is the main function of the solve server, responsible of starting
+    the warm pool of solver processes and serving the solve requests.
+    """
+    parms: Parmeters = {
+        'host': '127.0.0.1',
+        'port': 8000,
+        'socket': '',
+        'workers': os.cpu_count() or 1,
+        'cache': 16,
+        'preload': ''
+    }
+
+    read_server_args(sys.argv, parms)
+
+    preload: List[str] = [
+        name for name in parms['preload'].split(',') if name != ''
+    ]
+
+    pool: ProcessPoolExecutor = ProcessPoolExecutor(
+        max_workers=parms['workers'],
+        initializer=warm,
+        initargs=(parms['cache'], preload)
+    )
+
+    # starts every worker now, so that the first requests are already warm
+    for future in [pool.submit(time.sleep, 0.1)
+                   for _ in range(parms['workers'])]:
+        future.result()
+
+    server: Union[ThreadingHTTPServer, UnixServer]
+    if parms['socket'] != '':
+        if os.path.exists(parms['socket']): os.remove(parms['socket'])
+        server = UnixServer(parms['socket'], SolveHandler)
+        address: str = f'unix:{parms["socket"]}'
+
+    else:
+        server = ThreadingHTTPServer(
+            (parms['host'], parms['port']), SolveHandler
+        )
+        address = f'http://{parms["host"]}:{server.server_address[1]}'
+
+    server.pool = pool
+    server.workers = parms['workers']
+
+    # a termination request stops the server just like an interruption
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit())
+
+    print(f'serving on {address} with {parms["workers"]} workers.')
+
+    try:
+        server.serve_forever()
+
+    except KeyboardInterrupt:
+        pass
+
+    finally:
+        server.server_close()
+        pool.shutdown(cancel_futures=True)
+
+        if parms['socket'] != '' and os.path.exists(parms['socket']):
+            os.remove(parms['socket'])
+
+
+class UnixServer(ThreadingMixIn, UnixStreamServer):
+    """This class represents a HTTP server listening on a Unix socket, in
+    which each request is handled by its own thread.
+    """
+
+    daemon_threads: bool = True
+
+
+class SolveHandler(BaseHTTPRequestHandler):
+    """This class handles the HTTP requests of the solve server. A POST to
+    /solve receives a JSON object with the instance, which is the name of a
+    file in the tests folder or the instance data itself, and the options,
+    with the same names and values of the command line options of main.py,
+    and answers with the same content of the solution file. A GET to /health
+    answers with the server status.
+    """
+
+    def do_GET(self: 'SolveHandler') -> None:
+        """This method answers the GET requests."""
+
+        if self.path == '/health':
+            self.__send(200, {'status': 'ok', 'workers': self.server.workers})
+
+        else:
+            self.__send(404, {'error': f'unknown path {self.path}.'})
+
+    def do_POST(self: 'SolveHandler') -> None:
+        """This method answers the POST requests, solving the problem in one
+        of the workers of the pool.
+        """
+
+        if self.path != '/solve':
+            self.__send(404, {'error': f'unknown path {self.path}.'})
+            return
+
+        try:
+            length: int = int(self.headers.get('Content-Length', 0))
+            request: Dict[str, Any] = ujson.loads(self.rfile.read(length))
+
+            result, hit = self.server.pool.submit(solve, request).result()
+            self.__send(200, result, {'X-Cache': 'hit' if hit else 'miss'})
+
+        except (ValueError, KeyError, TypeError, OSError) as error:
+            self.__send(400, {'error': str(error)})
+
+        except Exception as error:
+            self.__send(500, {'error': str(error)})
+
+    def address_string(self: 'SolveHandler') -> str:
+        """str: The client address, which is empty on Unix sockets."""
+        return self.client_address[0] if self.client_address else 'unix'
+
+    def __send(
+        self: 'SolveHandler',
+        status: int,
+        content: Union[Result, Dict[str, Any]],
+        headers: Dict[str, str] = {}
+    ) -> None:
+        """This method sends a JSON response. It is called within do_GET()
+        and do_POST() and there is no need to use it afterwards.
+
+        Args:
+            status (int): The HTTP status code.
+            content (Union[Result, Dict[str, Any]]): The response content.
+            headers (Dict[str, str]): Additional response headers. Defaults
+                to {}.
+        """
+
+        body: bytes = ujson.dumps(content).encode()
+
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        for key, value in headers.items(): self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def warm(size: int, preload: List[str]) -> None:
+    """This function initializes a worker of the pool, which already has the
+    solver modules imported, and reads the preloaded instances.
+
+    Args:
+        size (int): Maximum number of instances kept in the worker cache.
+        preload (List[str]): Names of the instance files to be read.
+    """
+    global cache_size
+    cache_size = size
+
+    for name in preload: load(name)
+
+
+def load(instance: Union[str, Instance]) -> Tuple[Instance, bool]:
+    """This function gets the instance data from the worker cache, reading
+    it only if the instance is not there yet. Only the data is cached, since
+    the problem and the linear model are changed by each solve, e.g. by the
+    feedback weights and the deltas.
+
+    Args:
+        instance (Union[str, Instance]): The name of an instance file in the
+            tests folder or the instance data.
+
+    Returns:
+        Tuple[Instance, bool]: The instance data and whether it was already 
+            in the cache.
+    """
+    if isinstance(instance, str):
+        with open('./tests/' + os.path.basename(instance), 'rb') as file:
+            content: bytes = file.read()
+
+        data: Instance = ujson.loads(content)
+
+    elif isinstance(instance, dict):
+        data = instance
+        content = ujson.dumps(instance, sort_keys=True).encode()
+
+    else:
+        raise ValueError('the instance must be a file name or its data.')
+
+    key: str = hashlib.sha256(content).hexdigest()
+
+    if key in cache:
+        cache.move_to_end(key)
+        return cache[key], True
+
+    cache[key] = data
+    while len(cache) > cache_size: cache.popitem(last=False)
+
+    return data, False
+
+
+def solve(request: Dict[str, Any]) -> Tuple[Result, bool]:
+    """This function solves a request in a worker of the pool.
+
+    Args:
+        request (Dict[str, Any]): The solve request, with the instance and the
+            options of main.py.
+
+    Returns:
+        Tuple[Result, bool]: The solution data and whether the instance was
+            already in the worker cache.
+    """
+    start: float = time.time()
+
+    parms: Parmeters = default_parms()
+    args: List[str] = ['', '', '']
+    for option, value in request.get('options', {}).items():
+        args += [f'-{option}', str(value)]
+
+    # read_args prints the usage and exits whenever an option is invalid
+    try:
+        with redirect_stdout(io.StringIO()): read_args(args, parms)
+
+    except SystemExit:
+        raise ValueError(f'invalid options {request.get("options")}.')
+
+    data, hit = load(request['instance'])
+
+    # each solve works on its own problem and linear model, which it changes
+    problem: Problem = Problem(data)
+
+    return run(problem, LinModel(problem), parms).payload(
+        time.time() - start
+    ), hit
+
+
+def read_server_args(args: List[str], parms: Parmeters) -> None:
+    """This function reads the input arguments.
+
+    Args:
+        args (List[str]): The terminal argument list.
+        parms (Parmeters): The operating guidelines.
+    """
+    index: int = 1
+    while index < len(args):
+        option: str = args[index]
+        index += 1
+
+        if index >= len(args): print_usage(parms)
+        elif option == '-host': parms['host'] = args[index]
+        elif option == '-port': parms['port'] = int(args[index])
+        elif option == '-socket': parms['socket'] = args[index]
+        elif option == '-workers': parms['workers'] = int(args[index])
+        elif option == '-cache': parms['cache'] = int(args[index])
+        elif option == '-preload': parms['preload'] = args[index]
+        else: print_usage(parms)
+        index += 1
+
+
+def print_usage(parms: Parmeters) -> None:
+    """This function prints the program usage.
+
+    Args:
+        parms (Parmeters): The operating guidelines.
+    """
+    usage: str = \
+        f'Usage: python3 src/server.py [options]\n' + \
+        f'\nOptions:\n' + \
+        f'    -host <host>       : address of the HTTP server (default: {parms["host"]}).\n' + \
+        f'    -port <port>       : port of the HTTP server (default: {parms["port"]}).\n' + \
+        f'    -socket <socket>   : path of a Unix socket, used instead of host and port.\n' + \
+        f'    -workers <workers> : number of solver processes (default: {parms["workers"]}).\n' + \
+        f'    -cache <cache>     : instances kept in the cache of each process (default: {parms["cache"]}).\n' + \
+        f'    -preload <files>   : instances read on start, separated by commas.\n' + \
+        f'\nRequests:\n' + \
+        f'    POST /solve  {{"instance": "instance_1.json", "options": {{"algorithm": "lahc", "seed": 1}}}}\n' + \
+        f'    GET  /health\n' + \
+        f'\nExamples:\n' + \
+        f'    python3 src/server.py -workers 4 -preload instance_1.json,instance_2.json\n' + \
+        f'    python3 src/server.py -socket /tmp/omp.sock\n'
+
+    print(usage)
+    sys.exit()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,3 @@
+# import the classes so that the directory works as a module
+
+from .jobs import SolveJob, SolveQueue
\ No newline at end of file
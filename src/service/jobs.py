@@ -0,0 +1,358 @@
+from algorithm.heuristic import Heuristic
+from model.solution import Solution
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Tuple, Optional
+import itertools
+import asyncio
+
+
+class SolveJob:
+    """This class represents a solve job, i.e. a heuristic execution from an
+    initial solution, submitted to a SolveQueue. The job result is the best
+    solution found by the heuristic, which is also the result of a cancelled
+    job or of a job whose time budget is exhausted.
+    """
+
+    def __init__(
+        self: 'SolveJob',
+        heuristic: Heuristic,
+        solution: Solution,
+        max_iters: int,
+        priority: int = 0,
+        time_limit: Optional[float] = None
+    ):
+        """Instantiates a new SolveJob.
+
+        Args:
+            heuristic (Heuristic): The heuristic, with its moves already added.
+            solution (Solution): The initial solution.
+            max_iters (int): The maximum number of iterations to execute.
+            priority (int): The job priority, in which lower values are
+                executed first. Defaults to 0.
+            time_limit (Optional[float]): The maximum time, in seconds, of the
+                heuristic execution or None if there is no time limit.
+                Defaults to None.
+        """
+
+        self._heuristic: Heuristic = heuristic
+        self._solution: Solution = solution
+        self._max_iters: int = max_iters
+        self._priority: int = priority
+        self._time_limit: Optional[float] = time_limit
+
+        # the status is 'pending', 'running', 'done' or 'cancelled'
+        self._status: str = 'pending'
+        self._future: Optional[asyncio.Future] = None
+
+    def cancel(self: 'SolveJob') -> None:
+        """This method cancels the job. A pending job is answered with its
+        initial solution right away and a running job stops at the end of the
+        current iteration of the heuristic.
+        """
+
+        if self._status == 'pending':
+            self.__finish('cancelled', self._solution)
+
+        elif self._status == 'running':
+            self._status = 'cancelled'
+            self._heuristic.cancel()
+
+    async def result(self: 'SolveJob') -> Solution:
+        """This method waits for the job to finish.
+
+        Returns:
+            Solution: The best solution found by the heuristic.
+        """
+
+        assert self._future is not None, \
+            'calling result() before mandatory call to SolveQueue.submit().'
+
+        return await asyncio.shield(self._future)
+
+    def execute(self: 'SolveJob') -> Solution:
+        """This method runs the heuristic. It is called by the SolveQueue in
+        its executor and there is no need to use it afterwards.
+
+        Returns:
+            Solution: The best solution found by the heuristic.
+        """
+
+        self._heuristic.run(
+            self._solution, self._max_iters, time_limit=self._time_limit
+        )
+
+        return self._heuristic.best_solution
+
+    def start(self: 'SolveJob') -> bool:
+        """This method marks the job as running. It is called by the
+        SolveQueue and there is no need to use it afterwards.
+
+        Returns:
+            bool: True if the job must be executed, False if it was cancelled
+                while pending.
+        """
+
+        if self._status != 'pending': return False
+
+        # a heuristic may be reused, so a previous cancellation is discarded
+        self._heuristic.cancel_event.clear()
+
+        self._status = 'running'
+        return True
+
+    def finish(self: 'SolveJob', solution: Solution) -> None:
+        """This method answers the job with its result. It is called by the
+        SolveQueue and there is no need to use it afterwards.
+
+        Args:
+            solution (Solution): The best solution found by the heuristic.
+        """
+
+        self.__finish(
+            'cancelled' if self._status == 'cancelled' else 'done', solution
+        )
+
+    def __finish(self: 'SolveJob', status: str, solution: Solution) -> None:
+        """This method updates the job status and answers its result, if it
+        was not answered yet. It is called within cancel() and finish() and
+        there is no need to use it afterwards.
+
+        Args:
+            status (str): The final job status.
+            solution (Solution): The job result.
+        """
+
+        self._status = status
+
+        if self._future is not None and not self._future.done():
+            self._future.set_result(solution)
+
+    # region simple getters and setters
+    @property
+    def heuristic(self: 'SolveJob') -> Heuristic:
+        """Heuristic: The heuristic executed by the job."""
+        return self._heuristic
+
+    @heuristic.setter
+    def heuristic(self: 'SolveJob', value: Heuristic) -> None:
+        self._heuristic = value
+
+    @property
+    def solution(self: 'SolveJob') -> Solution:
+        """Solution: The initial solution."""
+        return self._solution
+
+    @solution.setter
+    def solution(self: 'SolveJob', value: Solution) -> None:
+        self._solution = value
+
+    @property
+    def max_iters(self: 'SolveJob') -> int:
+        """int: The maximum number of iterations to execute."""
+        return self._max_iters
+
+    @max_iters.setter
+    def max_iters(self: 'SolveJob', value: int) -> None:
+        self._max_iters = value
+
+    @property
+    def priority(self: 'SolveJob') -> int:
+        """int: The job priority, in which lower values are executed first."""
+        return self._priority
+
+    @priority.setter
+    def priority(self: 'SolveJob', value: int) -> None:
+        self._priority = value
+
+    @property
+    def time_limit(self: 'SolveJob') -> Optional[float]:
+        """Optional[float]: The maximum time, in seconds, of the heuristic
+        execution."""
+        return self._time_limit
+
+    @time_limit.setter
+    def time_limit(self: 'SolveJob', value: Optional[float]) -> None:
+        self._time_limit = value
+
+    @property
+    def status(self: 'SolveJob') -> str:
+        """str: The job status, 'pending', 'running', 'done' or 'cancelled'."""
+        return self._status
+
+    @status.setter
+    def status(self: 'SolveJob', value: str) -> None:
+        self._status = value
+
+    @property
+    def future(self: 'SolveJob') -> Optional[asyncio.Future]:
+        """Optional[asyncio.Future]: The future answered with the result."""
+        return self._future
+
+    @future.setter
+    def future(self: 'SolveJob', value: Optional[asyncio.Future]) -> None:
+        self._future = value
+
+
+class SolveQueue:
+    """This class represents a bounded priority queue of solve jobs, executed
+    by a pool of worker threads. It must be used within an asyncio event loop,
+    e.g.:
+
+        queue = SolveQueue(size=64, workers=2)
+        job = await queue.submit(SA(problem, 0.9, 1.0), solution, 1000)
+        best = await job.result()
+        await queue.close()
+
+    Submitting to a full queue waits until there is room, so that producers
+    are slowed down instead of piling up jobs. Lower priorities are executed
+    first and jobs with the same priority are executed in submission order.
+    """
+
+    def __init__(self: 'SolveQueue', size: int = 64, workers: int = 1):
+        """Instantiates a new SolveQueue.
+
+        Args:
+            size (int): The maximum number of pending jobs. Defaults to 64.
+            workers (int): The number of jobs executed at the same time.
+                Defaults to 1.
+        """
+
+        self._size: int = size
+        self._workers: int = workers
+
+        # the queue and the consumers are created within the event loop
+        self._queue: Optional[asyncio.PriorityQueue] = None
+        self._consumers: List[asyncio.Task] = []
+        self._executor: ThreadPoolExecutor = ThreadPoolExecutor(workers)
+
+        # submission counter, which breaks ties between equal priorities
+        self._counter: itertools.count = itertools.count()
+
+        # jobs submitted and not finished yet
+        self._jobs: List[SolveJob] = []
+
+    async def submit(
+        self: 'SolveQueue',
+        heuristic: Heuristic,
+        solution: Solution,
+        max_iters: int,
+        priority: int = 0,
+        time_limit: Optional[float] = None
+    ) -> SolveJob:
+        """This method submits a new job, waiting while the queue is full.
+
+        Args:
+            heuristic (Heuristic): The heuristic, with its moves already added.
+            solution (Solution): The initial solution.
+            max_iters (int): The maximum number of iterations to execute.
+            priority (int): The job priority, in which lower values are
+                executed first. Defaults to 0.
+            time_limit (Optional[float]): The maximum time, in seconds, of the
+                heuristic execution or None if there is no time limit.
+                Defaults to None.
+
+        Returns:
+            SolveJob: The submitted job.
+        """
+
+        if self._queue is None: self.__start()
+
+        job: SolveJob = SolveJob(
+            heuristic, solution, max_iters, priority, time_limit
+        )
+        job.future = asyncio.get_running_loop().create_future()
+
+        await self._queue.put((priority, next(self._counter), job))
+        self._jobs.append(job)
+
+        return job
+
+    async def join(self: 'SolveQueue') -> None:
+        """This method waits until every submitted job is finished."""
+
+        if self._queue is not None: await self._queue.join()
+
+    async def close(self: 'SolveQueue', cancel: bool = False) -> None:
+        """This method stops the queue, after all of its jobs are finished.
+
+        Args:
+            cancel (bool): True if the pending and running jobs must be
+                cancelled, False if they must be finished. Defaults to False.
+        """
+
+        if self._queue is not None:
+            if cancel:
+                for job in list(self._jobs): job.cancel()
+
+            await self._queue.join()
+
+            for consumer in self._consumers: consumer.cancel()
+            await asyncio.gather(*self._consumers, return_exceptions=True)
+
+        self._executor.shutdown()
+
+    def __start(self: 'SolveQueue') -> None:
+        """This method creates the queue and its consumers in the running
+        event loop. It is called within submit() and there is no need to use
+        it afterwards.
+        """
+
+        self._queue = asyncio.PriorityQueue(self._size)
+        self._consumers = [
+            asyncio.create_task(self.__consume())
+            for _ in range(self._workers)
+        ]
+
+    async def __consume(self: 'SolveQueue') -> None:
+        """This method executes the jobs of the queue, one at a time, in the
+        executor. It is called within __start() and there is no need to use it
+        afterwards.
+        """
+
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+
+        while True:
+            item: Tuple[int, int, SolveJob] = await self._queue.get()
+            job: SolveJob = item[2]
+
+            try:
+                if job.start():
+                    solution: Solution = await loop.run_in_executor(
+                        self._executor, job.execute
+                    )
+                    job.finish(solution)
+
+            except Exception as error:
+                if not job.future.done(): job.future.set_exception(error)
+
+            finally:
+                self._jobs.remove(job)
+                self._queue.task_done()
+
+    # region simple getters and setters
+    @property
+    def size(self: 'SolveQueue') -> int:
+        """int: The maximum number of pending jobs."""
+        return self._size
+
+    @size.setter
+    def size(self: 'SolveQueue', value: int) -> None:
+        self._size = value
+
+    @property
+    def workers(self: 'SolveQueue') -> int:
+        """int: The number of jobs executed at the same time."""
+        return self._workers
+
+    @workers.setter
+    def workers(self: 'SolveQueue', value: int) -> None:
+        self._workers = value
+
+    @property
+    def jobs(self: 'SolveQueue') -> List[SolveJob]:
+        """List[SolveJob]: The jobs submitted and not finished yet."""
+        return self._jobs
+
+    @jobs.setter
+    def jobs(self: 'SolveQueue', value: List[SolveJob]) -> None:
+        self._jobs = value